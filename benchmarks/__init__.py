@@ -0,0 +1 @@
+"""Performance benchmarks for celnav hot paths (run as ``python -m benchmarks.<name>``)."""
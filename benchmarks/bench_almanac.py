@@ -0,0 +1,60 @@
+"""
+Scalar vs vectorized Sun/Aries almanac over one year of per-minute instants (525,600 points).
+
+    python -m benchmarks.bench_almanac [--year 2025]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from celnav.almanac import gha_sun_and_dec_deg, gha_aries_deg, _julian_day, _julian_centuries
+from celnav.batch import sun_aries_batch
+
+
+def _scalar_loop(start: datetime, n: int):
+    gha_sun = np.empty(n)
+    dec_sun = np.empty(n)
+    gha_aries = np.empty(n)
+    for i in range(n):
+        t = start + timedelta(minutes=i)
+        gha_sun[i], dec_sun[i] = gha_sun_and_dec_deg(t.year, t.month, t.day, t.hour, t.minute, t.second)
+        JD = _julian_day(t.year, t.month, t.day, t.hour, t.minute, t.second)
+        gha_aries[i] = gha_aries_deg(JD, _julian_centuries(JD))
+    return gha_sun, dec_sun, gha_aries
+
+
+def _wrap_diff(a, b):
+    return np.abs(((a - b + 180.0) % 360.0) - 180.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, default=2025)
+    args = parser.parse_args()
+
+    start = datetime(args.year, 1, 1, tzinfo=timezone.utc)
+    n = 365 * 24 * 60
+    instants = np.datetime64(f"{args.year}-01-01T00:00") + np.arange(n).astype("timedelta64[m]")
+
+    t0 = time.perf_counter()
+    gha_sun, dec_sun, gha_aries = _scalar_loop(start, n)
+    scalar_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = sun_aries_batch(instants)
+    batch_s = time.perf_counter() - t0
+
+    print(f"points:          {n}")
+    print(f"scalar loop:     {scalar_s:.3f} s  ({n / scalar_s:,.0f} points/s)")
+    print(f"vectorized:      {batch_s:.3f} s  ({n / batch_s:,.0f} points/s)")
+    print(f"speed-up:        {scalar_s / batch_s:.1f}x")
+    print(f"max |ΔGHA sun|:  {_wrap_diff(batch.gha_sun_deg, gha_sun).max():.2e}°")
+    print(f"max |ΔDec sun|:  {np.abs(batch.dec_sun_deg - dec_sun).max():.2e}°")
+    print(f"max |ΔGHA ari|:  {_wrap_diff(batch.gha_aries_deg, gha_aries).max():.2e}°")
+
+
+if __name__ == "__main__":
+    main()
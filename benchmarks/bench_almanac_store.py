@@ -0,0 +1,55 @@
+"""
+Load time and peak RSS: hourly almanac JSON (json.load) vs binary file (memory-mapped).
+Each variant runs in a fresh interpreter so that RSS figures are not mixed.
+
+    python -m benchmarks.bench_almanac_store [--json PATH] [--bin PATH]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "src" / "data" / "almanac"
+
+_CHILD = r"""
+import resource, sys, time
+kind, path = sys.argv[1], sys.argv[2]
+import json
+from celnav.almanac_store import BinaryAlmanac  # imported up front so only the table cost is measured
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+if kind == "json":
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)["records"]
+    row = records[4000]
+else:
+    alm = BinaryAlmanac(path)
+    row = alm.record(4000)
+dt = time.perf_counter() - t0
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(f"{dt * 1000:.2f} {(peak - base) / 1024:.2f}")
+"""
+
+
+def _run(kind: str, path: Path):
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, kind, str(path)], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", type=Path, default=DATA / "sun_aries_2025_hourly.json")
+    parser.add_argument("--bin", type=Path, default=DATA / "sun_aries_2025_hourly.bin")
+    args = parser.parse_args()
+
+    for kind, path in (("json", args.json), ("bin", args.bin)):
+        ms, rss_mb = _run(kind, path)
+        print(f"{kind:5} {path.stat().st_size / 1024:8.1f} KB  load+lookup {ms:7.2f} ms  extra RSS {rss_mb:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Streaming fixes (``celnav fix --stream``) over a synthetic NDJSON archive: fixes per second
+and peak traced memory, which stays flat as the archive grows.
+
+Half the records are star sights by name with a UTC time (star lookup + Aries GHA from the
+almanac series), half are Sun sights with explicit GHA/Dec.
+
+    python -m benchmarks.bench_fix_stream [--fixes 20000] [--sights 5]
+"""
+
+import argparse
+import itertools
+import json
+import random
+import time
+import tracemalloc
+from typing import Iterator
+
+from celnav.almanac import compute_aries_gha_from_iso, compute_sun_gha_dec_from_iso, gha_star_from_aries_sha
+from celnav.cli import _sight_from_record
+from celnav.core import compute_hc_zn, lha_from_gha_longitude
+from celnav.fix_stream import solve_stream
+from celnav.stars import list_stars
+
+
+def archive(num_fixes: int, sights_per_fix: int, seed: int = 1) -> Iterator[str]:
+    """NDJSON lines, generated lazily so the input itself takes no memory."""
+    rng = random.Random(seed)
+    stars = list_stars()
+    for k in range(num_fixes):
+        lat, lon = rng.uniform(-60.0, 60.0), rng.uniform(-179.0, 179.0)
+        utc = f"2025-{1 + k % 12:02d}-{1 + k % 28:02d}T{k % 24:02d}:{k % 60:02d}:00Z"
+        for i in range(sights_per_fix):
+            rec = {"fix_id": k, "lat": round(lat + 0.3, 4), "lon": round(lon - 0.3, 4)}
+            if i % 2:
+                star = stars[rng.randrange(len(stars))]
+                gha = gha_star_from_aries_sha(compute_aries_gha_from_iso(utc).gha_deg, star.sha_deg)
+                hc, _ = compute_hc_zn(lat, star.dec_deg, lha_from_gha_longitude(gha, lon))
+                rec.update(body="star", star=star.name, utc=utc, Ho=hc)
+            else:
+                gha, dec = rng.uniform(0.0, 360.0), rng.uniform(-23.0, 23.0)
+                hc, _ = compute_hc_zn(lat, dec, lha_from_gha_longitude(gha, lon))
+                rec.update(body="sun", GHA=gha, dec=dec, Ho=hc)
+            yield json.dumps(rec)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixes", type=int, default=20000)
+    parser.add_argument("--sights", type=int, default=5)
+    args = parser.parse_args()
+
+    to_sight = lambda rec: _sight_from_record(rec, compute_sun_gha_dec_from_iso, compute_aries_gha_from_iso)
+    lines = list(archive(args.fixes, args.sights))
+
+    for n in (args.fixes // 10, args.fixes):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        done = sum(1 for _ in solve_stream(itertools.islice(lines, n * args.sights), to_sight))
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{done:>7} fixes × {args.sights} sights: {done / elapsed:8.0f} fixes/s, peak {peak / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
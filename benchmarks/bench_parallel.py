@@ -0,0 +1,88 @@
+"""
+Scaling curve of the ``--workers`` process pool: wall time and speed-up over one process for
+streamed fixes (NDJSON text chunks), batch fixes (array chunks) and SRT rows (index ranges).
+
+    python -m benchmarks.bench_parallel [--max-workers 8] [--fixes 20000]
+"""
+
+import argparse
+import os
+import time
+from argparse import Namespace
+from functools import partial
+
+import numpy as np
+
+from benchmarks.bench_fix_stream import archive
+from celnav.batch import compute_hc_zn_batch
+from celnav.cli import _record_converter, _srt_chunks
+from celnav.fix_stream import solve_stream, solve_stream_parallel
+from celnav.parallel import solve_fix_batch_parallel
+
+
+def _worker_counts(max_workers: int):
+    n, counts = 1, []
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    return counts + [max_workers]
+
+
+def _stream(lines, workers: int) -> int:
+    make_to_sight = partial(_record_converter, "series", None)
+    if workers <= 1:
+        results = solve_stream(lines, make_to_sight())
+    else:
+        results = solve_stream_parallel(lines, make_to_sight, workers)
+    return sum(1 for _ in results)
+
+
+def _batch(columns, workers: int) -> int:
+    return solve_fix_batch_parallel(*columns, workers=workers, chunk_fixes=4096, robust="huber").lat_deg.size
+
+
+def _srt(workers: int) -> int:
+    args = Namespace(lat=37.0, dec=23.4333, lon=0.0, mode="lha", lha_start=0.0, lha_stop=360.0,
+                     lha_step=0.0001, table=None, workers=workers)
+    return sum(lha.size for lha, _, _ in _srt_chunks(args))
+
+
+def _batch_columns(num_fixes: int, sights_per_fix: int, seed: int = 2):
+    rng = np.random.default_rng(seed)
+    fix = np.repeat(np.arange(num_fixes), sights_per_fix)
+    lat = rng.uniform(-60.0, 60.0, num_fixes)[fix]
+    lon = rng.uniform(-179.0, 179.0, num_fixes)[fix]
+    gha = rng.uniform(0.0, 360.0, fix.size)
+    dec = rng.uniform(-60.0, 60.0, fix.size)
+    ho, _ = compute_hc_zn_batch(lat, dec, (gha + lon) % 360.0)
+    return lat + 0.3, lon - 0.3, gha, dec, ho, fix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--fixes", type=int, default=20000)
+    args = parser.parse_args()
+
+    lines = list(archive(args.fixes, 5))
+    columns = _batch_columns(args.fixes * 10, 6)
+    jobs = [
+        (f"stream fix ({args.fixes} fixes)", lambda w: _stream(lines, w)),
+        (f"batch fix ({columns[5].max() + 1} fixes)", lambda w: _batch(columns, w)),
+        ("srt (3.6M rows)", _srt),
+    ]
+    print(f"cpu_count: {os.cpu_count()}")
+    for name, job in jobs:
+        print(name)
+        base = None
+        for workers in _worker_counts(args.max_workers):
+            t0 = time.perf_counter()
+            job(workers)
+            elapsed = time.perf_counter() - t0
+            base = base or elapsed
+            print(f"  workers {workers:>2}: {elapsed:7.2f} s  speed-up {base / elapsed:4.2f}x  "
+                  f"efficiency {base / elapsed / workers:4.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Per-request latency of ``celnav serve`` against one ``python -m celnav`` process per call.
+
+Starts the server on a Unix socket, opens --clients connections that each pipeline --requests
+Sun sights, and reports client-side p50/p90/p99 and total requests/s; then times --cli-runs
+fresh CLI invocations of the same sight.
+
+    python -m benchmarks.bench_serve [--clients 4] [--requests 2000] [--cli-runs 11]
+"""
+
+import argparse
+import json
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+SIGHT = {"lat": 36, "lon": 25, "gha": 150.3333, "dec": 10.25, "hs": 45.2, "height": 2.5}
+
+
+def _percentile(sorted_ms, q: float) -> float:
+    return sorted_ms[max(0, math.ceil(q / 100.0 * len(sorted_ms)) - 1)]
+
+
+def _wait_for(path: str, timeout_s: float = 10.0) -> None:
+    t0 = time.perf_counter()
+    while not os.path.exists(path):
+        if time.perf_counter() - t0 > timeout_s:
+            raise RuntimeError(f"server did not create {path}")
+        time.sleep(0.01)
+
+
+def _client(path: str, n: int, out: list) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        f = s.makefile("rwb")
+        for i in range(n):
+            t0 = time.perf_counter()
+            f.write(json.dumps({"id": i, "op": "sun", "args": dict(SIGHT, hs=20 + i % 50)}).encode() + b"\n")
+            f.flush()
+            reply = json.loads(f.readline())
+            out.append((time.perf_counter() - t0) * 1e3)
+            if not reply["ok"]:
+                raise RuntimeError(reply["error"])
+
+
+def _cli_ms(runs: int) -> float:
+    argv = [sys.executable, "-m", "celnav", "sun"] + [f"--{k}={v}" for k, v in SIGHT.items()]
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per client")
+    parser.add_argument("--cli-runs", type=int, default=11)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "celnav.sock")
+        proc = subprocess.Popen([sys.executable, "-m", "celnav", "serve", "--socket", path],
+                                stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(path)
+            per_client = [[] for _ in range(args.clients)]
+            threads = [threading.Thread(target=_client, args=(path, args.requests, out)) for out in per_client]
+            t0 = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - t0
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    ms = sorted(x for out in per_client for x in out)
+    print(f"serve ({args.clients} clients x {args.requests} requests): {len(ms) / elapsed:,.0f} req/s, "
+          f"p50 {_percentile(ms, 50):.3f} ms  p90 {_percentile(ms, 90):.3f} ms  p99 {_percentile(ms, 99):.3f} ms")
+    cli = _cli_ms(args.cli_runs)
+    print(f"one CLI process per sight: {cli:.1f} ms median ({cli / _percentile(ms, 50):,.0f}x the serve p50)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Star finder over a 40-minute twilight window at 1-minute steps (41 × 58 sights): scalar
+per-star loop vs the broadcast (time, star) grid of :func:`celnav.star_finder.find_stars`.
+
+    python -m benchmarks.bench_star_finder [--repeat 200]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from celnav.almanac import compute_aries_gha, gha_star_from_aries_sha
+from celnav.core import compute_hc_zn, lha_from_gha_longitude
+from celnav.star_finder import find_stars
+from celnav.stars import list_stars
+
+LAT, LON = 36.0, 25.0
+START, END = "2025-06-21T18:10Z", "2025-06-21T18:50Z"
+
+
+def _scalar_window():
+    t0 = np.datetime64("2025-06-21T18:10")
+    found = []
+    for k in range(41):
+        gha_aries = compute_aries_gha(t0 + np.timedelta64(k, "m")).gha_deg
+        step = []
+        for star in list_stars():
+            lha = lha_from_gha_longitude(gha_star_from_aries_sha(gha_aries, star.sha_deg), LON)
+            hc, zn = compute_hc_zn(LAT, star.dec_deg, lha)
+            if 15.0 <= hc <= 70.0:
+                step.append((zn, star.name, hc))
+        found.append(sorted(step))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        _scalar_window()
+    scalar_ms = (time.perf_counter() - t0) / args.repeat * 1e3
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        res = find_stars(LAT, LON, START, END)
+        [res.candidates(k) for k in range(len(res.epoch_s))]
+    grid_ms = (time.perf_counter() - t0) / args.repeat * 1e3
+
+    print(f"window:          41 steps × {res.hc_deg.shape[1]} stars")
+    print(f"scalar loop:     {scalar_ms:.2f} ms")
+    print(f"array grid:      {grid_ms:.2f} ms  (incl. per-step candidate lists)")
+    print(f"speed-up:        {scalar_ms / grid_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
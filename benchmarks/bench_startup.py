@@ -0,0 +1,46 @@
+"""
+Cold start of ``python -m celnav <command>`` (fresh interpreter per run, median wall time),
+next to a bare ``python -c pass``; the difference is what celnav's imports and parser cost.
+
+    python -m benchmarks.bench_startup [--runs 21]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "celnav --help": ["-m", "celnav", "--help"],
+    "celnav eot": ["-m", "celnav", "eot", "--doy", "100"],
+    "celnav sun": ["-m", "celnav", "sun", "--lat", "36", "--lon", "25", "--gha", "150", "--dec", "10", "--hs", "45"],
+    "celnav almanac-sun": ["-m", "celnav", "almanac-sun", "--utc", "2025-06-21T12:00Z"],
+    "celnav srt": ["-m", "celnav", "srt", "--lat", "37", "--dec", "23", "--lha-start", "0", "--lha-stop", "10"],
+}
+
+
+def _median_ms(args, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=21)
+    args = parser.parse_args()
+
+    base = None
+    for name, argv in COMMANDS.items():
+        ms = _median_ms(argv, args.runs)
+        base = ms if base is None else base
+        print(f"{name:<22} {ms:7.1f} ms  (+{ms - base:5.1f} ms over bare interpreter)")
+
+
+if __name__ == "__main__":
+    main()
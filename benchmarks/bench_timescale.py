@@ -0,0 +1,72 @@
+"""
+ISO timestamp handling for 100,000 sights spread over a month: the former per-call parse
+and calendar arithmetic vs :mod:`celnav.timescale` (scalar with cached days, and bulk).
+
+    python -m benchmarks.bench_timescale [--n 100000]
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from celnav.almanac import compute_sun_gha_dec, _sun_gha_dec_at_jd
+from celnav.batch import sun_aries_batch
+from celnav.timescale import julian_day_from_iso, julian_day_array
+
+
+def _legacy_julian_day_from_iso(iso_utc: str) -> float:
+    """Parse + Gregorian terms as compute_sun_gha_dec_from_iso did before the shared layer."""
+    s = iso_utc.strip().upper().replace("Z", "")
+    date_part, time_part = s.split("T")
+    y, m, d = [int(x) for x in date_part.split("-")]
+    tparts = time_part.split(":")
+    if len(tparts) == 2:
+        hh, mm, ss = int(tparts[0]), int(tparts[1]), 0.0
+    else:
+        hh, mm, ss = int(tparts[0]), int(tparts[1]), float(tparts[2])
+    d = d + (hh + (mm + ss / 60.0) / 60.0) / 24.0
+    if m <= 2:
+        y -= 1
+        m += 12
+    A = math.floor(y / 100)
+    B = 2 - A + math.floor(A / 4)
+    return math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * (m + 1)) + d + B - 1524.5
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    instants = np.datetime64("2025-06-01T00:00:00") + rng.integers(0, 30 * 86400, args.n).astype("timedelta64[s]")
+    isos = [f"{t}Z" for t in instants]
+
+    jd_old, old_s = _timed(lambda: [_legacy_julian_day_from_iso(s) for s in isos])
+    jd_new, new_s = _timed(lambda: [julian_day_from_iso(s) for s in isos])
+    jd_bulk, bulk_s = _timed(lambda: julian_day_array(isos))
+    _, sun_old_s = _timed(lambda: [_sun_gha_dec_at_jd(_legacy_julian_day_from_iso(s)) for s in isos])
+    _, sun_new_s = _timed(lambda: [compute_sun_gha_dec(s) for s in isos])
+    _, sun_bulk_s = _timed(lambda: sun_aries_batch(isos))
+
+    print(f"timestamps:               {args.n}")
+    print(f"ISO -> JD  legacy parse:  {old_s:.3f} s")
+    print(f"ISO -> JD  cached days:   {new_s:.3f} s  ({old_s / new_s:.1f}x)")
+    print(f"ISO -> JD  bulk column:   {bulk_s:.3f} s  ({old_s / bulk_s:.1f}x)")
+    print(f"Sun almanac legacy:       {sun_old_s:.3f} s")
+    print(f"Sun almanac scalar:       {sun_new_s:.3f} s  ({sun_old_s / sun_new_s:.1f}x)")
+    print(f"Sun+Aries almanac bulk:   {sun_bulk_s:.3f} s  ({sun_old_s / sun_bulk_s:.1f}x)")
+    print(f"max |ΔJD| (s):            {np.abs(np.asarray(jd_new) - jd_old).max() * 86400:.2e} / "
+          f"{np.abs(jd_bulk - jd_old).max() * 86400:.2e}")
+
+
+if __name__ == "__main__":
+    main()
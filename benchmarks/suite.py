@@ -0,0 +1,354 @@
+"""
+Reproducible benchmark suite for the celnav hot paths.
+
+Every case builds a seeded synthetic workload (random sights over all latitudes, multi-star
+fixes, year-long almanac sweeps, full sight reduction tables) and is measured three ways:
+throughput (ops/s of the fastest of --repeat timed passes, each repeating the workload for
+at least MIN_PASS_SECONDS; noise only ever adds time), per-call latency percentiles (each call
+timed on its own) and peak traced memory (one pass under tracemalloc). Workload building is
+not timed. ``run`` writes the results as JSON; ``compare`` checks a new run against a
+baseline and exits with status 1 when a case lost more than --threshold of its throughput or
+grew its peak memory by more than that fraction.
+
+    python -m benchmarks.suite run [--out results.json] [--seed 0] [--scale 1] [--repeat 5] [--case NAME ...]
+    python -m benchmarks.suite compare BASE.json NEW.json [--threshold 0.10]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from celnav.almanac import compute_aries_gha, compute_sun_gha_dec, gha_star_from_aries_sha
+from celnav.batch import compute_hc_zn_batch, solve_fix_batch, sun_aries_batch
+from celnav.cli import cmd_srt
+from celnav.core import Sight, apply_altitude_corrections, compute_hc_zn, lha_from_gha_longitude, solve_fix_least_squares
+from celnav.stars import list_stars
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+MIN_PASS_SECONDS = 0.2
+MIN_MEMORY_DELTA_KIB = 64.0  # smaller peak-memory growth is never reported as a regression
+
+# (function, arguments of each call, units of work per call)
+Workload = Tuple[Callable[..., Any], List[tuple], int]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    unit: str
+    build: Callable[[random.Random, float], Workload]
+    doc: str
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+# -------------------- Workloads --------------------
+
+def _random_sights(rng: random.Random, scale: float) -> Workload:
+    sights = [(rng.uniform(-89.9, 89.9), rng.uniform(-70.0, 70.0), rng.uniform(0.0, 360.0))
+              for _ in range(_count(20000, scale))]
+    return compute_hc_zn, sights, 1
+
+
+def _altitude_corrections(rng: random.Random, scale: float) -> Workload:
+    calls = []
+    for _ in range(_count(20000, scale)):
+        calls.append((
+            rng.uniform(1.0, 89.0), rng.uniform(-3.0, 3.0), rng.uniform(0.0, 30.0),
+            rng.uniform(980.0, 1040.0), rng.uniform(-10.0, 35.0), 16.0, rng.random() < 0.5,
+            rng.uniform(0.0, 0.2),
+        ))
+    return apply_altitude_corrections, calls, 1
+
+
+def _star_fix(rng: random.Random, num_stars: int = 5, blunder_minutes: float = 0.0) -> List[Sight]:
+    """Sights of num_stars stars between 10° and 80° altitude at a random place and hour of 2025."""
+    stars = list_stars()
+    while True:
+        lat, lon = rng.uniform(-70.0, 70.0), rng.uniform(-180.0, 180.0)
+        utc = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        gha_aries = compute_aries_gha(utc).gha_deg
+        sights = []
+        for star in rng.sample(stars, len(stars)):
+            gha = gha_star_from_aries_sha(gha_aries, star.sha_deg)
+            hc, _ = compute_hc_zn(lat, star.dec_deg, lha_from_gha_longitude(gha, lon))
+            if 10.0 <= hc <= 80.0:
+                ho = hc + rng.gauss(0.0, 0.3) / 60.0
+                sights.append(Sight(lat + rng.uniform(-0.3, 0.3), lon + rng.uniform(-0.3, 0.3), gha, star.dec_deg, ho))
+            if len(sights) == num_stars:
+                sights[0].Ho_deg += blunder_minutes / 60.0
+                return sights
+
+
+def _multi_star_fixes(rng: random.Random, scale: float) -> Workload:
+    return solve_fix_least_squares, [(_star_fix(rng),) for _ in range(_count(500, scale))], 1
+
+
+def _multi_star_fixes_huber(rng: random.Random, scale: float) -> Workload:
+    def solve(sights):
+        return solve_fix_least_squares(sights, robust="huber")
+
+    return solve, [(_star_fix(rng, 6, blunder_minutes=5.0),) for _ in range(_count(500, scale))], 1
+
+
+def _batch_fixes(rng: random.Random, scale: float) -> Workload:
+    num_fixes, per_fix = _count(10000, scale), 6
+    np_rng = np.random.default_rng(rng.getrandbits(32))
+    fix = np.repeat(np.arange(num_fixes), per_fix)
+    lat = np_rng.uniform(-60.0, 60.0, num_fixes)[fix]
+    lon = np_rng.uniform(-179.0, 179.0, num_fixes)[fix]
+    gha = np_rng.uniform(0.0, 360.0, fix.size)
+    dec = np_rng.uniform(-60.0, 60.0, fix.size)
+    ho, _ = compute_hc_zn_batch(lat, dec, (gha + lon) % 360.0)
+    return solve_fix_batch, [(lat + 0.3, lon - 0.3, gha, dec, ho, fix)], num_fixes
+
+
+def _year_hours(rng: random.Random, scale: float) -> List[tuple]:
+    """ISO timestamps every hour of a random year (scale < 1 keeps the first part of it)."""
+    start = datetime(rng.randrange(2000, 2050), 1, 1, tzinfo=timezone.utc)
+    return [((start + timedelta(hours=h)).strftime("%Y-%m-%dT%H:%M:%SZ"),) for h in range(_count(365 * 24, scale))]
+
+
+def _almanac_sun_year(rng: random.Random, scale: float) -> Workload:
+    return compute_sun_gha_dec, _year_hours(rng, scale), 1
+
+
+def _almanac_aries_year(rng: random.Random, scale: float) -> Workload:
+    return compute_aries_gha, _year_hours(rng, scale), 1
+
+
+def _almanac_batch_year(rng: random.Random, scale: float) -> Workload:
+    n = _count(365 * 24 * 60, scale)
+    instants = np.datetime64(f"{rng.randrange(2000, 2050)}-01-01T00:00") + np.arange(n).astype("timedelta64[m]")
+    return sun_aries_batch, [(instants,)], n
+
+
+def _srt_tables(rng: random.Random, scale: float) -> Workload:
+    """Full 0–360° LHA tables at 0.01° steps (CSV, as ``celnav srt --out``) for random φ/δ."""
+    rows = 36001
+    calls = []
+    for _ in range(_count(5, scale)):
+        calls.append((argparse.Namespace(
+            mode="lha", lat=rng.uniform(-70.0, 70.0), dec=rng.uniform(-30.0, 30.0), lon=0.0,
+            lha_start=0.0, lha_stop=360.0, lha_step=0.01, table=None, out=os.devnull, format="csv", workers=1,
+        ),))
+    return cmd_srt, calls, rows
+
+
+CASES: Dict[str, Case] = {c.name: c for c in (
+    Case("hc_zn", "sight", _random_sights, "compute_hc_zn, random φ/δ/LHA over all latitudes"),
+    Case("altitude_corrections", "sight", _altitude_corrections, "apply_altitude_corrections, random Hs/IE/HoE/P/T"),
+    Case("fix_multi_star", "fix", _multi_star_fixes, "solve_fix_least_squares, 5 stars at random places/times"),
+    Case("fix_multi_star_huber", "fix", _multi_star_fixes_huber, "robust (Huber) fix, 6 stars with one 5′ blunder"),
+    Case("fix_batch", "fix", _batch_fixes, "solve_fix_batch, 10,000 fixes of 6 sights in one call"),
+    Case("almanac_sun_year", "instant", _almanac_sun_year, "compute_sun_gha_dec, hourly ISO times over a year"),
+    Case("almanac_aries_year", "instant", _almanac_aries_year, "compute_aries_gha, hourly ISO times over a year"),
+    Case("almanac_batch_year", "instant", _almanac_batch_year, "sun_aries_batch, every minute of a year in one call"),
+    Case("srt_full", "row", _srt_tables, "cmd_srt, full LHA tables at 0.01° to CSV"),
+)}
+
+
+# -------------------- Measurement --------------------
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty sorted sequence."""
+    return sorted_values[max(0, math.ceil(q / 100.0 * len(sorted_values)) - 1)]
+
+
+def measure(case: Case, seed: int = 0, scale: float = 1.0, repeat: int = 5) -> Dict[str, Any]:
+    """Throughput, latency percentiles and peak traced memory of one case."""
+    fn, calls, units_per_call = case.build(random.Random(f"{seed}:{case.name}"), scale)
+    for args in calls[: max(1, len(calls) // 100)]:
+        fn(*args)  # warm-up: imports, lazily built tables, caches
+
+    def timed_pass(rounds: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            for args in calls:
+                fn(*args)
+        return (time.perf_counter() - t0) / rounds
+
+    rounds = max(1, math.ceil(MIN_PASS_SECONDS / max(timed_pass(1), 1e-9)))
+    passes = [timed_pass(rounds) for _ in range(repeat)]
+
+    latencies = []
+    for args in calls:
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    latencies.sort()
+
+    tracemalloc.start()
+    try:
+        for args in calls:
+            fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    units = len(calls) * units_per_call
+    return {
+        "unit": case.unit,
+        "calls": len(calls),
+        "units": units,
+        "rounds": rounds,
+        "seconds": min(passes),
+        "ops_per_s": units / min(passes),
+        "ops_per_s_median": units / statistics.median(passes),
+        "latency_us": {
+            "mean": statistics.fmean(latencies),
+            "p50": _percentile(latencies, 50.0),
+            "p90": _percentile(latencies, 90.0),
+            "p99": _percentile(latencies, 99.0),
+            "max": latencies[-1],
+        },
+        "peak_kib": peak / 1024.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(
+    names: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    scale: float = 1.0,
+    repeat: int = 5,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Measure the named cases (all by default) and return the JSON-ready report."""
+    unknown = [n for n in names or () if n not in CASES]
+    if unknown:
+        raise ValueError(f"unknown case(s): {', '.join(unknown)}; expected {', '.join(CASES)}")
+    results = {}
+    for name in names or CASES:
+        results[name] = measure(CASES[name], seed, scale, repeat)
+        if progress is not None:
+            progress(name, results[name])
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "config": {"seed": seed, "scale": scale, "repeat": repeat},
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "git_commit": _git_commit(),
+        },
+        "results": results,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Per-case changes between two reports (cases present in both).
+
+    A case regresses when its throughput falls below (1 − threshold) × baseline, or its peak
+    memory exceeds (1 + threshold) × baseline by more than MIN_MEMORY_DELTA_KIB.
+    """
+    rows = []
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            continue
+        speed = n["ops_per_s"] / b["ops_per_s"]
+        memory = n["peak_kib"] / b["peak_kib"] if b["peak_kib"] else math.inf if n["peak_kib"] else 1.0
+        reasons = []
+        if speed < 1.0 - threshold:
+            reasons.append("throughput")
+        if memory > 1.0 + threshold and n["peak_kib"] - b["peak_kib"] > MIN_MEMORY_DELTA_KIB:
+            reasons.append("memory")
+        rows.append({
+            "case": name,
+            "speed_ratio": speed,
+            "p50_ratio": n["latency_us"]["p50"] / b["latency_us"]["p50"],
+            "memory_ratio": memory,
+            "regression": reasons,
+        })
+    return rows
+
+
+# -------------------- CLI --------------------
+
+def _print_result(name: str, r: Dict[str, Any]) -> None:
+    lat = r["latency_us"]
+    print(f"{name:<22}{r['ops_per_s']:>14,.0f} {r['unit']}/s   p50 {lat['p50']:>10.1f} µs   "
+          f"p99 {lat['p99']:>10.1f} µs   peak {r['peak_kib']:>10.1f} KiB", flush=True)
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    report = run_suite(args.case, args.seed, args.scale, args.repeat, progress=_print_result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"wrote {args.out}")
+    return 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    if base.get("config") != new.get("config"):
+        print(f"warning: runs use different settings ({base.get('config')} vs {new.get('config')})", file=sys.stderr)
+    rows = compare(base, new, args.threshold)
+    print(f"{'case':<22}{'throughput':>12}{'p50 latency':>13}{'peak memory':>13}")
+    for r in rows:
+        flag = f"  REGRESSION ({', '.join(r['regression'])})" if r["regression"] else ""
+        print(f"{r['case']:<22}{r['speed_ratio']:>11.2f}x{r['p50_ratio']:>12.2f}x{r['memory_ratio']:>12.2f}x{flag}")
+    failed = [r["case"] for r in rows if r["regression"]]
+    print(f"{len(failed)} regression(s) beyond {args.threshold:.0%}" + (f": {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    prun = sub.add_parser("run", help="Measure the cases and optionally save the report as JSON")
+    prun.add_argument("--out", help="Write the JSON report to this file")
+    prun.add_argument("--seed", type=int, default=0, help="Workload seed (same seed, same inputs)")
+    prun.add_argument("--scale", type=float, default=1.0, help="Workload size multiplier")
+    prun.add_argument("--repeat", type=int, default=5, help="Timed passes per case (the fastest sets ops/s)")
+    prun.add_argument("--case", action="append", choices=list(CASES), help="Run only this case (repeatable)")
+    prun.set_defaults(func=_cmd_run)
+
+    pcmp = sub.add_parser("compare", help="Compare two JSON reports; exit status 1 on regression")
+    pcmp.add_argument("base", help="Baseline report")
+    pcmp.add_argument("new", help="New report")
+    pcmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                      help="Allowed fractional loss of throughput / growth of peak memory (default 0.10)")
+    pcmp.set_defaults(func=_cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
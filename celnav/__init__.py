@@ -4,31 +4,34 @@ Usage:
   python -m celnav --help
 """
 
-from .core import (
-    normalize_angle_deg,
-    sin_d,
-    cos_d,
-    tan_d,
-    asin_d,
-    acos_d,
-    atan2_d,
-    dms_to_deg,
-    deg_to_dms_str,
-    lha_from_gha_longitude,
-    compute_hc_zn,
-    dip_correction_minutes,
-    refraction_bennett_minutes,
-    sun_sd_minutes,
-    parallax_alt_minutes_from_hp,
-    apply_altitude_corrections,
-    InterceptResult,
-    intercept,
-    longitude_from_noon_time,
-    equation_of_time_minutes,
-    utc_to_lmt_hours,
-    lmt_to_utc_hours,
-    parse_hms_to_hours,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import (
+        normalize_angle_deg,
+        sin_d,
+        cos_d,
+        tan_d,
+        asin_d,
+        acos_d,
+        atan2_d,
+        dms_to_deg,
+        deg_to_dms_str,
+        lha_from_gha_longitude,
+        compute_hc_zn,
+        dip_correction_minutes,
+        refraction_bennett_minutes,
+        sun_sd_minutes,
+        parallax_alt_minutes_from_hp,
+        apply_altitude_corrections,
+        InterceptResult,
+        intercept,
+        longitude_from_noon_time,
+        equation_of_time_minutes,
+        utc_to_lmt_hours,
+        lmt_to_utc_hours,
+        parse_hms_to_hours,
+    )
 
 __all__ = [
     "normalize_angle_deg",
@@ -57,3 +60,19 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    # The core helpers are loaded on first attribute access, so `python -m celnav` and
+    # `import celnav.<module>` do not pay for them.
+    if name in __all__:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,8 @@ import math
 from dataclasses import dataclass
 from typing import Tuple
 
+from .timescale import julian_day, julian_day_of
+
 # Note: For stars, GHA_star = (GHA_aries + SHA_star) mod 360.
 # Declination is taken from a catalog; here only the combination function is provided.
 
@@ -16,16 +18,7 @@ def _normalize_deg(x: float) -> float:
 
 def _julian_day(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: float = 0.0) -> float:
     """Julian Day (UTC) using algorithm valid for Gregorian calendar (post-1582)."""
-    y = year
-    m = month
-    d = day + (hour + (minute + second / 60.0) / 60.0) / 24.0
-    if m <= 2:
-        y -= 1
-        m += 12
-    A = math.floor(y / 100)
-    B = 2 - A + math.floor(A / 5)
-    JD = math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * (m + 1)) + d + B - 1524.5
-    return JD
+    return julian_day(year, month, day, hour, minute, second)
 
 
 def _julian_centuries(JD: float) -> float:
@@ -109,9 +102,7 @@ def gha_aries_deg(JD: float, T: float) -> float:
     return _gmst_deg(JD, T)
 
 
-def gha_sun_and_dec_deg(year: int, month: int, day: int, hour: int, minute: int, second: float = 0.0) -> Tuple[float, float]:
-    """Return (GHA_sun_deg, Dec_sun_deg) for UTC datetime via simplified solar model."""
-    JD = _julian_day(year, month, day, hour, minute, second)
+def _sun_gha_dec_at_jd(JD: float) -> Tuple[float, float]:
     T = _julian_centuries(JD)
     ra_sun, dec_sun = _sun_ra_dec_deg(T)
     gmst = _gmst_deg(JD, T)
@@ -119,25 +110,26 @@ def gha_sun_and_dec_deg(year: int, month: int, day: int, hour: int, minute: int,
     return gha_sun, dec_sun
 
 
+def gha_sun_and_dec_deg(year: int, month: int, day: int, hour: int, minute: int, second: float = 0.0) -> Tuple[float, float]:
+    """Return (GHA_sun_deg, Dec_sun_deg) for UTC datetime via simplified solar model."""
+    return _sun_gha_dec_at_jd(_julian_day(year, month, day, hour, minute, second))
+
+
 @dataclass
 class AlmanacSun:
     gha_deg: float
     dec_deg: float
 
 
+def compute_sun_gha_dec(instant) -> AlmanacSun:
+    """Sun GHA/Dec for a UTC instant (ISO string, epoch seconds, datetime or datetime64)."""
+    gha, dec = _sun_gha_dec_at_jd(julian_day_of(instant))
+    return AlmanacSun(gha_deg=gha, dec_deg=dec)
+
+
 def compute_sun_gha_dec_from_iso(iso_utc: str) -> AlmanacSun:
     """Parse ISO 'YYYY-MM-DDTHH:MM[:SS][Z]' and compute Sun GHA/Dec."""
-    s = iso_utc.strip().upper().replace("Z", "")
-    date_part, time_part = s.split("T")
-    y, m, d = [int(x) for x in date_part.split("-")]
-    tparts = time_part.split(":")
-    if len(tparts) == 2:
-        hh, mm = int(tparts[0]), int(tparts[1])
-        ss = 0.0
-    else:
-        hh, mm, ss = int(tparts[0]), int(tparts[1]), float(tparts[2])
-    gha, dec = gha_sun_and_dec_deg(y, m, d, hh, mm, ss)
-    return AlmanacSun(gha_deg=gha, dec_deg=dec)
+    return compute_sun_gha_dec(iso_utc)
 
 
 @dataclass
@@ -145,20 +137,14 @@ class AlmanacAries:
     gha_deg: float
 
 
+def compute_aries_gha(instant) -> AlmanacAries:
+    """Aries GHA for a UTC instant (ISO string, epoch seconds, datetime or datetime64)."""
+    JD = julian_day_of(instant)
+    return AlmanacAries(gha_deg=gha_aries_deg(JD, _julian_centuries(JD)))
+
+
 def compute_aries_gha_from_iso(iso_utc: str) -> AlmanacAries:
-    s = iso_utc.strip().upper().replace("Z", "")
-    date_part, time_part = s.split("T")
-    y, m, d = [int(x) for x in date_part.split("-")]
-    tparts = time_part.split(":")
-    if len(tparts) == 2:
-        hh, mm = int(tparts[0]), int(tparts[1])
-        ss = 0.0
-    else:
-        hh, mm, ss = int(tparts[0]), int(tparts[1]), float(tparts[2])
-    JD = _julian_day(y, m, d, hh, mm, ss)
-    T = _julian_centuries(JD)
-    gha = gha_aries_deg(JD, T)
-    return AlmanacAries(gha_deg=gha)
+    return compute_aries_gha(iso_utc)
 
 
 def gha_star_from_aries_sha(gha_aries_deg_val: float, sha_star_deg: float) -> float:
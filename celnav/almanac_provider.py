@@ -0,0 +1,83 @@
+"""Almanac provider backed by the hourly Sun/Aries tables, with the analytic series as fallback.
+
+GHA/Dec for an arbitrary instant are interpolated linearly between the surrounding hourly
+records (GHA along the short way round, so 359° -> 14° is handled). Each lookup decodes the
+24 + 1 records of its UTC day once; decoded days are kept in a size-bounded LRU so repeated
+instants on hot days never touch the table again. Instants outside every loaded table use
+:func:`celnav.almanac.compute_sun_gha_dec` / :func:`celnav.almanac.compute_aries_gha`.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .almanac import (
+    AlmanacSun,
+    AlmanacAries,
+    compute_sun_gha_dec,
+    compute_aries_gha,
+)
+from .almanac_store import BinaryAlmanac
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "src" / "data" / "almanac"
+DEFAULT_CACHE_DAYS = 64
+
+_DayRecords = Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]
+
+
+def default_table_paths() -> List[str]:
+    """Binary hourly tables shipped with the repository (sun_aries_<year>_hourly.bin)."""
+    return [str(p) for p in sorted(DATA_DIR.glob("sun_aries_*_hourly.bin"))]
+
+
+def _interp_angle(a0: float, a1: float, f: float) -> float:
+    return (a0 + f * (((a1 - a0) + 180.0) % 360.0 - 180.0)) % 360.0
+
+
+class TableAlmanacProvider:
+    """Interpolated Sun GHA/Dec and Aries GHA from one or more hourly binary tables."""
+
+    def __init__(self, paths: Optional[Sequence[str]] = None, cache_days: int = DEFAULT_CACHE_DAYS) -> None:
+        self.tables = [BinaryAlmanac(p) for p in (default_table_paths() if paths is None else paths)]
+        self._day = lru_cache(maxsize=cache_days)(self._decode_day)
+
+    def _decode_day(self, table_no: int, first: int) -> _DayRecords:
+        table = self.tables[table_no]
+        stop = min(first + 86400 // table.step_s + 1, table.num_records)
+        gha_sun, dec_sun, gha_aries = table.columns(slice(first, stop))
+        return tuple(gha_sun.tolist()), tuple(dec_sun.tolist()), tuple(gha_aries.tolist())
+
+    def _locate(self, epoch_s: float):
+        """(day records, offset within the day, interpolation fraction) or None if not covered."""
+        for table_no, table in enumerate(self.tables):
+            if table.covers(epoch_s):
+                per_day = 86400 // table.step_s
+                pos = (epoch_s - table.start_epoch_s) / table.step_s
+                index = min(int(pos), table.num_records - 1)
+                first = index - index % per_day
+                return self._day(table_no, first), index - first, pos - index
+        return None
+
+    def sun(self, epoch_s: float) -> AlmanacSun:
+        hit = self._locate(epoch_s)
+        if hit is None:
+            return compute_sun_gha_dec(epoch_s)
+        (gha, dec, _), i, f = hit
+        if f == 0.0:
+            return AlmanacSun(gha_deg=gha[i], dec_deg=dec[i])
+        return AlmanacSun(gha_deg=_interp_angle(gha[i], gha[i + 1], f), dec_deg=dec[i] + f * (dec[i + 1] - dec[i]))
+
+    def aries(self, epoch_s: float) -> AlmanacAries:
+        hit = self._locate(epoch_s)
+        if hit is None:
+            return compute_aries_gha(epoch_s)
+        (_, _, gha), i, f = hit
+        if f == 0.0:
+            return AlmanacAries(gha_deg=gha[i])
+        return AlmanacAries(gha_deg=_interp_angle(gha[i], gha[i + 1], f))
+
+
+@lru_cache(maxsize=None)
+def get_table_provider() -> TableAlmanacProvider:
+    """Process-wide provider over the default tables."""
+    return TableAlmanacProvider()
@@ -0,0 +1,173 @@
+"""Compact binary almanac tables (Sun GHA/Dec, Aries GHA at a fixed UTC step).
+
+File layout (little endian, version 1):
+  header  64 bytes: magic b"CNALM", version u16, value type u8 (0 = float64, 1 = scaled int32),
+          column count u8, first record (epoch seconds) i64, step (seconds) i32,
+          record count i64, scale f64 (degrees per int32 unit)
+  data    one contiguous column per field, in COLUMNS order
+
+The loader memory-maps the columns, so opening a file costs a header read and a lookup by
+index or UTC instant touches only the bytes it needs. A file may span any number of years;
+:func:`convert_json_to_binary` concatenates consecutive yearly JSON tables.
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+MAGIC = b"CNALM"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER_FMT = "<5sHBBqiqd"
+
+COLUMNS = ("ghaSunDeg", "decSunDeg", "ghaAriesDeg")
+TYPE_FLOAT64 = 0
+TYPE_INT32 = 1
+INT32_SCALE = 1e-6  # same resolution as the rounded JSON tables
+
+
+@dataclass
+class AlmanacRecord:
+    gha_sun_deg: float
+    dec_sun_deg: float
+    gha_aries_deg: float
+
+
+class AlmanacBinaryWriter:
+    """
+    Incremental writer: the file is sized up front from the record count, then chunks of
+    consecutive records are written into each column in place, so memory stays bounded.
+    """
+
+    def __init__(self, path: str, start_epoch_s: int, step_s: int, num_records: int, value_type: int = TYPE_FLOAT64) -> None:
+        self.num_records = num_records
+        self.value_type = value_type
+        self._dtype = np.dtype("<i4" if value_type == TYPE_INT32 else "<f8")
+        self._f = open(path, "wb")
+        self._f.write(struct.pack(
+            _HEADER_FMT, MAGIC, VERSION, value_type, len(COLUMNS), start_epoch_s, step_s, num_records, INT32_SCALE
+        ).ljust(HEADER_SIZE, b"\0"))
+        self._f.truncate(HEADER_SIZE + len(COLUMNS) * num_records * self._dtype.itemsize)
+
+    def write(self, first_index: int, columns: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        """Write records first_index.. (one array per field in COLUMNS order)."""
+        for c, col in enumerate(columns):
+            col = np.asarray(col, dtype=float)
+            if first_index < 0 or first_index + len(col) > self.num_records:
+                raise IndexError("Chunk outside the declared record range")
+            if self.value_type == TYPE_INT32:
+                col = np.rint(col / INT32_SCALE)
+            self._f.seek(HEADER_SIZE + (c * self.num_records + first_index) * self._dtype.itemsize)
+            self._f.write(col.astype(self._dtype).tobytes())
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "AlmanacBinaryWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_almanac_binary(
+    path: str,
+    start_epoch_s: int,
+    step_s: int,
+    columns: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    value_type: int = TYPE_FLOAT64,
+) -> None:
+    """Write equally spaced records (one array per field in COLUMNS order) to path."""
+    with AlmanacBinaryWriter(path, start_epoch_s, step_s, len(columns[0]), value_type) as writer:
+        writer.write(0, columns)
+
+
+class BinaryAlmanac:
+    """Memory-mapped view of an almanac file written by :func:`write_almanac_binary`."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+        magic, version, value_type, ncols, start, step, n, scale = struct.unpack_from(_HEADER_FMT, raw)
+        if magic != MAGIC:
+            raise ValueError(f"Not a celnav almanac file: {path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported almanac file version {version}")
+        dtype = "<i4" if value_type == TYPE_INT32 else "<f8"
+        self.path = path
+        self.start_epoch_s = start
+        self.step_s = step
+        self.num_records = n
+        self._scale = scale if value_type == TYPE_INT32 else 1.0
+        self._data = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(ncols, n))
+
+    @property
+    def end_epoch_s(self) -> int:
+        """Epoch seconds of the last record."""
+        return self.start_epoch_s + (self.num_records - 1) * self.step_s
+
+    def columns(self, index) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(GHA Sun, Dec Sun, GHA Aries) in degrees for a record index or index array."""
+        raw = self._data[:, index]
+        if self._scale != 1.0:
+            raw = raw * self._scale
+        return raw[0], raw[1], raw[2]
+
+    def record(self, index: int) -> AlmanacRecord:
+        if not 0 <= index < self.num_records:
+            raise IndexError(f"Almanac record {index} out of range 0..{self.num_records - 1}")
+        gha_sun, dec_sun, gha_aries = self.columns(index)
+        return AlmanacRecord(float(gha_sun), float(dec_sun), float(gha_aries))
+
+    def index_at(self, epoch_s: float) -> int:
+        """Index of the record at or immediately before a UTC instant (epoch seconds)."""
+        index = int((epoch_s - self.start_epoch_s) // self.step_s)
+        if not 0 <= index < self.num_records:
+            raise KeyError(f"Instant {epoch_s} outside almanac coverage")
+        return index
+
+    def record_at(self, epoch_s: float) -> AlmanacRecord:
+        return self.record(self.index_at(epoch_s))
+
+    def covers(self, epoch_s: float) -> bool:
+        return self.start_epoch_s <= epoch_s <= self.end_epoch_s
+
+
+def _epoch_of_date(iso_date: str) -> int:
+    d = date.fromisoformat(iso_date)
+    return int(datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp())
+
+
+def convert_json_to_binary(json_paths: Iterable[str], out_path: str, value_type: int = TYPE_FLOAT64) -> int:
+    """
+    Convert one or more hourly JSON tables (as written by scripts/generate_sun_aries_almanac.py)
+    into a single binary file. Tables must be consecutive in time. Returns the record count.
+    """
+    start = None
+    step = None
+    expected = None
+    parts: List[np.ndarray] = []
+    for path in json_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        header = payload["header"]
+        if list(header["record_fields"]) != list(COLUMNS):
+            raise ValueError(f"{path}: unexpected record fields {header['record_fields']}")
+        table_start = _epoch_of_date(header["start_date"])
+        table_step = 86400 // int(header["records_per_day"])
+        records = np.asarray(payload["records"], dtype=float)
+        if start is None:
+            start, step = table_start, table_step
+        elif table_step != step or table_start != expected:
+            raise ValueError(f"{path}: table does not continue the previous one")
+        expected = table_start + len(records) * table_step
+        parts.append(records)
+    if start is None:
+        raise ValueError("No JSON tables given")
+    records = np.concatenate(parts)
+    write_almanac_binary(out_path, start, step, (records[:, 0], records[:, 1], records[:, 2]), value_type)
+    return len(records)
@@ -0,0 +1,438 @@
+"""Array (NumPy) counterparts of the scalar routines in :mod:`celnav.core`.
+
+The scalar functions stay the reference implementation for single sights; the
+functions here accept scalars or array-likes, broadcast them against each other
+and evaluate every row in one pass.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .almanac import (
+    _julian_centuries,
+    _mean_obliquity_deg,
+    _sun_geom_mean_long_deg,
+    _sun_geom_mean_anom_deg,
+    _sun_true_longitude_deg,
+    _gmst_deg,
+)
+from .stars import star_columns, star_index
+from .core import DEFAULT_SIGMA_MINUTES, HUBER_K, MIN_SCALE_MINUTES, TUKEY_C
+from .timescale import epoch_seconds_array, julian_day_array
+
+
+# -------------- Sight reduction --------------
+
+def compute_hc_zn_batch(lat_deg, dec_deg, lha_deg) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`celnav.core.compute_hc_zn`: Hc and Zn arrays (degrees) for broadcast φ, δ, LHA."""
+    lat_r = np.radians(np.asarray(lat_deg, dtype=float))
+    dec_r = np.radians(np.asarray(dec_deg, dtype=float))
+    lha_r = np.radians(np.asarray(lha_deg, dtype=float))
+
+    sin_lat = np.sin(lat_r)
+    cos_lat = np.cos(lat_r)
+    sin_dec = np.sin(dec_r)
+    cos_dec = np.cos(dec_r)
+    cos_lha = np.cos(lha_r)
+
+    sin_hc = sin_lat * sin_dec + cos_lat * cos_dec * cos_lha
+    hc = np.degrees(np.arcsin(np.clip(sin_hc, -1.0, 1.0)))
+    x = np.sin(lha_r)
+    y = cos_lat * np.tan(dec_r) - sin_lat * cos_lha
+    zn = np.degrees(np.arctan2(x, y)) % 360.0
+    return hc, zn
+
+
+# -------------- Observational corrections (minutes of arc) --------------
+
+def dip_correction_minutes_batch(height_of_eye_m) -> np.ndarray:
+    """Vectorized :func:`celnav.core.dip_correction_minutes` (0 for non-positive heights)."""
+    h = np.asarray(height_of_eye_m, dtype=float)
+    return np.where(h > 0, -1.76 * np.sqrt(np.maximum(h, 0.0)), 0.0)
+
+
+def refraction_bennett_minutes_batch(alt_deg, pressure_hpa=1010.0, temperature_c=10.0) -> np.ndarray:
+    """Vectorized :func:`celnav.core.refraction_bennett_minutes`."""
+    alt = np.maximum(0.1, np.asarray(alt_deg, dtype=float))
+    k = 0.97015 * (np.asarray(pressure_hpa, dtype=float) / (273.15 + np.asarray(temperature_c, dtype=float)))
+    return -k / np.tan(np.radians(alt + (10.3 / (alt + 5.11))))
+
+
+def apply_altitude_corrections_batch(
+    hs_deg,
+    index_error_minutes=0.0,
+    height_of_eye_m=0.0,
+    pressure_hpa=1010.0,
+    temperature_c=10.0,
+    semi_diameter_minutes=0.0,
+    semi_diameter_is_lower_limb=True,
+    parallax_minutes=0.0,
+    hp_minutes=None,
+) -> np.ndarray:
+    """
+    Vectorized :func:`celnav.core.apply_altitude_corrections`: Ho (degrees) for columns of Hs.
+    Every argument may be a scalar or an array broadcastable against hs_deg.
+    If hp_minutes is given (Moon), rows with a finite HP use the parallax in altitude
+    HP·cos(Hs) from :func:`celnav.core.parallax_alt_minutes_from_hp`; NaN rows keep parallax_minutes.
+    """
+    hs = np.asarray(hs_deg, dtype=float)
+    parallax = np.asarray(parallax_minutes, dtype=float)
+    if hp_minutes is not None:
+        hp = np.asarray(hp_minutes, dtype=float)
+        parallax = np.where(np.isnan(hp), parallax, hp * np.cos(np.radians(hs)))
+    sd = np.asarray(semi_diameter_minutes, dtype=float)
+    sd = np.where(np.asarray(semi_diameter_is_lower_limb, dtype=bool), sd, -sd)
+    total_minutes = (
+        -np.asarray(index_error_minutes, dtype=float)
+        + dip_correction_minutes_batch(height_of_eye_m)
+        + refraction_bennett_minutes_batch(hs, pressure_hpa, temperature_c)
+        + sd
+        - parallax
+    )
+    return hs + total_minutes / 60.0
+
+
+# -------------- Fix computation --------------
+
+def lop_lines_batch(lat0_deg, lon0_deg, gha_deg, dec_deg, Ho_deg) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stacked :func:`celnav.core._lop_line`: arrays (a, b, c) of a*dlat + b*dlon = c in minutes."""
+    lat0 = np.asarray(lat0_deg, dtype=float)
+    lha = (np.asarray(gha_deg, dtype=float) - np.asarray(lon0_deg, dtype=float)) % 360.0
+    hc, zn = compute_hc_zn_batch(lat0, dec_deg, lha)
+    zn_r = np.radians(zn)
+    a = 60.0 * np.cos(zn_r)
+    b = 60.0 * np.cos(np.radians(lat0)) * np.sin(zn_r)
+    c = (np.asarray(Ho_deg, dtype=float) - hc) * 60.0
+    return a, b, c
+
+
+def track_offsets_batch(sight_utc, ref_utc, leg_start_utc, leg_course_deg, leg_speed_kn) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized :func:`celnav.core.dr_offset_nm`: (north, east) nm run from ref_utc to sight_utc
+    (broadcast arrays of instants) along one DR track given as leg columns in time order.
+    A single leg gives a constant course and speed.
+    """
+    t = epoch_seconds_array(sight_utc)
+    t_ref = epoch_seconds_array(ref_utc)
+    starts = np.atleast_1d(epoch_seconds_array(leg_start_utc))
+    course_r = np.radians(np.atleast_1d(np.asarray(leg_course_deg, dtype=float)))
+    speed = np.atleast_1d(np.asarray(leg_speed_kn, dtype=float))
+    v_north = speed * np.cos(course_r)
+    v_east = speed * np.sin(course_r)
+    # Track position (nm from the first leg start) at every leg start
+    hours = np.diff(starts) / 3600.0
+    cum_north = np.concatenate(([0.0], np.cumsum(v_north[:-1] * hours)))
+    cum_east = np.concatenate(([0.0], np.cumsum(v_east[:-1] * hours)))
+
+    def position(when):
+        k = np.maximum(np.searchsorted(starts, when, side="right") - 1, 0)
+        h = (when - starts[k]) / 3600.0
+        return cum_north[k] + v_north[k] * h, cum_east[k] + v_east[k] * h
+
+    n1, e1 = position(t)
+    n0, e0 = position(t_ref)
+    return n1 - n0, e1 - e0
+
+
+def _advance_batch(lat, lon, north_nm, east_nm):
+    """Vectorized :func:`celnav.core._advance`."""
+    dlat = north_nm / 60.0
+    return lat + dlat, lon + east_nm / (60.0 * np.cos(np.radians(lat + 0.5 * dlat)))
+
+
+@dataclass
+class BatchFixResult:
+    lat_deg: np.ndarray
+    lon_deg: np.ndarray
+    rms_minutes: np.ndarray
+    num_sights: np.ndarray
+    # Per fix: (north, east) covariance in nm², shape (num_fixes, 2, 2), and derived figures
+    covariance_nm2: Optional[np.ndarray] = None
+    ellipse_major_nm: Optional[np.ndarray] = None
+    ellipse_minor_nm: Optional[np.ndarray] = None
+    ellipse_orientation_deg: Optional[np.ndarray] = None
+    dop: Optional[np.ndarray] = None
+    sigma_minutes: Optional[np.ndarray] = None
+    # Per sight (input row order): robust weight and outlier flag
+    weights: Optional[np.ndarray] = None
+    outlier: Optional[np.ndarray] = None
+
+
+def _gauss_newton_batch(lat, lon, group, num_fixes, gha, dec, ho, north, east, running, weights, tol_deg, max_iter):
+    active = np.ones(num_fixes, dtype=bool)
+    rows = np.arange(group.size)
+    for _ in range(max_iter):
+        g = group[rows]
+        lat_s, lon_s = lat[g], lon[g]
+        if running:
+            lat_s, lon_s = _advance_batch(lat_s, lon_s, north[rows], east[rows])
+        a, b, c = lop_lines_batch(lat_s, lon_s, gha[rows], dec[rows], ho[rows])
+        w = weights[rows]
+        # Normal equations (A^T W A) x = A^T W c per fix
+        A11 = np.bincount(g, weights=w * a * a, minlength=num_fixes)
+        A12 = np.bincount(g, weights=w * a * b, minlength=num_fixes)
+        A22 = np.bincount(g, weights=w * b * b, minlength=num_fixes)
+        B1 = np.bincount(g, weights=w * a * c, minlength=num_fixes)
+        B2 = np.bincount(g, weights=w * b * c, minlength=num_fixes)
+        det = A11 * A22 - A12 * A12
+
+        solvable = active & (np.abs(det) >= 1e-9)
+        safe_det = np.where(solvable, det, 1.0)
+        dlat = np.where(solvable, (A22 * B1 - A12 * B2) / safe_det, 0.0)
+        dlon = np.where(solvable, (-A12 * B1 + A11 * B2) / safe_det, 0.0)
+        lat = np.clip(lat + dlat, -89.9999, 89.9999)
+        lon = lon + dlon
+
+        active = solvable & ~((np.abs(dlat) < tol_deg) & (np.abs(dlon) < tol_deg))
+        if not active.any():
+            break
+        rows = rows[active[group[rows]]]
+    return lat, lon
+
+
+def _group_median(values: np.ndarray, group: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Median of values within each group (NaN for groups with no values)."""
+    v = values[np.lexsort((values, group))]
+    starts = np.cumsum(counts) - counts
+    has = counts > 0
+    med = np.full(counts.shape, np.nan)
+    med[has] = 0.5 * (v[starts[has] + (counts[has] - 1) // 2] + v[starts[has] + counts[has] // 2])
+    return med
+
+
+def _robust_weights_batch(u: np.ndarray, method: str, k: float) -> np.ndarray:
+    au = np.abs(u)
+    if method == "huber":
+        return np.where(au <= k, 1.0, k / np.maximum(au, k))
+    return np.where(au < k, (1.0 - (au / k) ** 2) ** 2, 0.0)
+
+
+def _irls_batch(a, b, c, group, num_fixes, counts, method, k, tol_deg, max_iter) -> np.ndarray:
+    """Vectorized :func:`celnav.core._irls`: products formed once, only the weights change per pass."""
+    aa, ab, bb, ac, bc = a * a, a * b, b * b, a * c, b * c
+    x1 = np.zeros(num_fixes)
+    x2 = np.zeros(num_fixes)
+    weights = np.ones(group.size)
+    active = np.ones(num_fixes, dtype=bool)
+    rows = np.arange(group.size)
+    for _ in range(max_iter):
+        g = group[rows]
+        resid = c[rows] - a[rows] * x1[g] - b[rows] * x2[g]
+        n_active = np.bincount(g, minlength=num_fixes)
+        scale = np.maximum(1.4826 * _group_median(np.abs(resid), g, n_active), MIN_SCALE_MINUTES)
+        w = _robust_weights_batch(resid / scale[g], method, k)
+        A11 = np.bincount(g, weights=w * aa[rows], minlength=num_fixes)
+        A12 = np.bincount(g, weights=w * ab[rows], minlength=num_fixes)
+        A22 = np.bincount(g, weights=w * bb[rows], minlength=num_fixes)
+        B1 = np.bincount(g, weights=w * ac[rows], minlength=num_fixes)
+        B2 = np.bincount(g, weights=w * bc[rows], minlength=num_fixes)
+        det = A11 * A22 - A12 * A12
+        solvable = active & (np.abs(det) >= 1e-9)
+        safe_det = np.where(solvable, det, 1.0)
+        n1 = np.where(solvable, (A22 * B1 - A12 * B2) / safe_det, x1)
+        n2 = np.where(solvable, (-A12 * B1 + A11 * B2) / safe_det, x2)
+        # Weights of fixes that converged or became singular stay as they were
+        ok = solvable[g]
+        weights[rows[ok]] = w[ok]
+        done = (np.abs(n1 - x1) < tol_deg) & (np.abs(n2 - x2) < tol_deg)
+        x1, x2 = n1, n2
+        active = solvable & ~done
+        if not active.any():
+            break
+        rows = rows[active[g]]
+    return weights
+
+
+def _fix_quality_batch(a, b, weights, group, num_fixes, lat, sigma):
+    """Vectorized :func:`celnav.core._fix_quality` (NaN where the geometry is singular)."""
+    gn = a / 60.0
+    ge = b / (60.0 * np.cos(np.radians(lat[group])))
+    N11 = np.bincount(group, weights=weights * gn * gn, minlength=num_fixes)
+    N12 = np.bincount(group, weights=weights * gn * ge, minlength=num_fixes)
+    N22 = np.bincount(group, weights=weights * ge * ge, minlength=num_fixes)
+    det = N11 * N22 - N12 * N12
+    ok = np.abs(det) >= 1e-12
+    safe_det = np.where(ok, det, np.nan)
+    q11, q12, q22 = N22 / safe_det, -N12 / safe_det, N11 / safe_det
+    var = sigma * sigma
+    c11, c12, c22 = var * q11, var * q12, var * q22
+    cov = np.stack([np.stack([c11, c12], axis=-1), np.stack([c12, c22], axis=-1)], axis=-2)
+    mean = 0.5 * (c11 + c22)
+    half = np.hypot(0.5 * (c11 - c22), c12)
+    major = np.sqrt(mean + half)
+    minor = np.sqrt(np.maximum(mean - half, 0.0))
+    orientation = (0.5 * np.degrees(np.arctan2(2.0 * c12, c11 - c22))) % 180.0
+    return cov, major, minor, orientation, np.sqrt(q11 + q22)
+
+
+def solve_fix_batch(
+    lat_assumed_deg,
+    lon_assumed_deg,
+    gha_deg,
+    dec_deg,
+    Ho_deg,
+    fix_index,
+    num_fixes: Optional[int] = None,
+    tol_deg: float = 1e-7,
+    max_iter: int = 20,
+    offset_north_nm=None,
+    offset_east_nm=None,
+    robust: Optional[str] = None,
+    robust_k: Optional[float] = None,
+    outlier_sigma: float = 3.0,
+    sigma_minutes: Optional[float] = None,
+) -> BatchFixResult:
+    """
+    Gauss-Newton fixes for many independent sight groups at once.
+
+    Sights are given as a flat table (one row per sight); fix_index[i] is the 0-based fix
+    the i-th sight belongs to, so groups may be of any size and in any order. Every fix is
+    iterated like :func:`celnav.core.solve_fix_least_squares`; fixes whose correction falls
+    below tol_deg (or whose geometry is singular) leave the active set early.
+
+    Running fixes: offset_north_nm/offset_east_nm give, per sight, the run from the fix's
+    reference time to the sight's time (see :func:`track_offsets_batch`); each sight is then
+    linearized at the fix position advanced by its offset, as in the scalar solver.
+
+    robust, robust_k, outlier_sigma and sigma_minutes behave as in the scalar solver.
+    """
+    lat_a = np.asarray(lat_assumed_deg, dtype=float)
+    lon_a = np.asarray(lon_assumed_deg, dtype=float)
+    gha = np.asarray(gha_deg, dtype=float)
+    dec = np.asarray(dec_deg, dtype=float)
+    ho = np.asarray(Ho_deg, dtype=float)
+    group = np.asarray(fix_index, dtype=np.intp)
+    if robust not in (None, "huber", "tukey"):
+        raise ValueError(f"Unknown robust method: {robust}")
+    running = offset_north_nm is not None or offset_east_nm is not None
+    north = np.broadcast_to(np.asarray(0.0 if offset_north_nm is None else offset_north_nm, dtype=float), group.shape)
+    east = np.broadcast_to(np.asarray(0.0 if offset_east_nm is None else offset_east_nm, dtype=float), group.shape)
+    if num_fixes is None:
+        num_fixes = int(group.max()) + 1 if group.size else 0
+
+    counts = np.bincount(group, minlength=num_fixes)
+    if np.any(counts < 2):
+        raise ValueError("At least two sights are required for a fix")
+
+    # Start from average of assumed positions
+    lat = np.bincount(group, weights=lat_a, minlength=num_fixes) / counts
+    lon = np.bincount(group, weights=lon_a, minlength=num_fixes) / counts
+
+    def lop_rows(lat, lon):
+        lat_s, lon_s = lat[group], lon[group]
+        if running:
+            lat_s, lon_s = _advance_batch(lat_s, lon_s, north, east)
+        return lop_lines_batch(lat_s, lon_s, gha, dec, ho)
+
+    weights = np.ones(group.size)
+    lat, lon = _gauss_newton_batch(lat, lon, group, num_fixes, gha, dec, ho, north, east, running, weights, tol_deg, max_iter)
+    a, b, c = lop_rows(lat, lon)  # c = residual Ho − Hc in minutes
+
+    scale = None
+    if robust is not None:
+        k = robust_k if robust_k is not None else (HUBER_K if robust == "huber" else TUKEY_C)
+        weights = _irls_batch(a, b, c, group, num_fixes, counts, robust, k, tol_deg, 50)
+        lat, lon = _gauss_newton_batch(lat, lon, group, num_fixes, gha, dec, ho, north, east, running, weights, tol_deg, max_iter)
+        a, b, c = lop_rows(lat, lon)
+        scale = np.maximum(1.4826 * _group_median(np.abs(c), group, counts), MIN_SCALE_MINUTES)
+
+    # RMS residual in minutes per fix
+    ss = np.bincount(group, weights=c * c, minlength=num_fixes)
+    rms = np.sqrt(ss / counts)
+    if sigma_minutes is not None:
+        sigma = np.full(num_fixes, float(sigma_minutes))
+    elif scale is not None:
+        sigma = scale
+    else:
+        sigma = np.where(counts > 2, np.sqrt(ss / np.maximum(counts - 2, 1)), DEFAULT_SIGMA_MINUTES)
+    cov, major, minor, orientation, dop = _fix_quality_batch(a, b, weights, group, num_fixes, lat, sigma)
+    # Normalize longitude to [-180, 180) for presentation
+    lon_norm = ((lon + 180.0) % 360.0) - 180.0
+    return BatchFixResult(
+        lat_deg=lat,
+        lon_deg=lon_norm,
+        rms_minutes=rms,
+        num_sights=counts,
+        covariance_nm2=cov,
+        ellipse_major_nm=major,
+        ellipse_minor_nm=minor,
+        ellipse_orientation_deg=orientation,
+        dop=dop,
+        sigma_minutes=sigma,
+        weights=None if robust is None else weights,
+        outlier=np.zeros(group.size, dtype=bool) if scale is None else np.abs(c) > outlier_sigma * scale[group],
+    )
+
+
+# -------------- Almanac (Sun / Aries) --------------
+
+@dataclass
+class AlmanacBatch:
+    gha_sun_deg: np.ndarray
+    dec_sun_deg: np.ndarray
+    gha_aries_deg: np.ndarray
+
+
+def sun_aries_batch(instants) -> AlmanacBatch:
+    """
+    Vectorized :func:`celnav.almanac.gha_sun_and_dec_deg` and Aries GHA for an array of UTC
+    instants (epoch seconds, datetime64, datetimes or ISO strings; see :mod:`celnav.timescale`),
+    evaluating the same simplified series in one pass.
+    """
+    JD = julian_day_array(instants)
+    T = _julian_centuries(JD)
+
+    L0 = _sun_geom_mean_long_deg(T)
+    M = _sun_geom_mean_anom_deg(T)
+    Mrad = np.radians(M)
+    C = (
+        np.sin(Mrad) * (1.914602 - T * (0.004817 + 0.000014 * T))
+        + np.sin(2 * Mrad) * (0.019993 - 0.000101 * T)
+        + np.sin(3 * Mrad) * 0.000289
+    )
+    true_long = _sun_true_longitude_deg(L0, C)
+    omega_r = np.radians(125.04 - 1934.136 * T)
+    lam_r = np.radians(true_long - 0.00569 - 0.00478 * np.sin(omega_r))
+    eps_r = np.radians(_mean_obliquity_deg(T) + 0.00256 * np.cos(omega_r))
+
+    sin_lam = np.sin(lam_r)
+    ra = np.degrees(np.arctan2(np.cos(eps_r) * sin_lam, np.cos(lam_r))) % 360.0
+    dec = np.degrees(np.arcsin(np.sin(eps_r) * sin_lam))
+    gmst = _gmst_deg(JD, T)
+    return AlmanacBatch(gha_sun_deg=(gmst - ra) % 360.0, dec_sun_deg=dec, gha_aries_deg=gmst)
+
+
+def aries_gha_batch(instants) -> np.ndarray:
+    """GHA Aries (degrees, ≈ GMST) for an array of UTC instants, without the Sun series."""
+    JD = julian_day_array(instants)
+    return _gmst_deg(JD, _julian_centuries(JD))
+
+
+# -------------- Stars --------------
+
+def _star_rows(stars) -> np.ndarray:
+    """Catalog positions for a sequence of star names and/or positions (None = whole catalog)."""
+    if stars is None:
+        return np.arange(len(star_columns().names))
+    rows = []
+    for s in stars:
+        i = star_index(s) if isinstance(s, str) else int(s)
+        if i is None:
+            raise KeyError(f"Unknown star: {s}")
+        rows.append(i)
+    return np.asarray(rows, dtype=np.intp)
+
+
+def star_gha_dec_batch(gha_aries_deg, stars=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    GHA and Dec (degrees) of every catalog star (or the selected ones) for one or many Aries GHAs,
+    with :func:`celnav.almanac.gha_star_from_aries_sha` semantics: GHA★ = (GHA♈ + SHA★) mod 360.
+    The result has shape gha_aries.shape + (n_stars,); Dec does not depend on time and has
+    shape (n_stars,).
+    """
+    cols = star_columns()
+    rows = _star_rows(stars)
+    gha_aries = np.asarray(gha_aries_deg, dtype=float)[..., None]
+    return (gha_aries + cols.sha_deg[rows]) % 360.0, cols.dec_deg[rows]
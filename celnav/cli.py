@@ -1,28 +1,18 @@
 import argparse
-from typing import Optional, List, Dict, Any
-
-from .core import (
-    lha_from_gha_longitude,
-    compute_hc_zn,
-    apply_altitude_corrections,
-    intercept,
-    sun_sd_minutes,
-    parallax_alt_minutes_from_hp,
-    longitude_from_noon_time,
-    equation_of_time_minutes,
-    utc_to_lmt_hours,
-    lmt_to_utc_hours,
-    parse_hms_to_hours,
-    deg_to_dms_str,
-    Sight,
-    solve_fix_least_squares,
-)
-from .almanac import compute_sun_gha_dec_from_iso, compute_aries_gha_from_iso, gha_star_from_aries_sha
-from .stars import get_star, list_stars
-import json
+import math
+import sys
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+
+# Subcommand dependencies (core, almanac, stars, json, NumPy, ...) are imported inside the
+# handlers, and only the selected subcommand's parser is built: `celnav <cmd>` pays for
+# nothing else at startup.
+if TYPE_CHECKING:
+    from .core import Sight, TrackLeg
 
 
 def format_deg_and_dms(x: float) -> str:
+    from .core import deg_to_dms_str
+
     return f"{x:.5f}°  ({deg_to_dms_str(x)})"
 
 
@@ -50,78 +40,70 @@ def _read_float(prompt: str, default: Optional[float] = None) -> float:
 
 # -------------------- Commands --------------------
 
-def cmd_sun(args: argparse.Namespace) -> int:
+def _sight_reduction(
+    args: argparse.Namespace, semi_diameter_minutes: float, lower_limb: bool, parallax_minutes: float
+) -> Dict[str, Any]:
+    """LHA, Hc, Zn, Ho and intercept of one sight (shared by the sight commands and `serve`)."""
+    from .core import apply_altitude_corrections, compute_hc_zn, intercept, lha_from_gha_longitude
+
     lha = lha_from_gha_longitude(args.gha, args.lon)
     hc, zn = compute_hc_zn(args.lat, args.dec, lha)
-    parallax_minutes = args.parallax_min
     ho = apply_altitude_corrections(
         hs_deg=args.hs,
         index_error_minutes=args.ie,
         height_of_eye_m=args.height,
         pressure_hpa=args.pressure,
         temperature_c=args.temp,
-        semi_diameter_minutes=args.sd_min,
-        semi_diameter_is_lower_limb=(args.limb.upper() == "LL"),
+        semi_diameter_minutes=semi_diameter_minutes,
+        semi_diameter_is_lower_limb=lower_limb,
         parallax_minutes=parallax_minutes,
     )
     res = intercept(ho, hc)
+    return {
+        "lha": lha, "hc": hc, "zn": zn, "ho": ho,
+        "intercept_minutes": res.intercept_minutes, "direction": res.direction,
+    }
 
-    print("LHA:", format_deg_and_dms(lha))
-    print("Hc:", format_deg_and_dms(hc))
-    print("Zn:", format_deg_and_dms(zn))
-    print("Ho:", format_deg_and_dms(ho))
-    print(f"Intercept: {res.intercept_minutes:.2f}′ {res.direction}")
-    return 0
 
+def _sun_sight(args: argparse.Namespace) -> Dict[str, Any]:
+    return _sight_reduction(args, args.sd_min, args.limb.upper() == "LL", args.parallax_min)
 
-def cmd_star(args: argparse.Namespace) -> int:
-    lha = lha_from_gha_longitude(args.gha, args.lon)
-    hc, zn = compute_hc_zn(args.lat, args.dec, lha)
-    ho = apply_altitude_corrections(
-        hs_deg=args.hs,
-        index_error_minutes=args.ie,
-        height_of_eye_m=args.height,
-        pressure_hpa=args.pressure,
-        temperature_c=args.temp,
-        semi_diameter_minutes=0.0,
-        semi_diameter_is_lower_limb=True,
-        parallax_minutes=0.0,
-    )
-    res = intercept(ho, hc)
 
-    print("LHA:", format_deg_and_dms(lha))
-    print("Hc:", format_deg_and_dms(hc))
-    print("Zn:", format_deg_and_dms(zn))
-    print("Ho:", format_deg_and_dms(ho))
-    print(f"Intercept: {res.intercept_minutes:.2f}′ {res.direction}")
-    return 0
+def _star_sight(args: argparse.Namespace) -> Dict[str, Any]:
+    return _sight_reduction(args, 0.0, True, 0.0)
 
 
-def cmd_moon(args: argparse.Namespace) -> int:
-    lha = lha_from_gha_longitude(args.gha, args.lon)
-    hc, zn = compute_hc_zn(args.lat, args.dec, lha)
+def _moon_sight(args: argparse.Namespace) -> Dict[str, Any]:
+    from .core import parallax_alt_minutes_from_hp
+
     pa_minutes = parallax_alt_minutes_from_hp(args.hs, args.hp_min)
-    ho = apply_altitude_corrections(
-        hs_deg=args.hs,
-        index_error_minutes=args.ie,
-        height_of_eye_m=args.height,
-        pressure_hpa=args.pressure,
-        temperature_c=args.temp,
-        semi_diameter_minutes=args.sd_min,
-        semi_diameter_is_lower_limb=(args.limb.upper() == "LL"),
-        parallax_minutes=pa_minutes,
-    )
-    res = intercept(ho, hc)
+    return _sight_reduction(args, args.sd_min, args.limb.upper() == "LL", pa_minutes)
 
-    print("LHA:", format_deg_and_dms(lha))
-    print("Hc:", format_deg_and_dms(hc))
-    print("Zn:", format_deg_and_dms(zn))
-    print("Ho:", format_deg_and_dms(ho))
-    print(f"Intercept: {res.intercept_minutes:.2f}′ {res.direction}")
+
+def _print_sight_reduction(r: Dict[str, Any]) -> int:
+    print("LHA:", format_deg_and_dms(r["lha"]))
+    print("Hc:", format_deg_and_dms(r["hc"]))
+    print("Zn:", format_deg_and_dms(r["zn"]))
+    print("Ho:", format_deg_and_dms(r["ho"]))
+    print(f"Intercept: {r['intercept_minutes']:.2f}′ {r['direction']}")
     return 0
 
 
-def cmd_noon(args: argparse.Namespace) -> int:
+def cmd_sun(args: argparse.Namespace) -> int:
+    return _print_sight_reduction(_sun_sight(args))
+
+
+def cmd_star(args: argparse.Namespace) -> int:
+    return _print_sight_reduction(_star_sight(args))
+
+
+def cmd_moon(args: argparse.Namespace) -> int:
+    return _print_sight_reduction(_moon_sight(args))
+
+
+def _noon_sight(args: argparse.Namespace) -> Dict[str, Any]:
+    from .core import apply_altitude_corrections, longitude_from_noon_time, parse_hms_to_hours
+
     # Altitude corrections for Sun at meridian
     ho = apply_altitude_corrections(
         hs_deg=args.hs_noon,
@@ -137,18 +119,24 @@ def cmd_noon(args: argparse.Namespace) -> int:
         lat = 90.0 - ho + args.dec
     else:
         lat = 90.0 - ho - args.dec
+    out = {"ho": ho, "lat": lat}
+    if args.utc_lan:
+        out["lon"] = longitude_from_noon_time(parse_hms_to_hours(args.utc_lan))
+    return out
 
-    print("Ho (noon):", format_deg_and_dms(ho))
-    print("Latitude:", format_deg_and_dms(lat))
 
-    if args.utc_lan:
-        utc_lan_hours = parse_hms_to_hours(args.utc_lan)
-        lon = longitude_from_noon_time(utc_lan_hours)
-        print("Longitude (East +):", format_deg_and_dms(lon))
+def cmd_noon(args: argparse.Namespace) -> int:
+    r = _noon_sight(args)
+    print("Ho (noon):", format_deg_and_dms(r["ho"]))
+    print("Latitude:", format_deg_and_dms(r["lat"]))
+    if "lon" in r:
+        print("Longitude (East +):", format_deg_and_dms(r["lon"]))
     return 0
 
 
 def cmd_convert(args: argparse.Namespace) -> int:
+    from .core import lmt_to_utc_hours, parse_hms_to_hours, utc_to_lmt_hours
+
     if args.mode == "utc-to-lmt":
         utc_hours = parse_hms_to_hours(args.utc)
         lmt_hours = utc_to_lmt_hours(utc_hours, args.lon)
@@ -163,103 +151,328 @@ def cmd_convert(args: argparse.Namespace) -> int:
 
 
 def cmd_eot(args: argparse.Namespace) -> int:
+    from .core import equation_of_time_minutes
+
     eot = equation_of_time_minutes(args.doy)
     print(f"EoT: {eot:+.2f} minutes")
     return 0
 
 
+def _almanac_lookups(args: argparse.Namespace):
+    """(sun, aries) lookups by ISO UTC string for the selected --almanac source."""
+    if getattr(args, "almanac", "series") == "table":
+        from .almanac_provider import TableAlmanacProvider, get_table_provider
+        from .timescale import epoch_seconds_from_iso
+
+        provider = TableAlmanacProvider(args.almanac_file) if args.almanac_file else get_table_provider()
+        return (
+            lambda iso: provider.sun(epoch_seconds_from_iso(iso)),
+            lambda iso: provider.aries(epoch_seconds_from_iso(iso)),
+        )
+    from .almanac import compute_aries_gha_from_iso, compute_sun_gha_dec_from_iso
+
+    return compute_sun_gha_dec_from_iso, compute_aries_gha_from_iso
+
+
 def cmd_almanac_sun(args: argparse.Namespace) -> int:
-    sun = compute_sun_gha_dec_from_iso(args.utc)
+    sun_lookup, _ = _almanac_lookups(args)
+    sun = sun_lookup(args.utc)
     print("GHA_sun:", format_deg_and_dms(sun.gha_deg))
     print("Dec_sun:", format_deg_and_dms(sun.dec_deg))
     return 0
 
 
 def cmd_almanac_aries(args: argparse.Namespace) -> int:
-    ar = compute_aries_gha_from_iso(args.utc)
+    _, aries_lookup = _almanac_lookups(args)
+    ar = aries_lookup(args.utc)
     print("GHA_aries:", format_deg_and_dms(ar.gha_deg))
     return 0
 
 
+def cmd_star_finder(args: argparse.Namespace) -> int:
+    import numpy as np
+    from .star_finder import find_stars
+
+    aries = None
+    if args.almanac == "table":
+        from .almanac_provider import TableAlmanacProvider, get_table_provider
+
+        provider = TableAlmanacProvider(args.almanac_file) if args.almanac_file else get_table_provider()
+        aries = lambda epochs: np.array([provider.aries(float(e)).gha_deg for e in epochs])  # noqa: E731
+    try:
+        res = find_stars(
+            args.lat, args.lon, args.start, args.end, args.step,
+            args.min_alt, args.max_alt, args.max_mag, aries,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    gaps = res.azimuth_gap_deg()
+    stamps = res.epoch_s.astype("datetime64[s]").astype(str)
+    out = []
+    for k, stamp in enumerate(stamps):
+        found = res.candidates(k)
+        out.append(f"{stamp}Z  {len(found)} stars, largest azimuth gap {gaps[k]:.0f}°")
+        for c in found:
+            out.append(f"  {c.name:<16} Hc {c.hc_deg:6.2f}°  Zn {c.zn_deg:6.2f}°  mag {c.magnitude:+.1f}")
+    print("\n".join(out))
+    return 0
+
+
+SRT_CHUNK_ROWS = 65536
+
+
+def _srt_row_count(start: float, stop: float, step: float) -> int:
+    """Rows produced by stepping start..stop inclusive (at least one row, as before)."""
+    if step == 0:
+        raise SystemExit("--lha-step must be non-zero")
+    # Small tolerance so that e.g. 0..360 by 0.1 keeps its final row despite rounding
+    return max(0, math.floor((stop - start) / step + 1e-9)) + 1
+
+
+def _srt_chunk(task):
+    """(LHA, Hc, Zn) arrays for rows k0..k1 of an SRT run (module-level: runs in worker processes)."""
+    import numpy as np
+
+    (lat, dec, lon, mode, start, step, table), k0, k1 = task
+    if table:
+        from .sight_table import open_sight_table
+
+        reduce = open_sight_table(table).lookup
+    else:
+        from .batch import compute_hc_zn_batch as reduce
+
+    x = start + step * np.arange(k0, k1, dtype=float)
+    lha = (x - lon) % 360.0 if mode == "from-gha" else x % 360.0
+    hc, zn = reduce(lat, dec, lha)
+    return lha, hc, zn
+
+
+def _srt_chunks(args: argparse.Namespace, chunk_rows: int = SRT_CHUNK_ROWS):
+    """Yield (LHA, Hc, Zn) array chunks; row k uses start + k*step, so there is no accumulated drift."""
+    from .parallel import default_workers, ordered_map
+
+    n = _srt_row_count(args.lha_start, args.lha_stop, args.lha_step)
+    params = (args.lat, args.dec, args.lon, args.mode, args.lha_start, args.lha_step, args.table)
+    tasks = ((params, k0, min(n, k0 + chunk_rows)) for k0 in range(0, n, chunk_rows))
+    return ordered_map(_srt_chunk, tasks, args.workers or default_workers())
+
+
 def cmd_srt(args: argparse.Namespace) -> int:
-    lat = args.lat
-    dec = args.dec
-    lon = args.lon
-    start = args.lha_start
-    stop = args.lha_stop
-    step = args.lha_step
-    print("LHA,Hc_deg,Zn_deg")
-    lha = start
-    while True:
-        lha_norm = (lha - lon) % 360.0 if args.mode == "from-gha" else lha % 360.0
-        hc, zn = compute_hc_zn(lat, dec, lha_norm)
-        print(f"{lha_norm:.2f},{hc:.6f},{zn:.6f}")
-        lha += step
-        if (step > 0 and lha > stop) or (step < 0 and lha < stop):
-            break
+    import numpy as np
+
+    fmt = args.format or ("npy" if args.out and args.out.endswith(".npy") else "csv")
+    if fmt == "npy" and not args.out:
+        raise SystemExit("--format npy requires --out")
+
+    if fmt == "npy":
+        # Header first (the row count is known up front), then each chunk as raw float64 rows
+        n = _srt_row_count(args.lha_start, args.lha_stop, args.lha_step)
+        with open(args.out, "wb") as f:
+            np.lib.format.write_array_header_1_0(f, {"descr": "<f8", "fortran_order": False, "shape": (n, 3)})
+            for lha, hc, zn in _srt_chunks(args):
+                f.write(np.column_stack((lha, hc, zn)).astype("<f8").tobytes())
+        return 0
+
+    out = open(args.out, "w", encoding="utf-8", buffering=1 << 20) if args.out else sys.stdout
+    try:
+        out.write("LHA,Hc_deg,Zn_deg\n")
+        for lha, hc, zn in _srt_chunks(args):
+            # One format call per chunk instead of one print per row
+            out.write(("%.2f,%.6f,%.6f\n" * lha.size) % tuple(np.column_stack((lha, hc, zn)).ravel().tolist()))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_srt_build(args: argparse.Namespace) -> int:
+    """Build the precomputed sight reduction table file and report its cost and accuracy."""
+    from .sight_table import build_sight_table, SightReductionTable, table_accuracy
+
+    report = build_sight_table(args.out)
+    print(f"Table: {report.path}")
+    print(f"Build time: {report.build_seconds:.2f} s")
+    print(f"File size: {report.file_bytes / 1e6:.1f} MB")
+    acc = table_accuracy(SightReductionTable(args.out), samples=args.samples)
+    print(f"Accuracy vs compute_hc_zn over {acc['samples']} sights (0°–85° altitude):")
+    print(f"  Hc error: max {acc['hc_max_err_minutes']:.3f}′, RMS {acc['hc_rms_err_minutes']:.4f}′")
+    print(f"  Zn error: max {acc['zn_max_err_deg']:.3f}°, RMS {acc['zn_rms_err_deg']:.4f}°")
+    print(f"Lookup rate: {acc['lookups_per_second']:,.0f} sights/s")
+    return 0
+
+
+def _sight_from_record(s: Dict[str, Any], sun_lookup, aries_lookup) -> "Sight":
+    """Build a Sight from one JSON sight dict; 'utc' fills GHA/Dec (Sun) or GHA Aries (star) when absent."""
+    from .almanac import gha_star_from_aries_sha
+    from .core import Sight
+    from .stars import get_star
+
+    body = s.get("body", "sun").lower()
+    lat_assumed = float(s["lat"])
+    lon_assumed = float(s["lon"])  # East positive
+    Ho = float(s["Ho"])  # already corrected altitude in deg
+    dec: float
+    gha: float
+    if body == "sun":
+        gha = float(s["GHA"]) if "GHA" in s else float(s["gha"]) if "gha" in s else None
+        dec = float(s["dec"]) if "dec" in s else float(s["Decl" ]) if "Decl" in s else None
+        if (gha is None or dec is None) and "utc" in s:
+            sun = sun_lookup(str(s["utc"]))
+            gha = sun.gha_deg if gha is None else gha
+            dec = sun.dec_deg if dec is None else dec
+        if gha is None or dec is None:
+            raise SystemExit("Sun sight requires 'GHA' and 'dec' fields (or 'utc')")
+    elif body == "star":
+        # Requires Aries GHA (or UTC) and star name or SHA
+        if "GHA_aries" in s or "gha_aries" in s:
+            gha_aries = float(s.get("GHA_aries", s.get("gha_aries")))
+        elif "utc" in s:
+            gha_aries = aries_lookup(str(s["utc"])).gha_deg
+        else:
+            raise SystemExit("Star sight requires 'GHA_aries' (or 'utc')")
+        if "SHA" in s or "sha" in s:
+            sha = float(s.get("SHA", s.get("sha")))
+            dec = float(s["dec"]) if "dec" in s else float(s["Decl"]) if "Decl" in s else None
+            if dec is None:
+                raise SystemExit("Star sight with SHA requires 'dec' declination")
+        else:
+            star_name = s.get("star") or s.get("name")
+            if not star_name:
+                raise SystemExit("Star sight requires 'star' name or 'SHA'")
+            entry = get_star(str(star_name))
+            if not entry:
+                raise SystemExit(f"Unknown star: {star_name}")
+            sha = entry.sha_deg
+            dec = entry.dec_deg
+        gha = gha_star_from_aries_sha(gha_aries, sha)
+    else:
+        raise SystemExit(f"Unsupported body type: {body}")
+
+    return Sight(
+        lat_assumed_deg=lat_assumed,
+        lon_assumed_deg=lon_assumed,
+        gha_deg=float(gha),
+        dec_deg=float(dec),
+        Ho_deg=float(Ho),
+        utc=str(s["utc"]) if "utc" in s else None,
+    )
+
+
+def _load_track(path: Optional[str]) -> Optional[List["TrackLeg"]]:
+    if not path:
+        return None
+    import json
+    from .core import TrackLeg
+
+    with open(path, "r", encoding="utf-8") as f:
+        return [TrackLeg(str(leg["utc"]), float(leg["course"]), float(leg["speed"])) for leg in json.load(f)]
+
+
+def _fix_solve_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
+    """solve_fix_least_squares options shared by the single and streaming fix modes."""
+    return dict(
+        course_deg=args.course, speed_kn=args.speed, track=_load_track(args.track), ref_utc=args.ref_utc,
+        robust=args.robust, outlier_sigma=args.outlier_sigma, sigma_minutes=args.sigma,
+    )
+
+
+def _record_converter(almanac: str, almanac_file: Optional[str]):
+    """Record -> Sight for an almanac source; module-level so worker processes can rebuild it."""
+    sun_lookup, aries_lookup = _almanac_lookups(argparse.Namespace(almanac=almanac, almanac_file=almanac_file))
+    return lambda rec: _sight_from_record(rec, sun_lookup, aries_lookup)
+
+
+def _cmd_fix_stream(args: argparse.Namespace) -> int:
+    """NDJSON in (one sight per line, tagged with a fix ID), one JSON result line per fix out."""
+    import json
+    import time
+    from functools import partial
+    from .fix_stream import solve_stream, solve_stream_parallel
+
+    make_to_sight = partial(_record_converter, args.almanac, args.almanac_file)
+    solve_kwargs = _fix_solve_kwargs(args)
+    workers = args.workers
+    if workers == 0:
+        from .parallel import default_workers
+
+        workers = default_workers()
+    src = sys.stdin if args.stream == "-" else open(args.stream, "r", encoding="utf-8")
+    if workers > 1:
+        results = solve_stream_parallel(src, make_to_sight, workers, id_key=args.id_key, solve_kwargs=solve_kwargs)
+    else:
+        results = solve_stream(src, make_to_sight(), id_key=args.id_key, solve_kwargs=solve_kwargs)
+    out = sys.stdout
+    n = errors = 0
+    t0 = time.perf_counter()
+    try:
+        for rec in results:
+            out.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            n += 1
+            errors += "error" in rec
+    except ValueError as e:
+        raise SystemExit(f"{args.stream}: {e}")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+    out.flush()
+    elapsed = time.perf_counter() - t0
+    rate = n / elapsed if elapsed > 0 else float("inf")
+    print(f"{n} fixes ({errors} failed) in {elapsed:.2f} s: {rate:.0f} fixes/s", file=sys.stderr)
     return 0
 
 
 def cmd_fix(args: argparse.Namespace) -> int:
     """Compute position fix from multiple sights supplied as JSON file or inline JSON string."""
+    if args.stream is not None:
+        return _cmd_fix_stream(args)
+    import json
+    from .core import solve_fix_least_squares
+
     if args.file:
         with open(args.file, "r", encoding="utf-8") as f:
             data = json.load(f)
     else:
         data = json.loads(args.json)
 
-    sights: List[Sight] = []
-    for i, s in enumerate(data):
-        body = s.get("body", "sun").lower()
-        lat_assumed = float(s["lat"])
-        lon_assumed = float(s["lon"])  # East positive
-        Ho = float(s["Ho"])  # already corrected altitude in deg
-        dec: float
-        gha: float
-        if body == "sun":
-            gha = float(s["GHA"]) if "GHA" in s else float(s["gha"]) if "gha" in s else None
-            dec = float(s["dec"]) if "dec" in s else float(s["Decl" ]) if "Decl" in s else None
-            if gha is None or dec is None:
-                raise SystemExit("Sun sight requires 'GHA' and 'dec' fields")
-        elif body == "star":
-            # Requires Aries GHA and star name or SHA
-            gha_aries = float(s.get("GHA_aries", s.get("gha_aries")))
-            if "SHA" in s or "sha" in s:
-                sha = float(s.get("SHA", s.get("sha")))
-                dec = float(s["dec"]) if "dec" in s else float(s["Decl"]) if "Decl" in s else None
-                if dec is None:
-                    raise SystemExit("Star sight with SHA requires 'dec' declination")
-            else:
-                star_name = s.get("star") or s.get("name")
-                if not star_name:
-                    raise SystemExit("Star sight requires 'star' name or 'SHA'")
-                entry = get_star(str(star_name))
-                if not entry:
-                    raise SystemExit(f"Unknown star: {star_name}")
-                sha = entry.sha_deg
-                dec = entry.dec_deg
-            gha = gha_star_from_aries_sha(gha_aries, sha)
-        else:
-            raise SystemExit(f"Unsupported body type: {body}")
-
-        sights.append(Sight(
-            lat_assumed_deg=lat_assumed,
-            lon_assumed_deg=lon_assumed,
-            gha_deg=float(gha),
-            dec_deg=float(dec),
-            Ho_deg=float(Ho),
-        ))
+    sun_lookup, aries_lookup = _almanac_lookups(args)
+    sights: List[Sight] = [_sight_from_record(s, sun_lookup, aries_lookup) for s in data]
 
-    fix = solve_fix_least_squares(sights)
+    try:
+        fix = solve_fix_least_squares(sights, **_fix_solve_kwargs(args))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if fix.utc is not None:
+        print("Fix Time (UTC):", fix.utc)
     print("Fix Latitude:", format_deg_and_dms(fix.lat_deg))
     print("Fix Longitude (East +):", format_deg_and_dms(fix.lon_deg))
     print(f"RMS residual: {fix.rms_minutes:.2f}′ over {fix.num_sights} sights")
+    if fix.ellipse is not None:
+        e = fix.ellipse
+        print(
+            f"Error ellipse (1σ, σ={fix.sigma_minutes:.2f}′): {e.semi_major_nm:.2f} × {e.semi_minor_nm:.2f} nm, "
+            f"major axis {e.orientation_deg:05.1f}° T; DOP {fix.dop:.2f}"
+        )
+    if fix.outliers:
+        print("Outliers (sight #):", ", ".join(str(i + 1) for i in fix.outliers))
     return 0
 
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Serve JSON-lines requests (see celnav/server.py) until stdin closes or the process is interrupted."""
+    from .server import run
+
+    try:
+        return run(args.socket, args.stdio or not args.socket)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+
 # -------------------- Interactive Commands --------------------
 
 def cmd_almanac_interactive(_: argparse.Namespace) -> int:
+    from .almanac import compute_aries_gha_from_iso, compute_sun_gha_dec_from_iso
+
     print("Almanak (interaktif)")
     kind = _read_str("Tür (sun/aries)", "sun").strip().lower()
     iso = _read_str("UTC ISO (YYYY-MM-DDTHH:MM[:SS]Z)")
@@ -280,6 +493,8 @@ def cmd_almanac_interactive(_: argparse.Namespace) -> int:
 
 
 def cmd_srt_interactive(_: argparse.Namespace) -> int:
+    from .core import compute_hc_zn, deg_to_dms_str
+
     print("Sight Reduction (interaktif)")
     mode = _read_str("Mod (lha/from-gha)", "lha").strip().lower()
     lat = _read_float("Enlem φ (deg, +Kuzey, −Güney)")
@@ -313,16 +528,15 @@ def cmd_srt_interactive(_: argparse.Namespace) -> int:
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        prog="celnav",
-        description=(
-            "Celestial Navigation CLI: Sun/Star/Moon sights, Noon sight, Almanac, SRT, time conversions, EoT.\n"
-            "Angles are decimal degrees (East positive longitude). Times can be decimal hours or HH:MM[:SS]."
-        ),
+def _add_almanac_source_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--almanac", choices=["series", "table"], default="series",
+        help="Sun/Aries source: analytic series, or hourly ephemeris tables (series outside their years)",
     )
-    sub = p.add_subparsers(dest="cmd", required=True)
+    p.add_argument("--almanac-file", action="append", help="Binary hourly table to use with --almanac table (repeatable)")
+
 
+def _add_sun_parser(sub) -> None:
     # Sun
     psun = sub.add_parser("sun", help="AM/PM Sun sight -> Ho, Hc, Zn, intercept")
     psun.add_argument("--lat", type=float, required=True, help="Assumed latitude (deg, +N, −S)")
@@ -339,6 +553,8 @@ def build_parser() -> argparse.ArgumentParser:
     psun.add_argument("--parallax-min", type=float, default=0.1, help="Solar parallax in altitude (minutes)")
     psun.set_defaults(func=cmd_sun)
 
+
+def _add_star_parser(sub) -> None:
     # Star
     pstar = sub.add_parser("star", help="Star/planet sight -> Ho, Hc, Zn, intercept")
     pstar.add_argument("--lat", type=float, required=True, help="Assumed latitude (deg, +N, −S)")
@@ -352,6 +568,8 @@ def build_parser() -> argparse.ArgumentParser:
     pstar.add_argument("--temp", type=float, default=10.0, help="Temperature (C)")
     pstar.set_defaults(func=cmd_star)
 
+
+def _add_moon_parser(sub) -> None:
     # Moon
     pmoon = sub.add_parser("moon", help="Moon sight -> Ho, Hc, Zn, intercept (with HP/SD)")
     pmoon.add_argument("--lat", type=float, required=True, help="Assumed latitude (deg, +N, −S)")
@@ -368,6 +586,8 @@ def build_parser() -> argparse.ArgumentParser:
     pmoon.add_argument("--hp-min", type=float, default=57.0, help="Moon horizontal parallax HP (minutes)")
     pmoon.set_defaults(func=cmd_moon)
 
+
+def _add_noon_parser(sub) -> None:
     # Noon
     pnoon = sub.add_parser("noon", help="Noon sight -> latitude and optional longitude")
     pnoon.add_argument("--hs-noon", type=float, required=True, help="Observed max Hs at LAN (deg)")
@@ -383,6 +603,8 @@ def build_parser() -> argparse.ArgumentParser:
     pnoon.add_argument("--utc-lan", type=str, help="UTC of Local Apparent Noon (HH:MM[:SS] or decimal hours)")
     pnoon.set_defaults(func=cmd_noon)
 
+
+def _add_convert_parser(sub) -> None:
     # Convert
     pcvt = sub.add_parser("convert", help="Time conversions between UTC and LMT")
     pcvt.add_argument("--mode", choices=["utc-to-lmt", "lmt-to-utc"], required=True)
@@ -391,23 +613,48 @@ def build_parser() -> argparse.ArgumentParser:
     pcvt.add_argument("--lon", type=float, required=True, help="Longitude (deg, East +, West −)")
     pcvt.set_defaults(func=cmd_convert)
 
+
+def _add_eot_parser(sub) -> None:
     # EoT
     peot = sub.add_parser("eot", help="Equation of Time (minutes)")
     peot.add_argument("--doy", type=int, required=True, help="Day of year (1..366)")
     peot.set_defaults(func=cmd_eot)
 
+
+def _add_almanac_sun_parser(sub) -> None:
     # Almanac (Sun)
     pas = sub.add_parser("almanac-sun", help="Compute Sun GHA/Dec from UTC ISO time (YYYY-MM-DDTHH:MM[:SS]Z)")
     pas.add_argument("--utc", required=True, help="UTC ISO time, e.g., 2025-06-21T10:30:00Z")
+    _add_almanac_source_args(pas)
     pas.set_defaults(func=cmd_almanac_sun)
 
+
+def _add_almanac_aries_parser(sub) -> None:
     # Almanac (Aries)
     paa = sub.add_parser("almanac-aries", help="Compute Aries GHA from UTC ISO time (YYYY-MM-DDTHH:MM[:SS]Z)")
     paa.add_argument("--utc", required=True, help="UTC ISO time, e.g., 2025-06-21T10:30:00Z")
+    _add_almanac_source_args(paa)
     paa.set_defaults(func=cmd_almanac_aries)
 
+
+def _add_star_finder_parser(sub) -> None:
+    # Star finder
+    psf = sub.add_parser("star-finder", help="Catalog stars within an altitude band over a UTC window (2102-D style)")
+    psf.add_argument("--lat", type=float, required=True, help="Assumed latitude (deg, +N, −S)")
+    psf.add_argument("--lon", type=float, required=True, help="Assumed longitude (deg, East +, West −)")
+    psf.add_argument("--start", required=True, help="Window start, UTC ISO time")
+    psf.add_argument("--end", required=True, help="Window end, UTC ISO time")
+    psf.add_argument("--step", type=float, default=1.0, help="Time step (minutes)")
+    psf.add_argument("--min-alt", type=float, default=15.0, help="Lowest useful altitude (deg)")
+    psf.add_argument("--max-alt", type=float, default=70.0, help="Highest useful altitude (deg)")
+    psf.add_argument("--max-mag", type=float, help="Skip stars fainter than this magnitude")
+    _add_almanac_source_args(psf)
+    psf.set_defaults(func=cmd_star_finder)
+
+
+def _add_srt_parser(sub) -> None:
     # SRT (Sight Reduction Table generator)
-    psrt = sub.add_parser("srt", help="Generate Hc/Zn across LHA range for given φ, δ (CSV)")
+    psrt = sub.add_parser("srt", help="Generate Hc/Zn across LHA range for given φ, δ (CSV or .npy)")
     psrt.add_argument("--mode", choices=["lha", "from-gha"], default="lha", help="Input is LHA directly or derive from GHA-λ")
     psrt.add_argument("--lat", type=float, required=True, help="Latitude (deg)")
     psrt.add_argument("--dec", type=float, required=True, help="Declination (deg)")
@@ -415,27 +662,105 @@ def build_parser() -> argparse.ArgumentParser:
     psrt.add_argument("--lha-start", type=float, required=True, help="Start LHA or GHA (deg)")
     psrt.add_argument("--lha-stop", type=float, required=True, help="Stop LHA or GHA (deg)")
     psrt.add_argument("--lha-step", type=float, default=5.0, help="Step (deg)")
+    psrt.add_argument("--table", help="Answer from a precomputed table file (see srt-build) instead of trigonometry")
+    psrt.add_argument("--out", help="Write rows to this file instead of stdout")
+    psrt.add_argument("--format", choices=["csv", "npy"], help="Output format (default: npy for *.npy paths, else csv)")
+    psrt.add_argument("--workers", type=int, default=1, help="Reduce chunks on N worker processes, 0 = all cores (output order kept)")
     psrt.set_defaults(func=cmd_srt)
 
+
+def _add_srt_build_parser(sub) -> None:
+    # SRT table store
+    psrtb = sub.add_parser("srt-build", help="Build the memory-mapped Hc/Zn table (Pub. 229 style) and report accuracy")
+    psrtb.add_argument("--out", required=True, help="Output table file path")
+    psrtb.add_argument("--samples", type=int, default=100000, help="Random sights used for the accuracy check")
+    psrtb.set_defaults(func=cmd_srt_build)
+
+
+def _add_fix_parser(sub) -> None:
     # Fix (multiple sights)
     pfix = sub.add_parser("fix", help="Compute position fix from multiple sights (JSON)")
     g = pfix.add_mutually_exclusive_group(required=True)
     g.add_argument("--file", help="Path to JSON file containing an array of sight dicts")
     g.add_argument("--json", help="Inline JSON array of sight dicts")
+    g.add_argument(
+        "--stream", nargs="?", const="-", metavar="NDJSON",
+        help="NDJSON sight records tagged with a fix ID, from a file or stdin ('-'); one result line per fix",
+    )
+    _add_almanac_source_args(pfix)
+    pfix.add_argument("--id-key", default="fix_id", help="Fix ID field of --stream records (default: fix_id)")
+    pfix.add_argument("--workers", type=int, default=1, help="--stream: solve on N worker processes, 0 = all cores (output order kept)")
+    prun = pfix.add_argument_group("running fix (sights need 'utc')")
+    prun.add_argument("--course", type=float, help="Course made good (deg true)")
+    prun.add_argument("--speed", type=float, help="Speed made good (knots)")
+    prun.add_argument("--track", help="DR track JSON file: [{\"utc\": ..., \"course\": ..., \"speed\": ...}, ...]")
+    prun.add_argument("--ref-utc", help="Time of the fix (default: latest sight)")
+    prob = pfix.add_argument_group("robust estimation")
+    prob.add_argument("--robust", choices=["huber", "tukey"], help="Down-weight outlying sights (IRLS)")
+    prob.add_argument("--outlier-sigma", type=float, default=3.0, help="Flag sights beyond this many robust sigmas")
+    prob.add_argument("--sigma", type=float, help="Sight standard deviation in minutes (default: from residuals)")
     pfix.set_defaults(func=cmd_fix)
 
+
+def _add_almanac_i_parser(sub) -> None:
     # Interactive Almanac
     pas_i = sub.add_parser("almanac-i", help="Interactive Almanac: prompt inputs, print narrative output")
     pas_i.set_defaults(func=cmd_almanac_interactive)
 
+
+def _add_srt_i_parser(sub) -> None:
     # Interactive SRT
     psrt_i = sub.add_parser("srt-i", help="Interactive SRT: prompt inputs, print line-by-line (no tables)")
     psrt_i.set_defaults(func=cmd_srt_interactive)
 
+
+def _add_serve_parser(sub) -> None:
+    pserve = sub.add_parser("serve", help="Long-running server: JSON-lines requests over stdin/stdout or a Unix socket")
+    pserve.add_argument("--socket", help="Listen on this Unix socket path (many clients, pipelined requests)")
+    pserve.add_argument("--stdio", action="store_true", help="Also serve stdin/stdout when --socket is given")
+    pserve.set_defaults(func=cmd_serve)
+
+
+# Subcommand name -> parser builder, in --help order
+_COMMANDS = {
+    "sun": _add_sun_parser,
+    "star": _add_star_parser,
+    "moon": _add_moon_parser,
+    "noon": _add_noon_parser,
+    "convert": _add_convert_parser,
+    "eot": _add_eot_parser,
+    "almanac-sun": _add_almanac_sun_parser,
+    "almanac-aries": _add_almanac_aries_parser,
+    "star-finder": _add_star_finder_parser,
+    "srt": _add_srt_parser,
+    "srt-build": _add_srt_build_parser,
+    "fix": _add_fix_parser,
+    "serve": _add_serve_parser,
+    "almanac-i": _add_almanac_i_parser,
+    "srt-i": _add_srt_i_parser,
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """The CLI parser; with a known command name only that subcommand's parser is built."""
+    p = argparse.ArgumentParser(
+        prog="celnav",
+        description=(
+            "Celestial Navigation CLI: Sun/Star/Moon sights, Noon sight, Almanac, SRT, time conversions, EoT.\n"
+            "Angles are decimal degrees (East positive longitude). Times can be decimal hours or HH:MM[:SS]."
+        ),
+    )
+    sub = p.add_subparsers(dest="cmd", required=True)
+    for name, add_parser in _COMMANDS.items():
+        if command is None or command not in _COMMANDS or name == command:
+            add_parser(sub)
     return p
 
 
 def main(argv: Optional[list] = None) -> int:
-    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # The first positional token names the subcommand (the top-level parser has only -h)
+    command = next((a for a in argv if not a.startswith("-")), None)
+    parser = build_parser(command)
     args = parser.parse_args(argv)
     return args.func(args)
@@ -1,6 +1,9 @@
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Tuple, Literal, List
+from typing import Tuple, Literal, List, Optional, Sequence
+
+from .timescale import epoch_seconds
 
 # -------------- Angle helpers (degrees) --------------
 
@@ -177,6 +180,16 @@ class Sight:
     gha_deg: float
     dec_deg: float
     Ho_deg: float
+    utc: Optional[str] = None  # UTC of the sight (ISO); needed for running fixes
+
+
+@dataclass
+class ErrorEllipse:
+    """1-sigma position error ellipse."""
+
+    semi_major_nm: float
+    semi_minor_nm: float
+    orientation_deg: float  # True bearing of the major axis, 0..180
 
 
 @dataclass
@@ -185,62 +198,108 @@ class FixResult:
     lon_deg: float
     rms_minutes: float
     num_sights: int
+    utc: Optional[str] = None  # Time the position refers to (running fixes)
+    # Covariance of (north, east) in nm² and derived quality figures
+    covariance_nm2: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
+    ellipse: Optional[ErrorEllipse] = None
+    dop: Optional[float] = None  # sqrt(trace((GᵀWG)⁻¹)), G rows = (cos Zn, sin Zn)
+    sigma_minutes: Optional[float] = None  # Sight standard deviation used for the covariance
+    weights: Optional[Tuple[float, ...]] = None  # Robust weight per sight (1 = full weight)
+    outliers: Tuple[int, ...] = ()  # Indices of sights flagged as outliers
+
+
+@dataclass
+class TrackLeg:
+    """DR leg: course and speed made good from start_utc until the next leg starts."""
+
+    start_utc: str
+    course_deg: float  # True course (deg)
+    speed_kn: float
+
+
+def dr_offset_nm(track: Sequence[TrackLeg], from_utc, to_utc) -> Tuple[float, float]:
+    """
+    Distance run (north, east) in nautical miles along a DR track between two UTC instants.
+    Legs must be in time order; the first leg also applies before its start, the last one after.
+    """
+    starts = [epoch_seconds(leg.start_utc) for leg in track]
+
+    def position(t: float) -> Tuple[float, float]:
+        k = max(0, bisect_right(starts, t) - 1)
+        north = east = 0.0
+        for i in range(k):
+            hours = (starts[i + 1] - starts[i]) / 3600.0
+            north += track[i].speed_kn * hours * cos_d(track[i].course_deg)
+            east += track[i].speed_kn * hours * sin_d(track[i].course_deg)
+        hours = (t - starts[k]) / 3600.0
+        return (
+            north + track[k].speed_kn * hours * cos_d(track[k].course_deg),
+            east + track[k].speed_kn * hours * sin_d(track[k].course_deg),
+        )
+
+    n0, e0 = position(epoch_seconds(from_utc))
+    n1, e1 = position(epoch_seconds(to_utc))
+    return n1 - n0, e1 - e0
+
+
+def _advance(lat: float, lon: float, north_nm: float, east_nm: float) -> Tuple[float, float]:
+    """Position after a (north, east) run in nm (plane sailing with mid-latitude departure)."""
+    dlat = north_nm / 60.0
+    return lat + dlat, lon + east_nm / (60.0 * cos_d(lat + 0.5 * dlat))
 
 
 def _lop_line(lat0: float, lon0: float, gha: float, dec: float, Ho: float) -> Tuple[float, float, float]:
     """
     Compute linearized LOP near (lat0, lon0): a*dlat + b*dlon = c, where dlon in degrees east, dlat in degrees.
-    Using partial derivatives of Hc with respect to φ and LHA, and dLHA = - dλ (east positive).
+    Uses the closed-form partial derivatives of Hc, expressed through the azimuth Zn:
+      dHc/dφ = cos Zn,  dHc/dλ = cos φ · sin Zn  (with LHA = GHA − λ, east positive)
     Returns (a, b, c) in minutes units: a*dlat + b*dlon = c.
     """
     lha = lha_from_gha_longitude(gha, lon0)
     hc, zn = compute_hc_zn(lat0, dec, lha)
-    dh_minutes = (Ho - hc) * 60.0
-    # partial derivatives dHc/dφ and dHc/dLHA in degrees per degree
-    # Hc(φ,δ,LHA) = asin(sinφ sinδ + cosφ cosδ cosLHA)
-    # dHc = (1/cos Hc) * (cosφ sinδ * dφ + (-sinφ cosδ cosLHA) * dφ + (-cosφ cosδ sinLHA) * dLHA)
-    # Simplify numerically via small deltas for robustness
-    d = 1e-5
-    hc_dphi, _ = compute_hc_zn(lat0 + d, dec, lha)
-    dH_dphi = (hc_dphi - hc) / d
-    hc_dlha, _ = compute_hc_zn(lat0, dec, (lha + d) % 360.0)
-    dH_dlha = (hc_dlha - hc) / d
-    # Relationship between longitude change and LHA: dLHA = - dλ (east positive)
-    dH_dlon = -dH_dlha
-    # Convert coefficients to minutes per degree (multiply both sides by 60)
-    a = 60.0 * dH_dphi
-    b = 60.0 * dH_dlon
-    c = dh_minutes
+    a = 60.0 * cos_d(zn)
+    b = 60.0 * cos_d(lat0) * sin_d(zn)
+    c = (Ho - hc) * 60.0
     return a, b, c
 
 
-def solve_fix_least_squares(sights: List[Sight]) -> FixResult:
-    if len(sights) < 2:
-        raise ValueError("At least two sights are required for a fix")
-
-    # Start from average of assumed positions
-    lat = sum(s.lat_assumed_deg for s in sights) / len(sights)
-    lon = sum(s.lon_assumed_deg for s in sights) / len(sights)
-
-    # Iterate Gauss-Newton for small corrections
-    for _ in range(6):
-        A_rows: List[Tuple[float, float]] = []
-        b_vec: List[float] = []
-        for s in sights:
-            a, b, c = _lop_line(lat, lon, s.gha_deg, s.dec_deg, s.Ho_deg)
-            A_rows.append((a, b))
-            b_vec.append(c)
-        # Normal equations: (A^T A) x = A^T b
-        A11 = sum(a * a for a, _ in A_rows)
-        A12 = sum(a * b for a, b in A_rows)
-        A22 = sum(b * b for _, b in A_rows)
-        B1 = sum(a * c for (a, _), c in zip(A_rows, b_vec))
-        B2 = sum(b * c for (_, b), c in zip(A_rows, b_vec))
-        det = A11 * A22 - A12 * A12
-        if abs(det) < 1e-9:
+HUBER_K = 1.345
+TUKEY_C = 4.685
+MIN_SCALE_MINUTES = 0.1  # Floor of the robust residual scale (sextant reading precision)
+DEFAULT_SIGMA_MINUTES = 1.0  # Sight standard deviation when it cannot be estimated
+
+
+def _solve_normal(A11: float, A12: float, A22: float, B1: float, B2: float) -> Optional[Tuple[float, float]]:
+    det = A11 * A22 - A12 * A12
+    if abs(det) < 1e-9:
+        return None
+    return (A22 * B1 - A12 * B2) / det, (-A12 * B1 + A11 * B2) / det
+
+
+def _gauss_newton(
+    sights: List[Sight],
+    offsets: List[Tuple[float, float]],
+    weights: List[float],
+    lat: float,
+    lon: float,
+    tol_deg: float,
+    max_iter: int,
+) -> Tuple[float, float]:
+    for _ in range(max_iter):
+        # Normal equations (A^T W A) x = A^T W c, accumulated directly
+        A11 = A12 = A22 = B1 = B2 = 0.0
+        for s, (north, east), w in zip(sights, offsets, weights):
+            lat_s, lon_s = _advance(lat, lon, north, east) if north or east else (lat, lon)
+            a, b, c = _lop_line(lat_s, lon_s, s.gha_deg, s.dec_deg, s.Ho_deg)
+            A11 += w * a * a
+            A12 += w * a * b
+            A22 += w * b * b
+            B1 += w * a * c
+            B2 += w * b * c
+        step = _solve_normal(A11, A12, A22, B1, B2)
+        if step is None:
             break
-        dlat = ( A22 * B1 - A12 * B2) / det  # in degrees
-        dlon = (-A12 * B1 + A11 * B2) / det  # in degrees (east +)
+        dlat, dlon = step  # in degrees (east + for dlon)
         lat += dlat
         lon += dlon
         # Keep latitude within valid bounds to avoid singularities
@@ -248,16 +307,178 @@ def solve_fix_least_squares(sights: List[Sight]) -> FixResult:
             lat = 89.9999
         elif lat < -89.9999:
             lat = -89.9999
-    # Compute RMS in minutes
-    residuals = []
-    for s in sights:
-        lha = lha_from_gha_longitude(s.gha_deg, lon)
-        hc, _ = compute_hc_zn(lat, s.dec_deg, lha)
-        residuals.append(((s.Ho_deg - hc) * 60.0))
-    if residuals:
-        rms = math.sqrt(sum(r * r for r in residuals) / len(residuals))
-    else:
-        rms = 0.0
+        if abs(dlat) < tol_deg and abs(dlon) < tol_deg:
+            break
+    return lat, lon
+
+
+def _robust_weight(u: float, method: str, k: float) -> float:
+    u = abs(u)
+    if method == "huber":
+        return 1.0 if u <= k else k / u
+    return (1.0 - (u / k) ** 2) ** 2 if u < k else 0.0
+
+
+def _median(values: List[float]) -> float:
+    v = sorted(values)
+    n = len(v)
+    return 0.5 * (v[(n - 1) // 2] + v[n // 2])
+
+
+def _irls(rows: List[Tuple[float, float, float]], method: str, k: float, tol_deg: float, max_iter: int) -> List[float]:
+    """
+    Robust weights for the LOP rows (a, b, c) linearized at the least-squares fix.
+    The per-sight normal-equation products are formed once; each reweighting pass only
+    re-sums them with new weights, so no trigonometry is repeated.
+    """
+    prods = [(a * a, a * b, b * b, a * c, b * c) for a, b, c in rows]
+    x1 = x2 = 0.0
+    weights = [1.0] * len(rows)
+    for _ in range(max_iter):
+        resid = [c - a * x1 - b * x2 for a, b, c in rows]
+        scale = max(1.4826 * _median([abs(r) for r in resid]), MIN_SCALE_MINUTES)
+        new_weights = [_robust_weight(r / scale, method, k) for r in resid]
+        A11 = A12 = A22 = B1 = B2 = 0.0
+        for w, (aa, ab, bb, ac, bc) in zip(new_weights, prods):
+            A11 += w * aa
+            A12 += w * ab
+            A22 += w * bb
+            B1 += w * ac
+            B2 += w * bc
+        step = _solve_normal(A11, A12, A22, B1, B2)
+        if step is None:
+            break  # too few sights left with weight: keep the previous weights
+        weights = new_weights
+        done = abs(step[0] - x1) < tol_deg and abs(step[1] - x2) < tol_deg
+        x1, x2 = step
+        if done:
+            break
+    return weights
+
+
+def _fix_quality(
+    rows: List[Tuple[float, float, float]], weights: List[float], lat: float, sigma: float
+) -> Tuple[Optional[Tuple[Tuple[float, float], Tuple[float, float]]], Optional[ErrorEllipse], Optional[float]]:
+    """Covariance (nm²), 1-sigma error ellipse and DOP from LOP rows at the final fix."""
+    # In (north, east) nm the LOP normal is (a/60, b/(60 cos φ)) = (cos Zn, sin Zn)
+    k_east = 60.0 * cos_d(lat)
+    N11 = N12 = N22 = 0.0
+    for w, (a, b, _) in zip(weights, rows):
+        gn = a / 60.0
+        ge = b / k_east
+        N11 += w * gn * gn
+        N12 += w * gn * ge
+        N22 += w * ge * ge
+    det = N11 * N22 - N12 * N12
+    if abs(det) < 1e-12:
+        return None, None, None
+    q11, q12, q22 = N22 / det, -N12 / det, N11 / det
+    dop = math.sqrt(q11 + q22)
+    var = sigma * sigma
+    c11, c12, c22 = var * q11, var * q12, var * q22
+    mean = 0.5 * (c11 + c22)
+    half = math.hypot(0.5 * (c11 - c22), c12)
+    ellipse = ErrorEllipse(
+        semi_major_nm=math.sqrt(mean + half),
+        semi_minor_nm=math.sqrt(max(mean - half, 0.0)),
+        orientation_deg=(0.5 * math.degrees(math.atan2(2.0 * c12, c11 - c22))) % 180.0,
+    )
+    return ((c11, c12), (c12, c22)), ellipse, dop
+
+
+def solve_fix_least_squares(
+    sights: List[Sight],
+    tol_deg: float = 1e-7,
+    max_iter: int = 20,
+    course_deg: Optional[float] = None,
+    speed_kn: Optional[float] = None,
+    track: Optional[Sequence[TrackLeg]] = None,
+    ref_utc: Optional[str] = None,
+    robust: Optional[Literal["huber", "tukey"]] = None,
+    robust_k: Optional[float] = None,
+    outlier_sigma: float = 3.0,
+    sigma_minutes: Optional[float] = None,
+) -> FixResult:
+    """
+    Gauss-Newton fix from two or more sights.
+    Iterates until the position correction drops below tol_deg (or max_iter is reached).
+
+    Running fix: with course_deg/speed_kn (or a DR track) every sight needs its utc. The
+    solved position is the one at ref_utc (default: time of the latest sight); each sight is
+    linearized at that position advanced (or retarded) along the track to the sight's time.
+
+    Robust mode ("huber" or "tukey", tuning constant robust_k): iteratively reweighted least
+    squares on the LOPs linearized at the least-squares fix, followed by a weighted
+    Gauss-Newton refinement. Sights whose residual exceeds outlier_sigma times the robust
+    scale (1.4826·MAD) are reported in ``outliers``.
+
+    The covariance uses sigma_minutes if given, else the robust scale, else the residual
+    standard deviation (n − 2 degrees of freedom; DEFAULT_SIGMA_MINUTES with two sights).
+    """
+    if len(sights) < 2:
+        raise ValueError("At least two sights are required for a fix")
+    if robust not in (None, "huber", "tukey"):
+        raise ValueError(f"Unknown robust method: {robust}")
+
+    offsets = [(0.0, 0.0)] * len(sights)
+    if course_deg is not None or speed_kn is not None or track is not None:
+        if any(s.utc is None for s in sights):
+            raise ValueError("Running fix requires a UTC time on every sight")
+        if ref_utc is None:
+            ref_utc = max(sights, key=lambda s: epoch_seconds(s.utc)).utc
+        if track is None:
+            if course_deg is None or speed_kn is None:
+                raise ValueError("Running fix requires both course and speed (or a DR track)")
+            track = [TrackLeg(ref_utc, course_deg, speed_kn)]
+        offsets = [dr_offset_nm(track, ref_utc, s.utc) for s in sights]
+
+    def lop_rows(lat: float, lon: float) -> List[Tuple[float, float, float]]:
+        rows = []
+        for s, (north, east) in zip(sights, offsets):
+            lat_s, lon_s = _advance(lat, lon, north, east) if north or east else (lat, lon)
+            rows.append(_lop_line(lat_s, lon_s, s.gha_deg, s.dec_deg, s.Ho_deg))
+        return rows
+
+    # Start from average of assumed positions
+    lat = sum(s.lat_assumed_deg for s in sights) / len(sights)
+    lon = sum(s.lon_assumed_deg for s in sights) / len(sights)
+    weights = [1.0] * len(sights)
+    lat, lon = _gauss_newton(sights, offsets, weights, lat, lon, tol_deg, max_iter)
+    rows = lop_rows(lat, lon)  # c = residual Ho − Hc in minutes
+
+    scale = None
+    if robust is not None:
+        k = robust_k if robust_k is not None else (HUBER_K if robust == "huber" else TUKEY_C)
+        weights = _irls(rows, robust, k, tol_deg, 50)
+        lat, lon = _gauss_newton(sights, offsets, weights, lat, lon, tol_deg, max_iter)
+        rows = lop_rows(lat, lon)
+        scale = max(1.4826 * _median([abs(c) for _, _, c in rows]), MIN_SCALE_MINUTES)
+
+    # RMS in minutes (all sights, unweighted)
+    residuals = [c for _, _, c in rows]
+    rms = math.sqrt(sum(r * r for r in residuals) / len(residuals))
+    if sigma_minutes is None:
+        if scale is not None:
+            sigma_minutes = scale
+        elif len(sights) > 2:
+            sigma_minutes = math.sqrt(sum(r * r for r in residuals) / (len(sights) - 2))
+        else:
+            sigma_minutes = DEFAULT_SIGMA_MINUTES
+    covariance, ellipse, dop = _fix_quality(rows, weights, lat, sigma_minutes)
+    outliers = () if scale is None else tuple(i for i, r in enumerate(residuals) if abs(r) > outlier_sigma * scale)
+
     # Normalize longitude to [-180, 180) for presentation
     lon_norm = ((lon + 180.0) % 360.0) - 180.0
-    return FixResult(lat_deg=lat, lon_deg=lon_norm, rms_minutes=rms, num_sights=len(sights))
+    return FixResult(
+        lat_deg=lat,
+        lon_deg=lon_norm,
+        rms_minutes=rms,
+        num_sights=len(sights),
+        utc=ref_utc,
+        covariance_nm2=covariance,
+        ellipse=ellipse,
+        dop=dop,
+        sigma_minutes=sigma_minutes,
+        weights=None if robust is None else tuple(weights),
+        outliers=outliers,
+    )
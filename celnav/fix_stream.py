@@ -0,0 +1,153 @@
+"""Streaming fixes over NDJSON sight archives (``celnav fix --stream``).
+
+One sight record per line, tagged with a fix ID. The pipeline is a chain of generators:
+lines -> records -> groups of consecutive records with the same fix ID -> one result per
+group, so memory holds a single fix's sights however large the input. Records of one fix
+must therefore be contiguous (an ID that reappears later starts a new fix).
+
+With several workers (:func:`solve_stream_parallel`) the reader only splits the input into
+chunks of whole fixes; each chunk goes to a worker process as raw NDJSON text and comes back
+as result records, in input order.
+"""
+
+import json
+import math
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .core import FixResult, Sight, solve_fix_least_squares
+
+DEFAULT_ID_KEY = "fix_id"
+DEFAULT_CHUNK_FIXES = 256  # fixes per worker task
+
+Record = Dict[str, Any]
+
+
+def _read_lines(lines: Iterable[str]) -> Iterator[Tuple[Record, str]]:
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {n}: invalid JSON ({e.msg})") from None
+        if not isinstance(rec, dict):
+            raise ValueError(f"line {n}: expected a JSON object")
+        yield rec, line
+
+
+def read_records(lines: Iterable[str]) -> Iterator[Record]:
+    """Parse NDJSON lines, skipping blank ones; a malformed line raises ValueError with its number."""
+    for rec, _ in _read_lines(lines):
+        yield rec
+
+
+def group_by_fix(records: Iterable[Record], id_key: str = DEFAULT_ID_KEY) -> Iterator[Tuple[Any, List[Record]]]:
+    """(fix ID, records) for each run of consecutive records sharing an ID."""
+    for fix_id, group in groupby(records, key=lambda r: r.get(id_key)):
+        yield fix_id, list(group)
+
+
+def solve_group(
+    fix_id: Any,
+    records: List[Record],
+    to_sight: Callable[[Record], Sight],
+    solve_kwargs: Optional[Dict[str, Any]] = None,
+) -> Record:
+    """Solve one fix and return its output record ({id, "error"} if its sights cannot be solved)."""
+    try:
+        sights = [to_sight(r) for r in records]
+        fix = solve_fix_least_squares(sights, **(solve_kwargs or {}))
+    except (SystemExit, ValueError, KeyError, TypeError) as e:
+        # Record-level problems (missing fields, unknown star, < 2 sights) fail this fix only
+        msg = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+        return {"fix_id": fix_id, "num_sights": len(records), "error": msg}
+    return fix_record(fix_id, fix)
+
+
+def _finite(x: Optional[float], ndigits: int) -> Optional[float]:
+    return None if x is None or not math.isfinite(x) else round(x, ndigits)
+
+
+def fix_record(fix_id: Any, fix: FixResult) -> Record:
+    out: Record = {
+        "fix_id": fix_id,
+        "lat": round(fix.lat_deg, 7),
+        "lon": round(fix.lon_deg, 7),
+        "rms_minutes": round(fix.rms_minutes, 4),
+        "num_sights": fix.num_sights,
+    }
+    if fix.utc is not None:
+        out["utc"] = fix.utc
+    if fix.ellipse is not None:
+        out["ellipse_nm"] = [
+            _finite(fix.ellipse.semi_major_nm, 4),
+            _finite(fix.ellipse.semi_minor_nm, 4),
+            _finite(fix.ellipse.orientation_deg, 2),
+        ]
+        out["dop"] = _finite(fix.dop, 4)
+    if fix.outliers:
+        out["outliers"] = list(fix.outliers)
+    return out
+
+
+def solve_stream(
+    lines: Iterable[str],
+    to_sight: Callable[[Record], Sight],
+    id_key: str = DEFAULT_ID_KEY,
+    solve_kwargs: Optional[Dict[str, Any]] = None,
+) -> Iterator[Record]:
+    """Output records, in input order, for an NDJSON sight stream."""
+    for fix_id, records in group_by_fix(read_records(lines), id_key):
+        yield solve_group(fix_id, records, to_sight, solve_kwargs)
+
+
+def _fix_chunks(lines: Iterable[str], id_key: str, chunk_fixes: int) -> Iterator[List[Tuple[Any, str]]]:
+    """Lists of (fix ID, NDJSON text of its records), chunk_fixes fixes at a time."""
+    chunk: List[Tuple[Any, str]] = []
+    for fix_id, group in groupby(_read_lines(lines), key=lambda item: item[0].get(id_key)):
+        chunk.append((fix_id, "\n".join(line for _, line in group)))
+        if len(chunk) >= chunk_fixes:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Per-process sight builder and solver options (set by the pool initializer)
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(make_to_sight: Callable[[], Callable[[Record], Sight]], solve_kwargs: Optional[Dict[str, Any]]) -> None:
+    _WORKER["to_sight"] = make_to_sight()
+    _WORKER["solve_kwargs"] = solve_kwargs
+
+
+def _solve_chunk(chunk: List[Tuple[Any, str]]) -> List[Record]:
+    to_sight, solve_kwargs = _WORKER["to_sight"], _WORKER["solve_kwargs"]
+    return [
+        solve_group(fix_id, [json.loads(line) for line in text.split("\n")], to_sight, solve_kwargs)
+        for fix_id, text in chunk
+    ]
+
+
+def solve_stream_parallel(
+    lines: Iterable[str],
+    make_to_sight: Callable[[], Callable[[Record], Sight]],
+    workers: int,
+    id_key: str = DEFAULT_ID_KEY,
+    solve_kwargs: Optional[Dict[str, Any]] = None,
+    chunk_fixes: int = DEFAULT_CHUNK_FIXES,
+) -> Iterator[Record]:
+    """
+    :func:`solve_stream` on a process pool; same records, same order.
+
+    make_to_sight is a picklable zero-argument callable (e.g. a functools.partial of a
+    module-level function) that builds the record -> Sight converter inside each worker.
+    """
+    from .parallel import ordered_map
+
+    chunks = _fix_chunks(lines, id_key, chunk_fixes)
+    for results in ordered_map(_solve_chunk, chunks, workers, initializer=_init_worker, initargs=(make_to_sight, solve_kwargs)):
+        yield from results
@@ -0,0 +1,129 @@
+"""Process-pool helpers for bulk fixes and sight reduction (``--workers N``).
+
+Work is cut into chunks that cross the process boundary cheaply: column arrays for batch
+fixes, index ranges for sight-reduction tables, and raw NDJSON text for streamed fixes.
+Results come back in input order. At most ``workers * prefetch`` chunks are in flight, so
+streaming jobs keep bounded memory. ``workers <= 1`` runs the same code in process.
+"""
+
+import os
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import BatchFixResult, solve_fix_batch
+
+DEFAULT_FIX_CHUNK = 2048  # fixes per batch-solver task
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def ordered_map(
+    fn: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    workers: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple = (),
+    prefetch: int = 2,
+) -> Iterator[Any]:
+    """fn over tasks on a process pool, yielding results in task order.
+
+    tasks is consumed lazily; fn and every task must be picklable. initializer(*initargs)
+    runs once per worker process (once in process when workers <= 1).
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(fn, tasks)
+        return
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing is slow to import
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending: Deque = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, task))
+            if len(pending) >= workers * prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _solve_fix_chunk(task: Tuple[Sequence[np.ndarray], int, dict]) -> BatchFixResult:
+    columns, num_fixes, kwargs = task
+    return solve_fix_batch(*columns, num_fixes=num_fixes, **kwargs)
+
+
+def solve_fix_batch_parallel(
+    lat_assumed_deg,
+    lon_assumed_deg,
+    gha_deg,
+    dec_deg,
+    Ho_deg,
+    fix_index,
+    workers: int,
+    chunk_fixes: int = DEFAULT_FIX_CHUNK,
+    offset_north_nm=None,
+    offset_east_nm=None,
+    **kwargs,
+) -> BatchFixResult:
+    """
+    :func:`celnav.batch.solve_fix_batch` split into blocks of chunk_fixes fixes on a process pool.
+
+    Rows are sorted by fix (stably) and each block is shipped as contiguous arrays; the result
+    is the same as one solve_fix_batch call, with per-sight fields in the input row order.
+    Extra keyword arguments (tol_deg, robust, ...) are passed through.
+    """
+    group = np.asarray(fix_index, dtype=np.intp)
+    num_fixes = int(group.max()) + 1 if group.size else 0
+    order = np.argsort(group, kind="stable")
+    group_sorted = group[order]
+    cols = [np.asarray(c, dtype=float)[order] for c in (lat_assumed_deg, lon_assumed_deg, gha_deg, dec_deg, Ho_deg)]
+    running = offset_north_nm is not None or offset_east_nm is not None
+    if running:
+        for off in (offset_north_nm, offset_east_nm):
+            cols.append(np.broadcast_to(np.asarray(0.0 if off is None else off, dtype=float), group.shape)[order])
+
+    bounds = np.searchsorted(group_sorted, np.arange(0, num_fixes + chunk_fixes, chunk_fixes))
+
+    def tasks():
+        for i, f0 in enumerate(range(0, num_fixes, chunk_fixes)):
+            r0, r1 = bounds[i], bounds[i + 1]
+            part = [c[r0:r1] for c in cols]
+            columns = part[:5] + [group_sorted[r0:r1] - f0]
+            kw = dict(kwargs)
+            if running:
+                kw.update(offset_north_nm=part[5], offset_east_nm=part[6])
+            yield columns, min(chunk_fixes, num_fixes - f0), kw
+
+    parts = list(ordered_map(_solve_fix_chunk, tasks(), workers))
+    if not parts:
+        return solve_fix_batch(*cols[:5], group_sorted, num_fixes=0, **kwargs)
+
+    def join(name: str, per_sight: bool = False):
+        values = [getattr(p, name) for p in parts]
+        if values[0] is None:
+            return None
+        joined = np.concatenate(values)
+        if per_sight:
+            unsorted = np.empty_like(joined)
+            unsorted[order] = joined
+            return unsorted
+        return joined
+
+    return BatchFixResult(
+        lat_deg=join("lat_deg"),
+        lon_deg=join("lon_deg"),
+        rms_minutes=join("rms_minutes"),
+        num_sights=join("num_sights"),
+        covariance_nm2=join("covariance_nm2"),
+        ellipse_major_nm=join("ellipse_major_nm"),
+        ellipse_minor_nm=join("ellipse_minor_nm"),
+        ellipse_orientation_deg=join("ellipse_orientation_deg"),
+        dop=join("dop"),
+        sigma_minutes=join("sigma_minutes"),
+        weights=join("weights", per_sight=True),
+        outlier=join("outlier", per_sight=True),
+    )
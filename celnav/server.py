@@ -0,0 +1,320 @@
+"""Long-running request server (``celnav serve``): line-delimited JSON over stdin/stdout or a Unix socket.
+
+One request per line::
+
+    {"id": 7, "op": "sun", "args": {"lat": 36, "lon": 25, "gha": 150.33, "dec": 10.25, "hs": 45.2}}
+
+``op`` is a CLI subcommand (sun, star, moon, noon, fix, almanac-sun, almanac-aries, srt) or one
+of ``ping`` / ``stats``. ``args`` uses the subcommand's option names (``--hp-min`` -> ``hp_min``)
+with the same defaults and choices; ``fix`` takes its sights as ``"sights": [...]``. Each
+reply echoes ``id`` and carries ``ok``, ``result`` (or ``error``) and the handling time ``ms``.
+
+The process keeps modules, the star catalog, almanac tables and the timescale caches warm
+between requests. On the socket every connection is served by its own thread and may pipeline
+requests; replies on a connection come back in request order.
+"""
+
+import argparse
+import json
+import math
+import os
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, TextIO, Tuple
+
+from . import cli
+
+LATENCY_WINDOW = 100_000  # latencies kept per op for the percentiles
+MAX_SRT_ROWS = 1_000_000
+
+Request = Dict[str, Any]
+
+
+class LatencyStats:
+    """Per-op request latencies (most recent LATENCY_WINDOW of each) and their percentiles."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self._ms: Dict[str, Deque[float]] = {}
+        self._count: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+
+    def record(self, op: str, ms: float, ok: bool) -> None:
+        with self._lock:
+            if op not in self._ms:
+                self._ms[op] = deque(maxlen=self._window)
+                self._count[op] = self._errors[op] = 0
+            self._ms[op].append(ms)
+            self._count[op] += 1
+            self._errors[op] += not ok
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            snapshot = {op: (sorted(v), self._count[op], self._errors[op]) for op, v in self._ms.items()}
+        out = {}
+        for op, (ms, count, errors) in sorted(snapshot.items()):
+            out[op] = {
+                "count": count,
+                "errors": errors,
+                "p50_ms": _percentile(ms, 50.0),
+                "p90_ms": _percentile(ms, 90.0),
+                "p99_ms": _percentile(ms, 99.0),
+                "max_ms": ms[-1],
+            }
+        return out
+
+    def report(self) -> str:
+        lines = [f"{'op':<14}{'count':>9}{'errors':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for op, s in self.summary().items():
+            lines.append(
+                f"{op:<14}{s['count']:>9}{s['errors']:>8}{s['p50_ms']:>10.3f}{s['p90_ms']:>10.3f}"
+                f"{s['p99_ms']:>10.3f}{s['max_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values, q: float) -> float:
+    """Nearest-rank percentile of a non-empty sorted list."""
+    k = max(0, math.ceil(q / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+# -------------------- Arguments --------------------
+
+@lru_cache(maxsize=None)
+def _arg_spec(op: str) -> Tuple[Dict[str, argparse.Action], Dict[str, Any]]:
+    """(dest -> action, defaults) of a CLI subcommand, read from its argparse definition."""
+    parser = cli.build_parser(op)
+    sub = parser._subparsers._group_actions[0].choices[op]
+    actions = {a.dest: a for a in sub._actions if a.dest != "help"}
+    defaults = {dest: a.default for dest, a in actions.items()}
+    defaults.update(sub._defaults)
+    return actions, defaults
+
+
+def _convert(op: str, key: str, action: argparse.Action, value: Any) -> Any:
+    """One argument value through the option's type and choices, as argparse would."""
+    if value is not None and action.type is not None:
+        value = action.type(value)
+    if action.choices is not None and value not in action.choices:
+        raise ValueError(f"{op}: {key} must be one of {list(action.choices)}")
+    return value
+
+
+def _namespace(op: str, params: Dict[str, Any]) -> argparse.Namespace:
+    """CLI-equivalent Namespace for a request: defaults, required options, types and choices."""
+    actions, defaults = _arg_spec(op)
+    values = dict(defaults)
+    for key, value in params.items():
+        dest = key.replace("-", "_")
+        action = actions.get(dest)
+        if action is None:
+            raise ValueError(f"{op}: unknown argument {key!r}")
+        many = isinstance(action, argparse._AppendAction) or action.nargs not in (None, "?")
+        if many and value is not None:
+            value = [_convert(op, key, action, v) for v in (value if isinstance(value, list) else [value])]
+        else:
+            value = _convert(op, key, action, value)
+        values[dest] = value
+    missing = [dest for dest, a in actions.items() if a.required and values[dest] is None]
+    if missing:
+        raise ValueError(f"{op}: missing argument(s): {', '.join(missing)}")
+    return argparse.Namespace(**values)
+
+
+# -------------------- Operations --------------------
+
+@lru_cache(maxsize=16)
+def _lookups(almanac: str, almanac_file: Optional[Tuple[str, ...]]):
+    """Almanac lookups per source, built once (table files stay open between requests)."""
+    return cli._almanac_lookups(
+        argparse.Namespace(almanac=almanac, almanac_file=list(almanac_file) if almanac_file else None)
+    )
+
+
+def _ns_lookups(args: argparse.Namespace):
+    return _lookups(args.almanac, tuple(args.almanac_file) if args.almanac_file else None)
+
+
+def _op_almanac_sun(args: argparse.Namespace) -> Dict[str, Any]:
+    sun = _ns_lookups(args)[0](args.utc)
+    return {"gha": sun.gha_deg, "dec": sun.dec_deg}
+
+
+def _op_almanac_aries(args: argparse.Namespace) -> Dict[str, Any]:
+    return {"gha": _ns_lookups(args)[1](args.utc).gha_deg}
+
+
+def _op_fix(args: argparse.Namespace, sights) -> Dict[str, Any]:
+    from .core import solve_fix_least_squares
+    from .fix_stream import fix_record
+
+    if not isinstance(sights, list):
+        raise ValueError("fix: 'sights' must be a list of sight objects")
+    sun_lookup, aries_lookup = _ns_lookups(args)
+    fix = solve_fix_least_squares(
+        [cli._sight_from_record(s, sun_lookup, aries_lookup) for s in sights], **cli._fix_solve_kwargs(args)
+    )
+    out = fix_record(None, fix)
+    del out["fix_id"]
+    return out
+
+
+def _op_srt(args: argparse.Namespace) -> Dict[str, Any]:
+    if cli._srt_row_count(args.lha_start, args.lha_stop, args.lha_step) > MAX_SRT_ROWS:
+        raise ValueError(f"srt: more than {MAX_SRT_ROWS} rows requested; use the srt command with --out")
+    args.workers = 1
+    lha, hc, zn = [], [], []
+    for a, h, z in cli._srt_chunks(args):
+        lha += a.tolist()
+        hc += h.tolist()
+        zn += z.tolist()
+    return {"lha": lha, "hc": hc, "zn": zn}
+
+
+_OPS: Dict[str, Callable[[argparse.Namespace], Dict[str, Any]]] = {
+    "sun": cli._sun_sight,
+    "star": cli._star_sight,
+    "moon": cli._moon_sight,
+    "noon": cli._noon_sight,
+    "almanac-sun": _op_almanac_sun,
+    "almanac-aries": _op_almanac_aries,
+    "srt": _op_srt,
+}
+
+OPERATIONS = tuple(_OPS) + ("fix", "ping", "stats")
+
+
+class Server:
+    """Request dispatch plus latency statistics; shared by all transports."""
+
+    def __init__(self) -> None:
+        self.stats = LatencyStats()
+
+    def warm_up(self) -> None:
+        """Import the operation modules and fill the catalog/almanac caches before the first request."""
+        from . import batch, core, fix_stream  # noqa: F401  (NumPy comes with batch)
+        from .stars import star_columns
+
+        star_columns()
+        for op in _OPS:
+            _arg_spec(op)
+        _arg_spec("fix")
+        _lookups("series", None)[0]("2000-01-01T00:00Z")
+
+    def handle(self, req: Request) -> Request:
+        t0 = time.perf_counter()
+        op = req.get("op") if isinstance(req, dict) else None
+        reply: Request = {"id": req.get("id") if isinstance(req, dict) else None}
+        try:
+            reply["result"] = self._dispatch(op, req)
+            reply["ok"] = True
+        except (SystemExit, ValueError, KeyError, TypeError) as e:
+            # Bad input fails this request only (SystemExit: the CLI's own input checks)
+            reply["ok"] = False
+            reply["error"] = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+        except Exception as e:
+            # Anything else (unreadable almanac file, ...) also fails this request only
+            reply["ok"] = False
+            reply["error"] = f"{type(e).__name__}: {e}"
+        ms = (time.perf_counter() - t0) * 1e3
+        reply["ms"] = round(ms, 4)
+        self.stats.record(op if op in OPERATIONS else "invalid", ms, reply["ok"])
+        return reply
+
+    def _dispatch(self, op: Optional[str], req: Request) -> Any:
+        if op == "ping":
+            return "pong"
+        if op == "stats":
+            return self.stats.summary()
+        params = req.get("args") or {}
+        if not isinstance(params, dict):
+            raise ValueError("'args' must be an object")
+        if op == "fix":
+            params = dict(params)
+            sights = params.pop("sights", None)
+            return _op_fix(_namespace("fix", params), sights)
+        handler = _OPS.get(op)
+        if handler is None:
+            raise ValueError(f"unknown op {op!r}; expected one of {', '.join(OPERATIONS)}")
+        return handler(_namespace(op, params))
+
+    def handle_line(self, line: str) -> Optional[str]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            reply = {"id": None, "ok": False, "error": f"invalid JSON ({e.msg})"}
+            self.stats.record("invalid", 0.0, False)
+        else:
+            reply = self.handle(req)
+        return json.dumps(reply, separators=(",", ":"))
+
+    def serve_lines(self, lines: Iterable[str], out: TextIO) -> None:
+        """Answer each request line with one reply line, flushing after every reply."""
+        for line in lines:
+            reply = self.handle_line(line)
+            if reply is not None:
+                out.write(reply + "\n")
+                out.flush()
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: Server = self.server.celnav  # type: ignore[attr-defined]
+        for raw in self.rfile:
+            reply = server.handle_line(raw.decode("utf-8"))
+            if reply is not None:
+                self.wfile.write(reply.encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+
+class UnixSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, server: Server) -> None:
+        self.celnav = server
+        super().__init__(path, _ConnectionHandler)
+
+
+def serve_unix(path: str, server: Server) -> UnixSocketServer:
+    """Bind the socket and serve it on a background thread; stop with ``shutdown()``."""
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise ValueError(f"{path} exists and is not a socket")
+        os.unlink(path)  # stale socket from an earlier run
+    srv = UnixSocketServer(path, server)
+    threading.Thread(target=srv.serve_forever, name="celnav-serve", daemon=True).start()
+    return srv
+
+
+def run(socket_path: Optional[str], stdio: bool, stats_out: TextIO = sys.stderr) -> int:
+    """Entry point of ``celnav serve``; prints latency percentiles on exit."""
+    server = Server()
+    server.warm_up()
+    srv = serve_unix(socket_path, server) if socket_path else None
+    if srv is not None:
+        print(f"celnav serve: listening on {socket_path}", file=stats_out, flush=True)
+    try:
+        if stdio:
+            server.serve_lines(sys.stdin, sys.stdout)
+        elif srv is not None:
+            threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if srv is not None:
+            srv.shutdown()
+            srv.server_close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+        print(server.stats.report(), file=stats_out)
+    return 0
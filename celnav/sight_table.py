@@ -0,0 +1,168 @@
+"""Precomputed sight reduction table (Pub. 229 style) stored as a memory-mapped file.
+
+The table is a dense grid of Hc/Zn over whole degrees of latitude (0..90), declination
+(−90..90) and LHA (0..359). South latitudes are answered through the symmetry
+Hc(−φ, −δ, LHA) = Hc(φ, δ, LHA), Zn(−φ, −δ, LHA) = 180° − Zn(φ, δ, LHA).
+
+File layout (little endian):
+  header  64 bytes: magic b"CNSRT", version u16, lat/dec/LHA axis (start, count) as i16 pairs
+  data    float32[lat, dec, lha, 5], C order, with per node:
+          Hc, Zn (degrees) and dHc/dφ, dHc/dδ, dHc/dLHA (degrees per degree)
+
+Like the "d" column of Pub. 229 the stored partials let the lookup correct the linear
+interpolation: each of the eight surrounding nodes contributes its Hc advanced halfway along
+its tangent plane, which makes the blend accurate to O(h³) without any trigonometry at lookup
+time. Zn is interpolated linearly with wrap-around handling. Only the neighbouring cells are
+read, so the file is shared through the OS page cache instead of being loaded by every process.
+"""
+
+import os
+import struct
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from .batch import compute_hc_zn_batch
+
+MAGIC = b"CNSRT"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER_FMT = "<5sH6h"
+_FIELDS = 5  # Hc, Zn, dHc/dφ, dHc/dδ, dHc/dLHA
+
+LAT_START, LAT_COUNT = 0, 91
+DEC_START, DEC_COUNT = -90, 181
+LHA_START, LHA_COUNT = 0, 360
+
+
+@dataclass
+class TableBuildReport:
+    path: str
+    build_seconds: float
+    file_bytes: int
+
+
+def build_sight_table(path: str) -> TableBuildReport:
+    """Compute the full Hc/Zn grid and write it to path, one latitude slab at a time."""
+    t0 = time.perf_counter()
+    header = struct.pack(
+        _HEADER_FMT, MAGIC, VERSION,
+        LAT_START, LAT_COUNT, DEC_START, DEC_COUNT, LHA_START, LHA_COUNT,
+    ).ljust(HEADER_SIZE, b"\0")
+    dec = np.arange(DEC_START, DEC_START + DEC_COUNT, dtype=float)[:, None]
+    lha = np.arange(LHA_START, LHA_START + LHA_COUNT, dtype=float)[None, :]
+    slab = np.empty((DEC_COUNT, LHA_COUNT, _FIELDS), dtype="<f4")
+    with open(path, "wb") as f:
+        f.write(header)
+        for lat in range(LAT_START, LAT_START + LAT_COUNT):
+            hc, zn = compute_hc_zn_batch(float(lat), dec, lha)
+            slab[..., 0] = hc
+            slab[..., 1] = zn
+            slab[..., 2:] = np.stack(_hc_partials(float(lat), dec, lha, hc, zn), axis=-1)
+            f.write(slab.tobytes())
+    return TableBuildReport(path=path, build_seconds=time.perf_counter() - t0, file_bytes=os.path.getsize(path))
+
+
+def _hc_partials(lat_deg, dec_deg, lha_deg, hc_deg, zn_deg):
+    """Closed-form dHc/dφ, dHc/dδ, dHc/dLHA (degrees per degree) at the grid nodes."""
+    lat_r = np.radians(lat_deg)
+    dec_r = np.radians(dec_deg)
+    zn_r = np.radians(zn_deg)
+    cos_hc = np.cos(np.radians(hc_deg))
+    d_lat = np.cos(zn_r)
+    d_lha = -np.cos(lat_r) * np.sin(zn_r)
+    num = np.sin(lat_r) * np.cos(dec_r) - np.cos(lat_r) * np.sin(dec_r) * np.cos(np.radians(lha_deg))
+    d_dec = np.where(cos_hc > 1e-12, num / np.where(cos_hc > 1e-12, cos_hc, 1.0), 0.0)
+    return (
+        np.broadcast_to(d_lat, np.shape(hc_deg)),
+        np.broadcast_to(d_dec, np.shape(hc_deg)),
+        np.broadcast_to(d_lha, np.shape(hc_deg)),
+    )
+
+
+class SightReductionTable:
+    """Read-only view of a table file; see :func:`open_sight_table` for the cached opener."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+        magic, version, lat0, nlat, dec0, ndec, lha0, nlha = struct.unpack_from(_HEADER_FMT, raw)
+        if magic != MAGIC:
+            raise ValueError(f"Not a sight reduction table: {path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported sight reduction table version {version}")
+        self.path = path
+        self.lat_start, self.dec_start, self.lha_start = lat0, dec0, lha0
+        self.grid = np.memmap(path, dtype="<f4", mode="r", offset=HEADER_SIZE, shape=(nlat, ndec, nlha, _FIELDS))
+
+    def lookup(self, lat_deg, dec_deg, lha_deg) -> Tuple[np.ndarray, np.ndarray]:
+        """Interpolated Hc and Zn (degrees) for broadcast φ, δ, LHA — no trigonometry involved."""
+        lat, dec, lha = np.broadcast_arrays(
+            np.asarray(lat_deg, dtype=float), np.asarray(dec_deg, dtype=float), np.asarray(lha_deg, dtype=float)
+        )
+        south = lat < 0
+        lat = np.where(south, -lat, lat)
+        dec = np.where(south, -dec, dec)
+        nlat, ndec, nlha, _ = self.grid.shape
+
+        x = lat - self.lat_start
+        i = np.clip(np.floor(x).astype(np.intp), 0, nlat - 2)
+        fi = x - i
+        y = dec - self.dec_start
+        j = np.clip(np.floor(y).astype(np.intp), 0, ndec - 2)
+        fj = y - j
+        z = (lha - self.lha_start) % 360.0
+        k = np.floor(z).astype(np.intp) % nlha
+        fk = z - np.floor(z)
+        k1 = (k + 1) % nlha
+
+        hc = np.zeros(lat.shape)
+        zn_delta = np.zeros(lat.shape)
+        zn_ref = self.grid[i, j, k, 1].astype(float)
+        for di, wi in ((0, 1.0 - fi), (1, fi)):
+            for dj, wj in ((0, 1.0 - fj), (1, fj)):
+                for dk, kk, wk in ((0, k, 1.0 - fk), (1, k1, fk)):
+                    cell = self.grid[i + di, j + dj, kk]
+                    w = wi * wj * wk
+                    # Node value advanced halfway along its tangent plane towards the query point
+                    step = cell[..., 2] * (fi - di) + cell[..., 3] * (fj - dj) + cell[..., 4] * (fk - dk)
+                    hc += w * (cell[..., 0] + 0.5 * step)
+                    zn_delta += w * (((cell[..., 1] - zn_ref + 180.0) % 360.0) - 180.0)
+        zn = (zn_ref + zn_delta) % 360.0
+        zn = np.where(south, (180.0 - zn) % 360.0, zn)
+        return hc, zn
+
+
+@lru_cache(maxsize=4)
+def open_sight_table(path: str) -> SightReductionTable:
+    """Open (once per process) a table file written by :func:`build_sight_table`."""
+    return SightReductionTable(path)
+
+
+def table_accuracy(table: SightReductionTable, samples: int = 100_000, seed: int = 0, max_alt_deg: float = 85.0) -> dict:
+    """
+    Compare table lookups with :func:`celnav.batch.compute_hc_zn_batch` on random sights.
+    Only sights between 0° and max_alt_deg are scored (Zn is ill-conditioned near the zenith).
+    """
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(-89.0, 89.0, samples)
+    dec = rng.uniform(-89.0, 89.0, samples)
+    lha = rng.uniform(0.0, 360.0, samples)
+    hc_ref, zn_ref = compute_hc_zn_batch(lat, dec, lha)
+    keep = (hc_ref >= 0.0) & (hc_ref <= max_alt_deg)
+    t0 = time.perf_counter()
+    hc, zn = table.lookup(lat[keep], dec[keep], lha[keep])
+    lookup_seconds = time.perf_counter() - t0
+    dhc = (hc - hc_ref[keep]) * 60.0
+    dzn = ((zn - zn_ref[keep] + 180.0) % 360.0) - 180.0
+    return {
+        "samples": int(keep.sum()),
+        "hc_max_err_minutes": float(np.max(np.abs(dhc))),
+        "hc_rms_err_minutes": float(np.sqrt(np.mean(dhc * dhc))),
+        "zn_max_err_deg": float(np.max(np.abs(dzn))),
+        "zn_rms_err_deg": float(np.sqrt(np.mean(dzn * dzn))),
+        "lookups_per_second": float(keep.sum() / lookup_seconds) if lookup_seconds > 0 else float("inf"),
+    }
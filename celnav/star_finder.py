@@ -0,0 +1,104 @@
+"""Star finder (2102-D style): which catalog stars are well placed over a twilight window.
+
+Hc/Zn of every catalog star at every time step come from one broadcast evaluation of
+:func:`celnav.batch.compute_hc_zn_batch` over a (time, star) grid; Aries GHA comes from the
+batch almanac (or any callable mapping epoch seconds to GHA, e.g. the hourly tables).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .batch import aries_gha_batch, compute_hc_zn_batch
+from .stars import star_columns
+from .timescale import epoch_seconds
+
+DEFAULT_MIN_ALT_DEG = 15.0
+DEFAULT_MAX_ALT_DEG = 70.0
+
+
+@dataclass(frozen=True)
+class StarCandidate:
+    name: str
+    hc_deg: float
+    zn_deg: float
+    magnitude: float
+
+
+@dataclass
+class StarFinderResult:
+    """Hc/Zn grids of shape (n_steps, n_stars); ``visible`` marks stars within the altitude band."""
+
+    epoch_s: np.ndarray
+    names: Tuple[str, ...]
+    magnitude: np.ndarray
+    hc_deg: np.ndarray
+    zn_deg: np.ndarray
+    visible: np.ndarray
+
+    def candidates(self, step: int) -> List[StarCandidate]:
+        """Visible stars at one time step, ordered by azimuth."""
+        idx = np.flatnonzero(self.visible[step])
+        idx = idx[np.argsort(self.zn_deg[step, idx], kind="stable")]
+        return [
+            StarCandidate(self.names[i], float(self.hc_deg[step, i]), float(self.zn_deg[step, i]), float(self.magnitude[i]))
+            for i in idx
+        ]
+
+    def azimuth_gap_deg(self) -> np.ndarray:
+        """Largest azimuth sector without a visible star at each step (360 with fewer than two)."""
+        n = self.visible.sum(axis=1)
+        z = np.sort(np.where(self.visible, self.zn_deg, np.inf), axis=1)
+        with np.errstate(invalid="ignore"):  # inf - inf past the last visible star
+            gaps = np.diff(z, axis=1)
+            inner_ok = np.arange(z.shape[1] - 1)[None, :] < (n - 1)[:, None]
+            inner = np.where(inner_ok, gaps, 0.0).max(axis=1, initial=0.0)
+            last = z[np.arange(len(n)), np.maximum(n - 1, 0)]
+            wrap = z[:, 0] + 360.0 - last
+        return np.where(n >= 2, np.maximum(inner, wrap), 360.0)
+
+
+def find_stars(
+    lat_deg: float,
+    lon_deg: float,
+    start,
+    end,
+    step_minutes: float = 1.0,
+    min_alt_deg: float = DEFAULT_MIN_ALT_DEG,
+    max_alt_deg: float = DEFAULT_MAX_ALT_DEG,
+    max_magnitude: Optional[float] = None,
+    aries: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> StarFinderResult:
+    """
+    Hc/Zn of the catalog stars from an assumed position at every step of [start, end].
+
+    start/end are UTC instants in any form accepted by :mod:`celnav.timescale`. Stars fainter
+    than max_magnitude are dropped; ``visible`` is min_alt_deg <= Hc <= max_alt_deg.
+    aries maps an array of epoch seconds to GHA Aries (default: the batch series).
+    """
+    t0 = epoch_seconds(start)
+    t1 = epoch_seconds(end)
+    step_s = step_minutes * 60.0
+    if step_s <= 0:
+        raise ValueError("step_minutes must be positive")
+    if t1 < t0:
+        raise ValueError("end precedes start")
+    epoch_s = t0 + step_s * np.arange(int(np.floor((t1 - t0) / step_s + 1e-9)) + 1)
+
+    cols = star_columns()
+    rows = np.arange(len(cols.names))
+    if max_magnitude is not None:
+        rows = rows[cols.magnitude <= max_magnitude]
+
+    gha_aries = np.asarray((aries or aries_gha_batch)(epoch_s), dtype=float)
+    lha = (gha_aries[:, None] + cols.sha_deg[rows][None, :] - lon_deg) % 360.0
+    hc, zn = compute_hc_zn_batch(lat_deg, cols.dec_deg[rows][None, :], lha)
+    return StarFinderResult(
+        epoch_s=epoch_s,
+        names=tuple(cols.names[i] for i in rows),
+        magnitude=cols.magnitude[rows],
+        hc_deg=hc,
+        zn_deg=zn,
+        visible=(hc >= min_alt_deg) & (hc <= max_alt_deg),
+    )
@@ -1,5 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass(frozen=True)
@@ -7,38 +11,144 @@ class StarEntry:
     name: str
     sha_deg: float  # Sidereal Hour Angle (degrees)
     dec_deg: float  # Declination (degrees, North positive)
+    magnitude: float = 0.0  # Visual magnitude
+    number: int = 0  # Nautical Almanac star number (1..57; 0 for Polaris)
+
+
+# The 57 navigational stars of the Nautical Almanac plus Polaris, approximate 2025 positions.
+# (number, name, SHA deg, SHA min, Dec deg, Dec min (sign = N/S), magnitude)
+_STAR_DATA: Tuple[Tuple[int, str, int, float, int, float, float], ...] = (
+    (1, "Alpheratz", 357, 36.0, 29, 13.0, 2.1),
+    (2, "Ankaa", 353, 8.0, -42, 10.0, 2.4),
+    (3, "Schedar", 349, 32.0, 56, 40.0, 2.2),
+    (4, "Diphda", 348, 48.0, -17, 51.0, 2.0),
+    (5, "Achernar", 335, 20.0, -57, 6.0, 0.5),
+    (6, "Hamal", 327, 52.0, 23, 35.0, 2.0),
+    (7, "Acamar", 315, 11.0, -40, 12.0, 3.2),
+    (8, "Menkar", 314, 7.0, 4, 12.0, 2.5),
+    (9, "Mirfak", 308, 29.0, 49, 57.0, 1.8),
+    (10, "Aldebaran", 290, 40.0, 16, 33.0, 0.9),
+    (11, "Rigel", 281, 4.0, -8, 10.0, 0.1),
+    (12, "Capella", 280, 22.0, 46, 1.0, 0.1),
+    (13, "Bellatrix", 278, 23.0, 6, 22.0, 1.6),
+    (14, "Elnath", 278, 2.0, 28, 37.0, 1.7),
+    (15, "Alnilam", 275, 38.0, -1, 11.0, 1.7),
+    (16, "Betelgeuse", 270, 52.0, 7, 25.0, 0.5),
+    (17, "Canopus", 263, 53.0, -52, 43.0, -0.7),
+    (18, "Sirius", 258, 27.0, -16, 45.0, -1.5),
+    (19, "Adhara", 255, 6.0, -29, 0.0, 1.5),
+    (20, "Procyon", 244, 51.0, 5, 10.0, 0.4),
+    (21, "Pollux", 243, 18.0, 27, 58.0, 1.1),
+    (22, "Avior", 234, 14.0, -59, 35.0, 1.9),
+    (23, "Suhail", 222, 46.0, -43, 32.0, 2.2),
+    (24, "Miaplacidus", 221, 37.0, -69, 49.0, 1.7),
+    (25, "Alphard", 217, 49.0, -8, 46.0, 2.0),
+    (26, "Regulus", 207, 35.0, 11, 50.0, 1.4),
+    (27, "Dubhe", 193, 42.0, 61, 37.0, 1.8),
+    (28, "Denebola", 182, 26.0, 14, 23.0, 2.1),
+    (29, "Gienah", 175, 45.0, -17, 44.0, 2.6),
+    (30, "Acrux", 173, 0.0, -63, 14.0, 0.8),
+    (31, "Gacrux", 171, 52.0, -57, 19.0, 1.6),
+    (32, "Alioth", 166, 13.0, 55, 50.0, 1.8),
+    (33, "Spica", 158, 23.0, -11, 17.0, 1.0),
+    (34, "Alkaid", 152, 52.0, 49, 11.0, 1.9),
+    (35, "Hadar", 148, 36.0, -60, 29.0, 0.6),
+    (36, "Menkent", 147, 58.0, -36, 29.0, 2.1),
+    (37, "Arcturus", 145, 49.0, 19, 3.0, -0.1),
+    (38, "Rigil Kentaurus", 139, 41.0, -60, 56.0, -0.3),
+    (39, "Zubenelgenubi", 136, 56.0, -16, 11.0, 2.8),
+    (40, "Kochab", 137, 21.0, 74, 3.0, 2.1),
+    (41, "Alphecca", 126, 3.0, 26, 37.0, 2.2),
+    (42, "Antares", 112, 17.0, -26, 29.0, 1.0),
+    (43, "Atria", 107, 11.0, -69, 4.0, 1.9),
+    (44, "Sabik", 102, 3.0, -15, 45.0, 2.4),
+    (45, "Shaula", 96, 12.0, -37, 7.0, 1.6),
+    (46, "Rasalhague", 95, 58.0, 12, 32.0, 2.1),
+    (47, "Eltanin", 90, 42.0, 51, 29.0, 2.2),
+    (48, "Kaus Australis", 83, 33.0, -34, 22.0, 1.8),
+    (49, "Vega", 80, 34.0, 38, 48.0, 0.0),
+    (50, "Nunki", 75, 48.0, -26, 15.0, 2.0),
+    (51, "Altair", 62, 1.0, 8, 56.0, 0.8),
+    (52, "Peacock", 53, 7.0, -56, 39.0, 1.9),
+    (53, "Deneb", 49, 27.0, 45, 22.0, 1.3),
+    (54, "Enif", 33, 38.0, 9, 59.0, 2.4),
+    (55, "Al Na'ir", 27, 34.0, -46, 50.0, 1.7),
+    (56, "Fomalhaut", 15, 17.0, -29, 30.0, 1.2),
+    (57, "Markab", 13, 31.0, 15, 20.0, 2.5),
+    (0, "Polaris", 313, 44.0, 89, 22.0, 2.0),
+)
+
+# Other spellings found in almanacs and star finders
+_ALIASES = {
+    "Rigil Kent": "Rigil Kentaurus",
+    "Rigil Kent.": "Rigil Kentaurus",
+    "Alnair": "Al Na'ir",
+    "Al Nair": "Al Na'ir",
+    "Kaus Aust.": "Kaus Australis",
+    "Gienah Corvi": "Gienah",
+}
 
 
-# Minimal navigation star catalog (approximate SHA/Dec values)
-_STAR_CATALOG: Dict[str, StarEntry] = {}
+def _dm(deg: int, minutes: float) -> float:
+    return deg - minutes / 60.0 if deg < 0 else deg + minutes / 60.0
 
 
-def _add(name: str, sha: float, dec: float) -> None:
-    entry = StarEntry(name=name, sha_deg=sha, dec_deg=dec)
-    _STAR_CATALOG[name.lower()] = entry
+_STARS: Tuple[StarEntry, ...] = tuple(
+    StarEntry(name=name, sha_deg=sha + sha_min / 60.0, dec_deg=_dm(dec, dec_min), magnitude=mag, number=number)
+    for number, name, sha, sha_min, dec, dec_min, mag in _STAR_DATA
+)
 
+# Case-insensitive name -> catalog position, built once. The exact, lower and upper case
+# spellings are stored so that typical lookups are a single dict hit.
+_STAR_INDEX: Dict[str, int] = {}
+for _i, _star in enumerate(_STARS):
+    for _name in [_star.name] + [alias for alias, target in _ALIASES.items() if target == _star.name]:
+        for _key in (_name, _name.lower(), _name.upper()):
+            _STAR_INDEX[_key] = _i
 
-# Data sourced from commonly used navigation star lists (approximate)
-_add("Sirius", 259.0, -16.7)
-_add("Canopus", 264.0, -52.7)
-_add("Arcturus", 146.0, 19.2)
-_add("Vega", 81.0, 38.8)
-_add("Capella", 281.0, 46.0)
-_add("Rigel", 282.0, -8.2)
-_add("Procyon", 245.0, 5.2)
-_add("Betelgeuse", 271.0, 7.4)
-_add("Aldebaran", 291.0, 16.5)
-_add("Spica", 159.0, -11.2)
-_add("Antares", 113.0, -26.4)
-_add("Pollux", 244.0, 28.0)
-_add("Fomalhaut", 16.0, -29.6)
-_add("Deneb", 49.0, 45.3)
-_add("Regulus", 208.0, 12.0)
+
+def star_index(name: str) -> Optional[int]:
+    """Position of a star in the catalog (and in :func:`star_columns`), or None."""
+    i = _STAR_INDEX.get(name)
+    if i is None:
+        i = _STAR_INDEX.get(name.strip().lower())
+    return i
 
 
 def get_star(name: str) -> Optional[StarEntry]:
-    return _STAR_CATALOG.get(name.strip().lower())
+    i = star_index(name)
+    return None if i is None else _STARS[i]
 
 
 def list_stars() -> List[StarEntry]:
-    return list(_STAR_CATALOG.values())
+    return list(_STARS)
+
+
+@dataclass(frozen=True)
+class StarColumns:
+    """The catalog as contiguous NumPy columns; row i is ``list_stars()[i]``."""
+
+    names: Tuple[str, ...]
+    number: "np.ndarray"
+    sha_deg: "np.ndarray"
+    dec_deg: "np.ndarray"
+    magnitude: "np.ndarray"
+
+
+@lru_cache(maxsize=None)
+def star_columns() -> StarColumns:
+    """Column view of the catalog (built on first use; NumPy is not needed for name lookups)."""
+    import numpy as np
+
+    def column(values, dtype):
+        a = np.array(values, dtype=dtype)
+        a.flags.writeable = False
+        return a
+
+    return StarColumns(
+        names=tuple(s.name for s in _STARS),
+        number=column([s.number for s in _STARS], np.int16),
+        sha_deg=column([s.sha_deg for s in _STARS], float),
+        dec_deg=column([s.dec_deg for s in _STARS], float),
+        magnitude=column([s.magnitude for s in _STARS], float),
+    )
@@ -0,0 +1,177 @@
+"""UTC instants -> Julian Day, shared by the almanac, provider, batch and CLI entry points.
+
+An instant may be an ISO 'YYYY-MM-DD[T ]HH:MM[:SS[.fff]][Z|+00:00]' string (month, day and
+time fields may be unpadded; a bare date means 00:00), epoch seconds, a ``datetime`` (naive values are taken as UTC) or a NumPy
+``datetime64``. The Gregorian calendar terms of a date are computed once and memoized, so
+many instants on the same UTC day only pay for their fractional-day part. The ``*_array``
+functions convert whole columns of instants at once (NumPy is imported on first use; the
+scalar path is stdlib-only).
+"""
+
+import math
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Tuple
+
+UNIX_EPOCH_JD = 2440587.5
+SECONDS_PER_DAY = 86400.0
+
+_DAY_CACHE = 1 << 14  # ~45 years of distinct dates
+
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})(?::(\d{1,2}(?:\.\d*)?))?", re.ASCII)
+_ISO_FORMAT = "YYYY-MM-DDTHH:MM[:SS][Z]"
+
+
+@lru_cache(maxsize=_DAY_CACHE)
+def julian_day_at_midnight(year: int, month: int, day: int) -> float:
+    """Julian Day of 00:00 UTC on a Gregorian calendar date (post-1582)."""
+    y = year
+    m = month
+    if m <= 2:
+        y -= 1
+        m += 12
+    A = math.floor(y / 100)
+    B = 2 - A + math.floor(A / 4)
+    return math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * (m + 1)) + day + B - 1524.5
+
+
+def julian_day(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: float = 0.0) -> float:
+    """Julian Day (UTC) of a calendar date and time of day."""
+    return julian_day_at_midnight(year, month, day) + (hour + (minute + second / 60.0) / 60.0) / 24.0
+
+
+@lru_cache(maxsize=_DAY_CACHE)
+def _date_jd(date_part: str) -> float:
+    m = _DATE_RE.fullmatch(date_part)
+    try:
+        if m is None:
+            raise ValueError
+        d = date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:
+        raise ValueError(f"Invalid ISO date: {date_part!r}") from None
+    return julian_day_at_midnight(d.year, d.month, d.day)
+
+
+def parse_iso_utc(iso_utc: str) -> Tuple[float, float]:
+    """(Julian Day of 00:00 UTC, seconds into the day) for an ISO UTC string."""
+    s = iso_utc.strip()
+    if s[-1:] in ("Z", "z"):
+        s = s[:-1]
+    elif s.endswith("+00:00"):
+        s = s[:-6]
+    for sep in ("T", " ", "t"):
+        date_part, found, time_part = s.partition(sep)
+        if found:
+            break
+    jd0 = _date_jd(date_part)
+    if not found:
+        return jd0, 0.0  # date only: 00:00 UTC
+    m = _TIME_RE.fullmatch(time_part)
+    if m is None:
+        raise ValueError(f"Invalid ISO UTC time: {iso_utc!r} (expected {_ISO_FORMAT})")
+    seconds = int(m[1]) * 3600.0 + int(m[2]) * 60.0
+    if m[3]:
+        seconds += float(m[3])
+    return jd0, seconds
+
+
+def julian_day_from_iso(iso_utc: str) -> float:
+    jd0, seconds = parse_iso_utc(iso_utc)
+    return jd0 + seconds / SECONDS_PER_DAY
+
+
+def epoch_seconds_from_iso(iso_utc: str) -> float:
+    jd0, seconds = parse_iso_utc(iso_utc)
+    return (jd0 - UNIX_EPOCH_JD) * SECONDS_PER_DAY + seconds
+
+
+def epoch_seconds(instant) -> float:
+    """Seconds since 1970-01-01T00:00Z for one instant of any supported kind."""
+    if isinstance(instant, str):
+        return epoch_seconds_from_iso(instant)
+    if isinstance(instant, datetime):
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=timezone.utc)
+        return instant.timestamp()
+    if hasattr(instant, "dtype") and instant.dtype.kind == "M":
+        return float(instant.astype("datetime64[ns]").astype("int64")) / 1e9
+    return float(instant)
+
+
+def julian_day_of(instant) -> float:
+    """Julian Day (UTC) for one instant of any supported kind."""
+    if isinstance(instant, str):
+        return julian_day_from_iso(instant)
+    return epoch_seconds(instant) / SECONDS_PER_DAY + UNIX_EPOCH_JD
+
+
+def epoch_seconds_array(instants):
+    """Float array of epoch seconds for a column of instants (any supported kind, may be mixed)."""
+    import numpy as np
+
+    a = np.asarray(instants)
+    if a.dtype.kind == "M":
+        return a.astype("datetime64[ns]").astype(np.int64) / 1e9
+    if a.dtype.kind in "biuf":
+        return a.astype(float)
+    if a.dtype.kind in "US":
+        a = np.char.strip(a.astype(str))
+        fast = _canonical_iso(a)
+        if fast is not None:
+            return fast
+        # unpadded fields or forms NumPy reads differently: the scalar parser (and its errors)
+    flat = a.ravel()
+    return np.fromiter((epoch_seconds(x) for x in flat.tolist()), dtype=float, count=flat.size).reshape(a.shape)
+
+
+def _canonical_iso(a):
+    """Epoch seconds of a stripped ISO string array via NumPy's C parser, or None.
+
+    NumPy's datetime64 parser is ~10x faster than per-string Python but also reads forms
+    parse_iso_utc rejects (partial dates, other UTC offsets), so it is only used when every
+    string is zero-padded 'YYYY-MM-DD[T ]HH:MM[:SS[.f]]' with an optional 'Z'/'+00:00'
+    suffix. The suffix is blanked out first: NumPy warns (slowly, per element) on zones.
+    """
+    import numpy as np
+
+    width = a.dtype.itemsize // 4
+    if a.size == 0 or width < 10 or width > 35:
+        return None
+    c = np.zeros((a.size, max(width, 29)), dtype=np.uint32)  # padded: all fixed columns exist
+    c[:, :width] = np.ascontiguousarray(a).reshape(-1).view(np.uint32).reshape(-1, width)
+    n = np.char.str_len(a).reshape(-1)
+    rows = np.arange(n.size)
+    last = c[rows, np.maximum(n - 1, 0)]
+    zulu = (last == ord("Z")) | (last == ord("z"))
+    offset = np.char.endswith(a, "+00:00").reshape(-1) & ~zulu
+    n = n - zulu - 6 * offset
+
+    digit = (c[:, :20] >= ord("0")) & (c[:, :20] <= ord("9"))
+    ok = np.isin(n, (10, 16, 19)) | ((n >= 21) & (n <= 29))
+    ok &= digit[:, [0, 1, 2, 3, 5, 6, 8, 9]].all(axis=1) & (c[:, 4] == ord("-")) & (c[:, 7] == ord("-"))
+    ok &= (n <= 10) | (np.isin(c[:, 10], (ord("T"), ord(" "))) & digit[:, [11, 12, 14, 15]].all(axis=1)
+                       & (c[:, 13] == ord(":")))
+    ok &= (n <= 16) | ((c[:, 16] == ord(":")) & digit[:, 17] & digit[:, 18])
+    frac = np.flatnonzero(n > 19)
+    if frac.size:
+        tail = c[frac, 20:]
+        col = np.arange(20, c.shape[1])
+        ok[frac] &= (c[frac, 19] == ord(".")) & (
+            ((tail >= ord("0")) & (tail <= ord("9"))) | (col >= n[frac, None])).all(axis=1)
+    if not ok.all():
+        return None
+    c[rows[zulu], n[zulu]] = 0
+    cut = np.flatnonzero(offset)
+    c[cut[:, None], n[cut, None] + np.arange(6)] = 0
+    core = c[:, :width].copy().view(a.dtype).reshape(a.shape)
+    try:
+        return core.astype("datetime64[ns]").astype(np.int64) / 1e9
+    except ValueError:
+        return None  # out-of-range fields (month 13, hour 25, ...)
+
+
+def julian_day_array(instants):
+    """Float array of Julian Days (UTC) for a column of instants."""
+    return epoch_seconds_array(instants) / SECONDS_PER_DAY + UNIX_EPOCH_JD
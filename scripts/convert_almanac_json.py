@@ -0,0 +1,34 @@
+"""
+Convert hourly Sun/Aries almanac JSON tables to the binary celnav almanac format.
+
+Usage:
+  python scripts/convert_almanac_json.py src/data/almanac/sun_aries_2025_hourly.json \
+      --out src/data/almanac/sun_aries_2025_hourly.bin --int32
+
+Several consecutive yearly tables may be given; they are concatenated into one file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from celnav.almanac_store import TYPE_FLOAT64, TYPE_INT32, convert_json_to_binary  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert almanac JSON tables to the binary format")
+    parser.add_argument("json", nargs="+", help="Hourly JSON tables in chronological order")
+    parser.add_argument("--out", required=True, help="Output .bin path")
+    parser.add_argument("--int32", action="store_true", help="Store scaled int32 (1e-6°) instead of float64")
+    args = parser.parse_args()
+
+    n = convert_json_to_binary(args.json, args.out, TYPE_INT32 if args.int32 else TYPE_FLOAT64)
+    print(f"Wrote {n} records -> {args.out} ({Path(args.out).stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
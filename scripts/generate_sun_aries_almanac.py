@@ -0,0 +1,241 @@
+"""
+Generate hourly Nautical Almanac-style tables for a range of years:
+- GHA Sun (deg)
+- Sun declination (deg)
+- GHA Aries (deg)
+
+Output
+------
+- ``--format json`` (default): one ``sun_aries_<year>_hourly.json`` per year in ``--out-dir``
+  (same layout as the table consumed by src/utils/nauticalAlmanac2025.ts)
+- ``--format bin``: a single multi-year binary table (see celnav/almanac_store.py)
+
+Notes
+-----
+- Runs fully offline: the ephemeris is read from a local file (``--ephemeris``, e.g. a
+  JPL DE421 ``de421.bsp`` covering 1900-2050) and Skyfield's built-in timescale files are used.
+  ``--synthetic`` replaces Skyfield with the analytic series in celnav.batch (for tests and
+  machines without an ephemeris; accurate to about 0.01°).
+- Each chunk (a month by default, or a single day) is evaluated as one Skyfield time array:
+  GAST for Aries, apparent Sun RA/Dec on the true equator and equinox of date.
+- Chunks are spread over a process pool with a bounded window (celnav.parallel.ordered_map);
+  results are written in order as they arrive, so memory holds only the chunks in flight,
+  never a whole year of records.
+- Each JSON table is written to ``<name>.partial`` and renamed when its year is complete; if
+  generation fails the partial file is removed, so a truncated table is never left behind.
+
+Usage:
+  python scripts/generate_sun_aries_almanac.py --start-year 2025 --end-year 2027 --ephemeris de421.bsp
+  python scripts/generate_sun_aries_almanac.py --start-year 2025 --end-year 2025 --synthetic --format bin --out /tmp/a.bin
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from celnav.almanac_store import COLUMNS, TYPE_FLOAT64, TYPE_INT32, AlmanacBinaryWriter  # noqa: E402
+from celnav.parallel import default_workers, ordered_map  # noqa: E402
+
+DEFAULT_OUT_DIR = REPO_ROOT / "src" / "data" / "almanac"
+RECORDS_PER_DAY = 24
+SYNTHETIC = "synthetic"
+
+
+@dataclass(frozen=True)
+class AlmanacHeader:
+    year: int
+    start_date: str
+    end_date: str
+    step: str
+    ephemeris: str
+    sidereal_time: str
+    units: str
+    records_per_day: int
+    record_fields: List[str]
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Consecutive whole days [first_day, first_day + num_days) within one year."""
+
+    first_day: date
+    num_days: int
+
+
+def plan_chunks(start_year: int, end_year: int, granularity: str = "month") -> List[Chunk]:
+    """Split the inclusive year range into month or day chunks (never crossing a year boundary)."""
+    chunks: List[Chunk] = []
+    for year in range(start_year, end_year + 1):
+        if granularity == "day":
+            d = date(year, 1, 1)
+            while d.year == year:
+                chunks.append(Chunk(d, 1))
+                d += timedelta(days=1)
+        else:
+            for month in range(1, 13):
+                first = date(year, month, 1)
+                nxt = date(year + month // 12, month % 12 + 1, 1)
+                chunks.append(Chunk(first, (nxt - first).days))
+    return chunks
+
+
+# Per-process ephemeris handles (loaded once by each pool worker)
+_SKYFIELD = {}
+
+
+def _skyfield(ephemeris: str):
+    if ephemeris not in _SKYFIELD:
+        from skyfield.api import load, load_file  # type: ignore
+
+        eph = load_file(ephemeris)
+        _SKYFIELD[ephemeris] = (load.timescale(builtin=True), eph["earth"], eph["sun"])
+    return _SKYFIELD[ephemeris]
+
+
+def compute_chunk(task: Tuple[str, Chunk]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(GHA Sun, Dec Sun, GHA Aries) in degrees for every whole UTC hour of a chunk."""
+    ephemeris, chunk = task
+    hours = np.arange(chunk.num_days * RECORDS_PER_DAY)
+    d = chunk.first_day
+    if ephemeris == SYNTHETIC:
+        from celnav.batch import sun_aries_batch
+
+        start = datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp()
+        alm = sun_aries_batch(start + 3600.0 * hours)
+        return alm.gha_sun_deg, alm.dec_sun_deg, alm.gha_aries_deg
+
+    ts, earth, sun = _skyfield(ephemeris)
+    t = ts.utc(d.year, d.month, d.day, hours)
+    gha_aries = (np.asarray(t.gast) * 15.0) % 360.0
+    ra, dec, _dist = earth.at(t).observe(sun).apparent().radec(epoch="date")
+    gha_sun = (gha_aries - np.asarray(ra.hours) * 15.0) % 360.0
+    return gha_sun, np.asarray(dec.degrees), gha_aries
+
+
+def iter_chunk_columns(ephemeris: str, chunks: List[Chunk], workers: int) -> Iterator[Tuple[Chunk, Tuple[np.ndarray, ...]]]:
+    """Yield (chunk, columns) in chronological order, computing chunks on a process pool."""
+    tasks = ((ephemeris, c) for c in chunks)
+    yield from zip(chunks, ordered_map(compute_chunk, tasks, workers))
+
+
+def _header(year: int, ephemeris: str) -> AlmanacHeader:
+    return AlmanacHeader(
+        year=year,
+        start_date=str(date(year, 1, 1)),
+        end_date=str(date(year, 12, 31)),
+        step="1h UTC (whole hour)",
+        ephemeris=(
+            "synthetic (celnav analytic series)" if ephemeris == SYNTHETIC
+            else f"{Path(ephemeris).name} via Skyfield"
+        ),
+        sidereal_time="GAST @ Greenwich (hours -> deg)",
+        units="degrees",
+        records_per_day=RECORDS_PER_DAY,
+        record_fields=list(COLUMNS),
+    )
+
+
+def _json_rows(columns: Tuple[np.ndarray, ...]) -> str:
+    # Stable rounding keeps the JSON small while retaining nav precision
+    rows = np.round(np.column_stack(columns), 6).tolist()
+    return json.dumps(rows, separators=(",", ":"))[1:-1]
+
+
+def write_json_tables(ephemeris: str, chunks: List[Chunk], out_dir: Path, workers: int) -> List[Path]:
+    """Stream one JSON table per year into out_dir; returns the written paths."""
+    written: List[Path] = []
+    f: Optional[TextIO] = None
+    partial: Optional[Path] = None
+    year = None
+
+    def finish() -> None:
+        f.write("]}")
+        f.close()
+        final = partial.with_suffix("")
+        os.replace(partial, final)
+        written.append(final)
+
+    try:
+        for chunk, columns in iter_chunk_columns(ephemeris, chunks, workers):
+            if chunk.first_day.year != year:
+                if f is not None:
+                    finish()
+                year = chunk.first_day.year
+                partial = out_dir / f"sun_aries_{year}_hourly.json.partial"
+                f = open(partial, "w", encoding="utf-8")
+                header = json.dumps(asdict(_header(year, ephemeris)), ensure_ascii=False, separators=(",", ":"))
+                # index = dayOfYear(0-based) * 24 + utcHour
+                f.write('{"header":' + header + ',"records":[')
+            else:
+                f.write(",")
+            f.write(_json_rows(columns))
+        if f is not None:
+            finish()
+    except BaseException:
+        if f is not None and not f.closed:
+            f.close()
+            partial.unlink()
+        raise
+    return written
+
+
+def write_binary_table(ephemeris: str, chunks: List[Chunk], out_path: Path, workers: int, value_type: int) -> int:
+    """Stream all chunks into one binary table; returns the record count."""
+    first = chunks[0].first_day
+    start_epoch = int(datetime(first.year, first.month, first.day, tzinfo=timezone.utc).timestamp())
+    total = sum(c.num_days for c in chunks) * RECORDS_PER_DAY
+    with AlmanacBinaryWriter(str(out_path), start_epoch, 86400 // RECORDS_PER_DAY, total, value_type) as writer:
+        for chunk, columns in iter_chunk_columns(ephemeris, chunks, workers):
+            writer.write((chunk.first_day - first).days * RECORDS_PER_DAY, columns)
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate hourly Sun/Aries almanac tables for a range of years")
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument("--end-year", type=int, help="Last year, inclusive (default: start year)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--ephemeris", help="Local JPL ephemeris file, e.g. de421.bsp")
+    source.add_argument("--synthetic", action="store_true", help="Use the celnav analytic series instead of Skyfield")
+    parser.add_argument("--chunk", choices=["month", "day"], default="month", help="Time-array size per task")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Process pool size (1 = in process)")
+    parser.add_argument("--format", choices=["json", "bin"], default="json")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Directory for yearly JSON tables")
+    parser.add_argument("--out", type=Path, help="Binary output path (--format bin)")
+    parser.add_argument("--int32", action="store_true", help="Binary: scaled int32 columns (half the size of float64)")
+    args = parser.parse_args(argv)
+
+    end_year = args.start_year if args.end_year is None else args.end_year
+    if end_year < args.start_year:
+        parser.error("--end-year must not precede --start-year")
+    if args.ephemeris is not None and not Path(args.ephemeris).is_file():
+        parser.error(f"Ephemeris file not found: {args.ephemeris}")
+    ephemeris = SYNTHETIC if args.synthetic else str(Path(args.ephemeris).resolve())
+    chunks = plan_chunks(args.start_year, end_year, args.chunk)
+
+    if args.format == "bin":
+        if args.out is None:
+            parser.error("--out is required with --format bin")
+        n = write_binary_table(ephemeris, chunks, args.out, args.workers, TYPE_INT32 if args.int32 else TYPE_FLOAT64)
+        print(f"Wrote {n} records -> {args.out}")
+    else:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+        for path in write_json_tables(ephemeris, chunks, args.out_dir, args.workers):
+            print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Rotate the Sun RA/Dec behind an hourly almanac JSON table from the J2000 (GCRS) frame to the
+true equator and equinox of date, rewriting ghaSunDeg/decSunDeg in place.
+
+Background
+----------
+Early versions of generate_sun_aries_almanac_2025.py called ``apparent().radec()`` without
+``epoch="date"``, which returns J2000-frame coordinates, and then paired that RA with GAST
+(an of-date quantity). The resulting GHA Sun was off by up to 0.4° and Dec by up to 0.14°.
+The generator now asks for ``radec(epoch="date")``; this script repairs tables produced by
+the old version without needing the ephemeris:
+
+- precession J2000 -> mean of date: IAU 1976 (ζ, z, θ)
+- mean -> true of date: nutation in longitude/obliquity from the four leading IAU 1980 terms
+
+Residual error against a full IAU 2000A rotation is well below 1″. GHA Aries (GAST) is unchanged.
+
+Usage:
+  python scripts/reframe_sun_almanac_to_date.py src/data/almanac/sun_aries_2025_hourly.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ARCSEC = np.radians(1.0 / 3600.0)
+REFRAME_NOTE = (
+    "Sun RA/Dec rotated from J2000 to the true equator and equinox of date "
+    "(IAU 1976 precession + 4-term IAU 1980 nutation, scripts/reframe_sun_almanac_to_date.py)"
+)
+
+
+def _precess_j2000_to_date(ra_r: np.ndarray, dec_r: np.ndarray, T: np.ndarray):
+    zeta = (2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) * ARCSEC
+    z = (2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) * ARCSEC
+    theta = (2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) * ARCSEC
+    a = np.cos(dec_r) * np.sin(ra_r + zeta)
+    b = np.cos(theta) * np.cos(dec_r) * np.cos(ra_r + zeta) - np.sin(theta) * np.sin(dec_r)
+    c = np.sin(theta) * np.cos(dec_r) * np.cos(ra_r + zeta) + np.cos(theta) * np.sin(dec_r)
+    return np.arctan2(a, b) + z, np.arcsin(c)
+
+
+def _nutate(ra_r: np.ndarray, dec_r: np.ndarray, T: np.ndarray):
+    omega = np.radians(125.04452 - 1934.136261 * T)
+    L_sun = np.radians(280.4665 + 36000.7698 * T)
+    L_moon = np.radians(218.3165 + 481267.8813 * T)
+    dpsi = (-17.20 * np.sin(omega) - 1.32 * np.sin(2 * L_sun) - 0.23 * np.sin(2 * L_moon) + 0.21 * np.sin(2 * omega)) * ARCSEC
+    deps = (9.20 * np.cos(omega) + 0.57 * np.cos(2 * L_sun) + 0.10 * np.cos(2 * L_moon) - 0.09 * np.cos(2 * omega)) * ARCSEC
+    eps0 = np.radians(23.0 + 26.0 / 60.0 + 21.448 / 3600.0) - (46.8150 * T + 0.00059 * T**2 - 0.001813 * T**3) * ARCSEC
+    eps = eps0 + deps
+    # Equatorial (mean) -> ecliptic (mean), shift longitude by Δψ, back with true obliquity
+    lon = np.arctan2(np.sin(ra_r) * np.cos(eps0) + np.tan(dec_r) * np.sin(eps0), np.cos(ra_r))
+    lat = np.arcsin(np.sin(dec_r) * np.cos(eps0) - np.cos(dec_r) * np.sin(eps0) * np.sin(ra_r))
+    lon = lon + dpsi
+    ra = np.arctan2(np.sin(lon) * np.cos(eps) - np.tan(lat) * np.sin(eps), np.cos(lon))
+    dec = np.arcsin(np.sin(lat) * np.cos(eps) + np.cos(lat) * np.sin(eps) * np.sin(lon))
+    return ra, dec
+
+
+def reframe(payload: dict) -> dict:
+    header = payload["header"]
+    records = np.asarray(payload["records"], dtype=float)
+    d0 = date.fromisoformat(header["start_date"])
+    start = datetime(d0.year, d0.month, d0.day, tzinfo=timezone.utc).timestamp()
+    step = 86400.0 / int(header["records_per_day"])
+    epoch_s = start + step * np.arange(len(records))
+    T = (epoch_s / 86400.0 + 2440587.5 - 2451545.0) / 36525.0
+
+    gha_sun, dec_sun, gha_aries = records[:, 0], records[:, 1], records[:, 2]
+    ra_r = np.radians((gha_aries - gha_sun) % 360.0)
+    ra_r, dec_r = _precess_j2000_to_date(ra_r, np.radians(dec_sun), T)
+    ra_r, dec_r = _nutate(ra_r, dec_r, T)
+
+    new_gha_sun = (gha_aries - np.degrees(ra_r)) % 360.0
+    new_dec = np.degrees(dec_r)
+    header["ephemeris"] = header["ephemeris"].split(";")[0] + "; " + REFRAME_NOTE
+    payload["records"] = [
+        [round(float(g), 6), round(float(d), 6), round(float(a), 6)]
+        for g, d, a in zip(new_gha_sun, new_dec, gha_aries)
+    ]
+    return payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rotate almanac Sun coordinates from J2000 to true of date")
+    parser.add_argument("json", type=Path, help="Hourly almanac JSON table to rewrite in place")
+    args = parser.parse_args()
+
+    payload = reframe(json.loads(args.json.read_text(encoding="utf-8")))
+    args.json.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+    print(f"Rewrote {len(payload['records'])} records -> {args.json}")
+
+
+if __name__ == "__main__":
+    main()
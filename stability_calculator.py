@@ -3,9 +3,15 @@ Gemi Enine Stabilite Hesaplamaları Modülü
 Bu modül, gemi stabilitesi ile ilgili tüm hesaplamaları içerir.
 """
 
+import csv
+import io
 import math
+import os
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from functools import cached_property
+from typing import Dict, List, Tuple, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -311,14 +317,13 @@ class EnineStabiliteHesaplama:
             kriterler["Max GZ >= 0.20m"] = max_gz[1] >= 0.20
             kriterler["Max GZ açısı >= 25°"] = max_gz[0] >= 25
             
-            # Alan hesaplamaları (basitleştirilmiş)
-            alan_0_30 = self._alan_hesapla(gz_egri, 0, 30)
-            alan_0_40 = self._alan_hesapla(gz_egri, 0, 40)
-            alan_30_40 = self._alan_hesapla(gz_egri, 30, 40)
-            
-            kriterler["Alan 0-30°"] = alan_0_30 >= 0.055
-            kriterler["Alan 0-40°"] = alan_0_40 >= 0.090
-            kriterler["Alan 30-40°"] = alan_30_40 >= 0.030
+            # Alanlar 30°/40° sınırlarında enterpolasyonla tam alınır (bkz. is_kodu_kriterleri)
+            if len(gz_egri) >= 2:
+                acilar, gz = zip(*gz_egri)
+                alanlar = is_kodu_kriterleri(acilar, gz).durum(0)
+                kriterler["Alan 0-30°"] = alanlar["alan_0_30"]["gecti"]
+                kriterler["Alan 0-40°"] = alanlar["alan_0_40"]["gecti"]
+                kriterler["Alan 30-40°"] = alanlar["alan_30_40"]["gecti"]
         
         return kriterler
     
@@ -354,63 +359,52 @@ class EnineStabiliteHesaplama:
             gz_listesi.append((aci, gm_degeri * math.sin(math.radians(aci))))
         return gz_listesi
     
+    @staticmethod
+    def gz_egri_toplu(acilar, kg, kn=None, km=None, deplasman=None) -> "TopluGZSonucu":
+        """
+        Çok sayıda yükleme durumu için GZ eğrilerini tek seferde hesaplar
+        (bkz. toplu_gz_egrisi; örnek oluşturmaya gerek yoktur)
+        """
+        return toplu_gz_egrisi(acilar, kg, kn=kn, km=km, deplasman=deplasman)
+    
     def gz_egri_analiz(self, gz_egri: List[Tuple[float, float]]) -> dict:
         """
         GZ eğrisi için maksimum değer ve alan analizleri üretir
         """
-        if not gz_egri:
+        if len(gz_egri) < 2:
+            max_gz_acisi, max_gz = gz_egri[0] if gz_egri else (0.0, 0.0)
             return {
-                "max_gz": 0.0,
-                "max_gz_acisi": 0.0,
+                "max_gz": max_gz,
+                "max_gz_acisi": max_gz_acisi,
                 "toplam_alan": 0.0,
                 "alan_0_30": 0.0,
                 "alan_0_40": 0.0,
                 "alan_30_40": 0.0
             }
         
-        sirali = sorted(gz_egri, key=lambda x: x[0])
-        max_gz_acisi, max_gz = max(sirali, key=lambda x: x[1])
-        
-        toplam_alan = 0.0
-        for (aci1, gz1), (aci2, gz2) in zip(sirali, sirali[1:]):
-            toplam_alan += 0.5 * (gz1 + gz2) * math.radians(aci2 - aci1)
-        
+        egri = GZEgrisi.listeden(gz_egri)
         return {
-            "max_gz": max_gz,
-            "max_gz_acisi": max_gz_acisi,
-            "toplam_alan": toplam_alan,
-            "alan_0_30": self._alan_hesapla(sirali, 0, 30),
-            "alan_0_40": self._alan_hesapla(sirali, 0, 40),
-            "alan_30_40": self._alan_hesapla(sirali, 30, 40)
+            "max_gz": egri.max_gz,
+            "max_gz_acisi": egri.max_gz_acisi,
+            "toplam_alan": egri.toplam_alan,
+            "alan_0_30": egri.alan(0, 30),
+            "alan_0_40": egri.alan(0, 40),
+            "alan_30_40": egri.alan(30, 40)
         }
     
     def avs_hesapla(self, gz_egri: List[Tuple[float, float]]) -> Optional[float]:
         """
-        GZ = 0 olduğu açıyı (Angle of Vanishing Stability) döner
+        GZ'nin pozitiften sıfıra düştüğü açıyı (Angle of Vanishing Stability) döner
         """
-        if not gz_egri:
+        if len(gz_egri) < 2:
             return None
-        
-        sirali = sorted(gz_egri, key=lambda x: x[0])
-        onceki_aci, onceki_gz = sirali[0]
-        
-        if onceki_gz == 0:
-            return onceki_aci
-        
-        for aci, gz in sirali[1:]:
-            if gz == 0:
-                return aci
-            if onceki_gz > 0 and gz < 0:
-                oran = onceki_gz / (onceki_gz - gz)
-                return onceki_aci + oran * (aci - onceki_aci)
-            onceki_aci, onceki_gz = aci, gz
-        
-        return None
+        avs = GZEgrisi.listeden(gz_egri).avs
+        return None if math.isnan(avs) else avs
     
     def _alan_hesapla(self, gz_egri: List[Tuple[float, float]], 
                       baslangic: float, bitis: float) -> float:
         """
-        GZ eğrisi altındaki alanı hesaplar (yamuk yöntemi)
+        GZ eğrisi altındaki alanı hesaplar (yamuk yöntemi; aralık uçlarında enterpolasyon)
         
         Args:
             gz_egri: (açı, GZ) değerleri listesi
@@ -420,18 +414,9 @@ class EnineStabiliteHesaplama:
         Returns:
             Alan (m.rad)
         """
-        filtreli = [(aci, gz) for aci, gz in gz_egri if baslangic <= aci <= bitis]
-        if len(filtreli) < 2:
+        if len(gz_egri) < 2:
             return 0
-        
-        alan = 0
-        for i in range(len(filtreli) - 1):
-            aci1, gz1 = filtreli[i]
-            aci2, gz2 = filtreli[i + 1]
-            # Yamuk alan formülü
-            alan += 0.5 * (gz1 + gz2) * math.radians(aci2 - aci1)
-        
-        return alan
+        return GZEgrisi.listeden(gz_egri).alan(baslangic, bitis)
 
 
 class StabiliteRapor:
@@ -773,3 +758,601 @@ def ortalama_draftlar(
     dM = (dM_sancak + dM_iskele) / 2.0
     dA = (dA_sancak + dA_iskele) / 2.0
     return dF, dM, dA
+
+
+# 9) TOPLU GZ HESAPLARI (durum × açı dizileri)
+@dataclass
+class TopluGZSonucu:
+    """Çok durumlu GZ hesabı sonucu; satırlar durumlar, sütunlar meyil açılarıdır"""
+    acilar: np.ndarray  # (n_aci,) derece, artan sırada
+    gz: np.ndarray  # (n_durum, n_aci) metre
+    max_gz: np.ndarray  # (n_durum,) metre
+    max_gz_acisi: np.ndarray  # (n_durum,) derece
+    toplam_alan: np.ndarray  # (n_durum,) m.rad
+    alan_0_30: np.ndarray  # (n_durum,) m.rad
+    alan_0_40: np.ndarray  # (n_durum,) m.rad
+    alan_30_40: np.ndarray  # (n_durum,) m.rad
+    dogrultucu_moment: Optional[np.ndarray] = None  # (n_durum, n_aci) ton.m, deplasman verildiyse
+    egri: Optional["GZEgrisi"] = None  # aynı eğriler; keyfi aralık alanları ve AVS için
+    
+    def kriterler(self, gm=None, su_alma_acisi=None) -> "KriterSonucu":
+        """Bu eğriler için IS Code kriterleri (bkz. is_kodu_kriterleri)"""
+        return is_kodu_kriterleri(self.egri or GZEgrisi(self.acilar, self.gz), gm=gm, su_alma_acisi=su_alma_acisi)
+
+
+def _kumulatif_alan(acilar: np.ndarray, gz: np.ndarray) -> np.ndarray:
+    """Her satır için 0. açıdan her açıya kadar yamuk alanı (m.rad); ilk sütun 0"""
+    h = np.radians(np.diff(acilar))
+    parca = 0.5 * (gz[:, 1:] + gz[:, :-1]) * h
+    alan = np.zeros_like(gz)
+    np.cumsum(parca, axis=1, out=alan[:, 1:])
+    return alan
+
+
+def _aci_konumu(acilar: np.ndarray, gz: np.ndarray, aci, tekil: bool = False):
+    """
+    Her sorgu açısı için bulunduğu aralık, aralık başındaki GZ ve açıdaki (enterpole) GZ.
+    
+    Eğri indisi ilk eksendir: aci skaler, (n_egri,) ya da (n_egri, ...) olabilir. tekil
+    (tek satırlı gz) ise aci her biçimde olabilir ve sonuç aynı biçimdedir.
+    """
+    aci = np.asarray(aci, dtype=float)
+    if tekil:
+        satir = np.zeros((), dtype=np.intp)
+    else:
+        satir = np.arange(gz.shape[0]).reshape((-1,) + (1,) * max(aci.ndim - 1, 0))
+    x = np.clip(np.broadcast_to(aci, np.broadcast_shapes(satir.shape, aci.shape)), acilar[0], acilar[-1])
+    i = np.clip(np.searchsorted(acilar, x, side="right") - 1, 0, acilar.size - 2)
+    a0, a1 = acilar[i], acilar[i + 1]
+    g0, g1 = gz[satir, i], gz[satir, i + 1]
+    return satir, i, x, g0, g0 + (g1 - g0) * (x - a0) / (a1 - a0)
+
+
+def _alan_acida(acilar: np.ndarray, gz: np.ndarray, kumulatif: np.ndarray, aci, tekil: bool = False) -> np.ndarray:
+    """
+    Eğrinin başından verilen açıya kadar alan; açı iki örnek arasındaysa GZ doğrusal
+    enterpole edilir. Eğri dışındaki açılar eğrinin uçlarına sınırlanır (açı biçimleri
+    için bkz. _aci_konumu).
+    """
+    satir, i, x, g0, gx = _aci_konumu(acilar, gz, aci, tekil)
+    return kumulatif[satir, i] + 0.5 * (g0 + gx) * np.radians(x - acilar[i])
+
+
+class GZEgrisi:
+    """
+    Açıya göre sıralı GZ dizileri ve önceden hesaplanmış kümülatif alan ile GZ eğrisi.
+    
+    Herhangi iki açı arasındaki dinamik stabilite alanı ikili arama ve aralık uçlarında
+    doğrusal enterpolasyonla O(log n) sürede bulunur. Max GZ, açısı, AVS ve toplam alan ilk
+    istendiğinde hesaplanıp saklanır. gz iki boyutlu verilirse (n_egri, n_aci) her satır ayrı
+    bir eğridir ve sonuçlar eğri başına dizi olarak döner; tek eğride skaler döner.
+    """
+    
+    def __init__(self, acilar, gz):
+        """
+        Args:
+            acilar: Meyil açıları (derece), (n_aci,), sırasız olabilir
+            gz: GZ değerleri (metre), (n_aci,) ya da (n_egri, n_aci)
+        """
+        acilar = np.asarray(acilar, dtype=float)
+        gz = np.asarray(gz, dtype=float)
+        if acilar.ndim != 1 or acilar.size < 2:
+            raise ValueError("En az iki meyil açısı gerekli")
+        if gz.shape[-1] != acilar.size or gz.ndim > 2:
+            raise ValueError("Açı ve GZ dizileri aynı uzunlukta olmalıdır")
+        self.tekil = gz.ndim == 1
+        sira = np.argsort(acilar, kind="stable")
+        self.acilar = acilar[sira]
+        self.gz = np.atleast_2d(gz)[:, sira]
+        self.kumulatif = _kumulatif_alan(self.acilar, self.gz)
+    
+    @classmethod
+    def listeden(cls, gz_egri: List[Tuple[float, float]]) -> "GZEgrisi":
+        """(açı, GZ) çiftleri listesinden tek eğri"""
+        acilar, gz = zip(*gz_egri)
+        return cls(acilar, gz)
+    
+    @classmethod
+    def _hazir(cls, acilar: np.ndarray, gz: np.ndarray, kumulatif: np.ndarray, tekil: bool) -> "GZEgrisi":
+        """Sıralı diziler ve kümülatif alandan, yeniden sıralama ve integral almadan eğri"""
+        egri = cls.__new__(cls)
+        egri.tekil = tekil
+        egri.acilar = acilar
+        egri.gz = gz
+        egri.kumulatif = kumulatif
+        return egri
+    
+    def __len__(self) -> int:
+        return self.gz.shape[0]
+    
+    def __getitem__(self, i: int) -> "GZEgrisi":
+        """Topluluktaki i. eğri (negatif indeks geçerli; kümülatif alan yeniden hesaplanmaz)"""
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError(f"Eğri indeksi {i} aralık dışında (eğri sayısı {n})")
+        i %= n
+        return self._hazir(self.acilar, self.gz[i:i + 1], self.kumulatif[i:i + 1], True)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def _cikti(self, x: np.ndarray):
+        """Tek eğride skaler sorgunun sonucu float, topluluk için eğri başına dizi"""
+        if self.tekil:
+            return float(x) if x.ndim == 0 else x
+        return x
+    
+    def _ozellik(self, x: np.ndarray):
+        return float(x[0]) if self.tekil else x
+    
+    def alan(self, baslangic, bitis):
+        """
+        baslangic ile bitis açıları arasındaki alan (m.rad). Tek eğride açılar her biçimde
+        dizi olabilir (çok sayıda aralık); toplulukta skaler ya da eğri başına (n_egri, ...)
+        dizidir. Eğri dışındaki açılar eğrinin uçlarına sınırlanır.
+        """
+        baslangic, bitis = np.broadcast_arrays(np.asarray(baslangic, dtype=float), np.asarray(bitis, dtype=float))
+        bitis_alani = _alan_acida(self.acilar, self.gz, self.kumulatif, bitis, self.tekil)
+        baslangic_alani = _alan_acida(self.acilar, self.gz, self.kumulatif, baslangic, self.tekil)
+        return self._cikti(bitis_alani - baslangic_alani)
+    
+    def gz_acida(self, aci):
+        """Verilen açı(lar)daki (doğrusal enterpole) GZ (metre)"""
+        return self._cikti(_aci_konumu(self.acilar, self.gz, aci, self.tekil)[4])
+    
+    @cached_property
+    def _max_indeks(self) -> np.ndarray:
+        return np.argmax(self.gz, axis=1)
+    
+    @cached_property
+    def max_gz(self):
+        """En büyük GZ (metre)"""
+        return self._ozellik(self.gz[np.arange(len(self)), self._max_indeks])
+    
+    @cached_property
+    def max_gz_acisi(self):
+        """En büyük GZ'nin açısı (derece; eşitlikte ilk açı)"""
+        return self._ozellik(self.acilar[self._max_indeks])
+    
+    @cached_property
+    def toplam_alan(self):
+        """Eğrinin tamamı altındaki alan (m.rad)"""
+        return self._ozellik(self.kumulatif[:, -1])
+    
+    @cached_property
+    def avs(self):
+        """
+        Kaybolan stabilite açısı (derece): GZ'nin pozitiften sıfıra ya da negatife ilk düştüğü
+        açı, aralık içinde doğrusal enterpolasyonla. Böyle bir açı yoksa NaN.
+        """
+        dusus = (self.gz[:, :-1] > 0) & (self.gz[:, 1:] <= 0)
+        var = dusus.any(axis=1)
+        i = np.argmax(dusus, axis=1)
+        satir = np.arange(len(self))
+        g0, g1 = self.gz[satir, i], self.gz[satir, i + 1]
+        a0, a1 = self.acilar[i], self.acilar[i + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aci = a0 + g0 / (g0 - g1) * (a1 - a0)
+        return self._ozellik(np.where(var, aci, np.nan))
+    
+    def kriterler(self, gm=None, su_alma_acisi=None) -> "KriterSonucu":
+        """Bu eğri(ler) için IS Code kriterleri (bkz. is_kodu_kriterleri)"""
+        return is_kodu_kriterleri(self, gm=gm, su_alma_acisi=su_alma_acisi)
+
+
+def toplu_gz_egrisi(acilar, kg, kn=None, km=None, deplasman=None) -> TopluGZSonucu:
+    """
+    Çok sayıda yükleme durumu için GZ eğrilerini tek bir dizi işlemiyle hesaplar.
+
+    Args:
+        acilar: Meyil açıları (derece), (n_aci,)
+        kg: Durum başına KG (metre), skaler ya da (n_durum,)
+        kn: KN değerleri (metre), (n_durum, n_aci) ya da tüm durumlar için (n_aci,);
+            verildiğinde GZ = KN − KG·sin φ
+        km: KN yoksa durum başına KM (metre); GZ = (KM − KG)·sin φ (küçük açı yaklaşımı)
+        deplasman: Opsiyonel durum başına deplasman (ton); doğrultucu moment = Δ·GZ
+
+    Returns:
+        TopluGZSonucu: GZ matrisi ile satır başına max GZ, max GZ açısı ve alanlar.
+        Alan sınırları (30°, 40°) örnek açılara denk gelmese de enterpolasyonla tam alınır.
+    """
+    acilar = np.asarray(acilar, dtype=float)
+    if acilar.ndim != 1 or acilar.size < 2:
+        raise ValueError("En az iki meyil açısı gerekli")
+    sira = np.argsort(acilar, kind="stable")
+    acilar = acilar[sira]
+    sin_phi = np.sin(np.radians(acilar))
+    kg = np.atleast_1d(np.asarray(kg, dtype=float))
+
+    if kn is not None:
+        kn = np.asarray(kn, dtype=float)
+        if kn.shape[-1] != sira.size:
+            raise ValueError("Açı ve KN dizileri aynı uzunlukta olmalıdır")
+        kn = kn[..., sira]
+        gz = np.atleast_2d(kn) - kg[:, None] * sin_phi
+    elif km is not None:
+        gm = np.atleast_1d(np.asarray(km, dtype=float)) - kg
+        gz = gm[:, None] * sin_phi
+    else:
+        raise ValueError("KN ya da KM verilmelidir")
+
+    egri = GZEgrisi(acilar, gz)
+    
+    moment = None
+    if deplasman is not None:
+        moment = np.atleast_1d(np.asarray(deplasman, dtype=float))[:, None] * gz
+    
+    return TopluGZSonucu(
+        acilar=acilar,
+        gz=gz,
+        max_gz=egri.max_gz,
+        max_gz_acisi=egri.max_gz_acisi,
+        toplam_alan=egri.toplam_alan,
+        alan_0_30=egri.alan(0.0, 30.0),
+        alan_0_40=egri.alan(0.0, 40.0),
+        alan_30_40=egri.alan(30.0, 40.0),
+        egri=egri,
+        dogrultucu_moment=moment,
+    )
+
+
+# 10) KN ÇAPRAZ EĞRİLERİ (deplasman × meyil açısı tablosu)
+class KNCaprazEgrileri:
+    """
+    Bir geminin KN çapraz eğrileri tablosu; deplasman ve meyil açısında iki yönlü doğrusal
+    enterpolasyon. Hücre katsayıları tablo yüklenirken bir kez hesaplanır, sorgular yalnızca
+    hücre arama ve bir çarpma-toplama işlemidir.
+    """
+    
+    def __init__(self, deplasmanlar, acilar, kn):
+        """
+        Args:
+            deplasmanlar: Artan deplasman değerleri (ton), (n_dep,)
+            acilar: Artan meyil açıları (derece), (n_aci,)
+            kn: KN değerleri (metre), (n_dep, n_aci)
+        """
+        self.deplasmanlar = np.asarray(deplasmanlar, dtype=float)
+        self.acilar = np.asarray(acilar, dtype=float)
+        self.kn_tablosu = np.asarray(kn, dtype=float)
+        if self.deplasmanlar.size < 2 or self.acilar.size < 2:
+            raise ValueError("KN tablosu en az iki deplasman ve iki açı içermelidir")
+        if self.kn_tablosu.shape != (self.deplasmanlar.size, self.acilar.size):
+            raise ValueError("KN tablosu boyutu deplasman × açı olmalıdır")
+        if np.any(np.diff(self.deplasmanlar) <= 0) or np.any(np.diff(self.acilar) <= 0):
+            raise ValueError("Deplasman ve açı değerleri kesin artan olmalıdır")
+        
+        # Hücre başına KN = c00 + c10·u + c01·v + c11·u·v (u, v: hücre köşesinden uzaklık)
+        k = self.kn_tablosu
+        dx = np.diff(self.deplasmanlar)[:, None]
+        dy = np.diff(self.acilar)[None, :]
+        self._katsayilar = np.stack([
+            k[:-1, :-1],
+            (k[1:, :-1] - k[:-1, :-1]) / dx,
+            (k[:-1, 1:] - k[:-1, :-1]) / dy,
+            (k[1:, 1:] - k[1:, :-1] - k[:-1, 1:] + k[:-1, :-1]) / (dx * dy),
+        ], axis=-1)
+    
+    @staticmethod
+    def _hucre(eksen: np.ndarray, x: np.ndarray, ad: str, birim: str) -> np.ndarray:
+        if np.any(x < eksen[0]) or np.any(x > eksen[-1]):
+            raise ValueError(f"{ad} KN tablosu aralığı dışında ({eksen[0]:g}–{eksen[-1]:g} {birim})")
+        return np.clip(np.searchsorted(eksen, x, side="right") - 1, 0, eksen.size - 2)
+    
+    def kn(self, deplasman, aci) -> np.ndarray:
+        """
+        Herhangi bir (deplasman, açı) çifti için KN (metre); girişler birbirine yayınlanabilen
+        dizilerdir (ör. (n_durum, 1) deplasman ile (n_aci,) açı → (n_durum, n_aci))
+        """
+        x, y = np.broadcast_arrays(np.asarray(deplasman, dtype=float), np.asarray(aci, dtype=float))
+        i = self._hucre(self.deplasmanlar, x, "Deplasman", "ton")
+        j = self._hucre(self.acilar, y, "Meyil açısı", "°")
+        c = self._katsayilar[i, j]
+        u = x - self.deplasmanlar[i]
+        v = y - self.acilar[j]
+        return c[..., 0] + c[..., 1] * u + (c[..., 2] + c[..., 3] * u) * v
+    
+    def gz_egrisi(self, deplasman, kg, acilar=None) -> TopluGZSonucu:
+        """
+        Yükleme durumları için GZ eğrileri: tek bir KN sorgusu ve toplu_gz_egrisi
+        
+        Args:
+            deplasman: Durum başına deplasman (ton), skaler ya da (n_durum,)
+            kg: Durum başına KG (metre), skaler ya da (n_durum,)
+            acilar: Meyil açıları (derece); verilmezse tablonun açıları
+        """
+        acilar = self.acilar if acilar is None else np.asarray(acilar, dtype=float)
+        deplasman = np.atleast_1d(np.asarray(deplasman, dtype=float))
+        kn = self.kn(deplasman[:, None], acilar)
+        return toplu_gz_egrisi(acilar, kg, kn=kn, deplasman=deplasman)
+    
+    @classmethod
+    def csv_metninden(cls, metin: str) -> "KNCaprazEgrileri":
+        """
+        CSV tablodan oluşturur: ilk satır başlık (ilk hücre etiket, diğerleri açılar),
+        sonraki her satır bir deplasman ve o deplasmandaki KN değerleri. '#' ile başlayan
+        satırlar yok sayılır.
+        """
+        satirlar = [r for r in csv.reader(io.StringIO(metin))
+                    if r and any(h.strip() for h in r) and not r[0].lstrip().startswith("#")]
+        if len(satirlar) < 3:
+            raise ValueError("KN tablosu bir başlık ve en az iki deplasman satırı içermelidir")
+        try:
+            acilar = [float(h) for h in satirlar[0][1:]]
+            veri = np.array([[float(h) for h in r] for r in satirlar[1:]])
+        except ValueError as e:
+            raise ValueError(f"KN tablosu sayısal olmayan değer içeriyor: {e}") from None
+        if veri.shape[1] != len(acilar) + 1:
+            raise ValueError("KN tablosunun her satırı başlıktaki açı sayısı kadar KN içermelidir")
+        return cls(veri[:, 0], acilar, veri[:, 1:])
+
+
+_TABLO_ONBELLEGI: Dict[Tuple[str, str, int, int], object] = {}
+
+
+def _onbellekli_tablo(yol: str, tur: str, ayristir):
+    """Tablo dosyasını bir kez ayrıştırır; anahtar: tür, yol, değişiklik zamanı, boyut"""
+    bilgi = os.stat(yol)
+    anahtar = (tur, os.path.abspath(yol), bilgi.st_mtime_ns, bilgi.st_size)
+    tablo = _TABLO_ONBELLEGI.get(anahtar)
+    if tablo is None:
+        with open(yol, encoding="utf-8") as f:
+            tablo = ayristir(f.read())
+        _TABLO_ONBELLEGI[anahtar] = tablo
+    return tablo
+
+
+def kn_tablosu_yukle(yol: str) -> KNCaprazEgrileri:
+    """Gemi KN tablosunu (CSV) yükler; aynı dosya değişmediği sürece tekrar okunmaz"""
+    return _onbellekli_tablo(yol, "kn", KNCaprazEgrileri.csv_metninden)
+
+
+# 11) HİDROSTATİK TABLO (draft ↔ deplasman, KM, TPC, MCT, LCF, LCB)
+class _MonotonKubik:
+    """
+    Monoton parçalı kübik Hermite enterpolasyonu (PCHIP, Fritsch–Carlson eğimleri); birden
+    çok sütun aynı x ekseninde birlikte enterpole edilir. Aralık katsayıları bir kez hesaplanır.
+    """
+    
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self.x = x
+        h = np.diff(x)[:, None]
+        delta = np.diff(y, axis=0) / h
+        d = np.zeros_like(y)
+        if x.size == 2:
+            d[:] = delta[0]
+        else:
+            # İç noktalar: ağırlıklı harmonik ortalama; eğim yön değiştirirse 0
+            w1 = 2 * h[1:] + h[:-1]
+            w2 = h[1:] + 2 * h[:-1]
+            ayni_yon = delta[:-1] * delta[1:] > 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+            d[1:-1] = np.where(ayni_yon, ic, 0.0)
+            d[0] = self._uc_egimi(h[0], h[1], delta[0], delta[1])
+            d[-1] = self._uc_egimi(h[-1], h[-2], delta[-1], delta[-2])
+        # Aralık başına y = c0 + c1·s + c2·s² + c3·s³, s = x − x_k
+        self._c = np.stack([
+            y[:-1],
+            d[:-1],
+            (3 * delta - 2 * d[:-1] - d[1:]) / h,
+            (d[:-1] + d[1:] - 2 * delta) / h ** 2,
+        ])
+    
+    @staticmethod
+    def _uc_egimi(h0, h1, delta0, delta1):
+        d = ((2 * h0 + h1) * delta0 - h0 * delta1) / (h0 + h1)
+        d = np.where(np.sign(d) != np.sign(delta0), 0.0, d)
+        return np.where((np.sign(delta0) != np.sign(delta1)) & (np.abs(d) > 3 * np.abs(delta0)), 3 * delta0, d)
+    
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """(..., n_sutun) değerler; x tablo aralığında olmalıdır"""
+        k = np.clip(np.searchsorted(self.x, x, side="right") - 1, 0, self.x.size - 2)
+        s = (x - self.x[k])[..., None]
+        c0, c1, c2, c3 = self._c[:, k]
+        return ((c3 * s + c2) * s + c1) * s + c0
+
+
+class HidrostatikTablo:
+    """
+    Bir geminin hidrostatik tablosu: draft → hidrostatik değerler ve deplasman → draft ile
+    değerler, her iki yönde monoton kübik (PCHIP) enterpolasyon. Enterpolantlar tablo
+    yüklenirken bir kez kurulur; sorgular dizi alır ve tek işlemde cevaplanır.
+    
+    Zorunlu sütunlar 'draft' (m) ve 'deplasman' (ton); diğerleri (km, kb, tpc [ton/cm],
+    mct [ton.m/cm], lcf, lcb [m] ...) isimleriyle sorgulanır.
+    """
+    
+    def __init__(self, sutunlar: Dict[str, "np.ndarray"]):
+        """
+        Args:
+            sutunlar: Sütun adı → değerler; satırlar draft'a göre artan sırada olmalıdır
+        """
+        veriler = {ad.strip().lower(): np.asarray(v, dtype=float) for ad, v in sutunlar.items()}
+        for zorunlu in ("draft", "deplasman"):
+            if zorunlu not in veriler:
+                raise ValueError(f"Hidrostatik tabloda '{zorunlu}' sütunu gerekli")
+        draft, deplasman = veriler["draft"], veriler["deplasman"]
+        if draft.ndim != 1 or draft.size < 2:
+            raise ValueError("Hidrostatik tablo en az iki satır içermelidir")
+        if any(v.shape != draft.shape for v in veriler.values()):
+            raise ValueError("Hidrostatik tablo sütunları aynı uzunlukta olmalıdır")
+        if np.any(np.diff(draft) <= 0) or np.any(np.diff(deplasman) <= 0):
+            raise ValueError("Draft ve deplasman draft ile kesin artan olmalıdır")
+        
+        self.sutunlar = tuple(veriler)
+        self.tablo = veriler
+        matris = np.column_stack([veriler[ad] for ad in self.sutunlar])
+        self._draft_ile = _MonotonKubik(draft, matris)
+        self._deplasman_ile = _MonotonKubik(deplasman, matris)
+    
+    @staticmethod
+    def _aralikta(eksen: np.ndarray, x, ad: str, birim: str) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        if np.any(x < eksen[0]) or np.any(x > eksen[-1]):
+            raise ValueError(f"{ad} hidrostatik tablo aralığı dışında ({eksen[0]:g}–{eksen[-1]:g} {birim})")
+        return x
+    
+    def _sozluk(self, degerler: np.ndarray) -> Dict[str, np.ndarray]:
+        return {ad: degerler[..., i] for i, ad in enumerate(self.sutunlar)}
+    
+    def draft_ile(self, draft) -> Dict[str, np.ndarray]:
+        """Draft(lar) için tüm hidrostatik değerler (sütun adı → dizi)"""
+        x = self._aralikta(self._draft_ile.x, draft, "Draft", "m")
+        return self._sozluk(self._draft_ile(x))
+    
+    def deplasman_ile(self, deplasman) -> Dict[str, np.ndarray]:
+        """Deplasman(lar) için draft dahil tüm hidrostatik değerler"""
+        x = self._aralikta(self._deplasman_ile.x, deplasman, "Deplasman", "ton")
+        return self._sozluk(self._deplasman_ile(x))
+    
+    def deplasmandan_draft(self, deplasman) -> np.ndarray:
+        """Deplasman(lar)a karşılık gelen ortalama draft (m)"""
+        return self.deplasman_ile(deplasman)["draft"]
+    
+    def drafttan_deplasman(self, draft) -> np.ndarray:
+        """Draft(lar)a karşılık gelen deplasman (ton)"""
+        return self.draft_ile(draft)["deplasman"]
+    
+    def _sutun(self, degerler: Dict[str, np.ndarray], ad: str) -> np.ndarray:
+        if ad not in degerler:
+            raise ValueError(f"Hidrostatik tabloda '{ad}' sütunu yok")
+        return degerler[ad]
+    
+    def gm(self, deplasman, kg) -> np.ndarray:
+        """GM = KM(Δ) − KG (metre), durum dizileri için"""
+        return self._sutun(self.deplasman_ile(deplasman), "km") - np.asarray(kg, dtype=float)
+    
+    def stabilite(self, deplasman: float, kg: float) -> EnineStabiliteHesaplama:
+        """KM tablodan alınmış EnineStabiliteHesaplama nesnesi"""
+        km = float(self._sutun(self.deplasman_ile(deplasman), "km"))
+        return EnineStabiliteHesaplama(deplasman, km, kg)
+    
+    def paralel_batma_cm(self, deplasman, w_ton) -> np.ndarray:
+        """Paralel batma/çıkma (cm) = w / TPC(Δ); bkz. paralel_batma_cm"""
+        return np.asarray(w_ton, dtype=float) / self._sutun(self.deplasman_ile(deplasman), "tpc")
+    
+    def trim_degisimi_cm(self, deplasman, trim_momenti_t_m) -> np.ndarray:
+        """ΔTrim (cm) = Trim momenti / MCT 1cm(Δ); bkz. delta_trim"""
+        return np.asarray(trim_momenti_t_m, dtype=float) / self._sutun(self.deplasman_ile(deplasman), "mct")
+    
+    def fwa_cm(self, deplasman) -> np.ndarray:
+        """FWA (cm) = Δ / (4 × TPC(Δ)); bkz. fwa_cm"""
+        deplasman = np.asarray(deplasman, dtype=float)
+        return deplasman / (4.0 * self._sutun(self.deplasman_ile(deplasman), "tpc"))
+    
+    @classmethod
+    def csv_metninden(cls, metin: str) -> "HidrostatikTablo":
+        """
+        CSV tablodan oluşturur: ilk satır sütun adları (draft, deplasman, km, tpc, mct,
+        lcf, lcb ...), sonraki satırlar draft'a göre artan değerler. '#' ile başlayan
+        satırlar yok sayılır.
+        """
+        satirlar = [r for r in csv.reader(io.StringIO(metin))
+                    if r and any(h.strip() for h in r) and not r[0].lstrip().startswith("#")]
+        if len(satirlar) < 3:
+            raise ValueError("Hidrostatik tablo bir başlık ve en az iki satır içermelidir")
+        basliklar = satirlar[0]
+        if any(len(r) != len(basliklar) for r in satirlar[1:]):
+            raise ValueError("Hidrostatik tablonun her satırı başlık kadar değer içermelidir")
+        try:
+            veri = np.array([[float(h) for h in r] for r in satirlar[1:]])
+        except ValueError as e:
+            raise ValueError(f"Hidrostatik tablo sayısal olmayan değer içeriyor: {e}") from None
+        return cls({ad: veri[:, i] for i, ad in enumerate(basliklar)})
+
+
+def hidrostatik_tablo_yukle(yol: str) -> HidrostatikTablo:
+    """Gemi hidrostatik tablosunu (CSV) yükler; aynı dosya değişmediği sürece tekrar okunmaz"""
+    return _onbellekli_tablo(yol, "hidrostatik", HidrostatikTablo.csv_metninden)
+
+
+# 12) IS CODE / SOLAS KRİTERLERİ (toplu değerlendirme)
+IS_KODU_SINIRLARI: Dict[str, float] = {
+    "alan_0_30": 0.055,  # m.rad
+    "alan_0_40": 0.090,  # m.rad, 40° ya da su alma açısına kadar
+    "alan_30_40": 0.030,  # m.rad, 30°'den 40° ya da su alma açısına kadar
+    "gz_30": 0.20,  # m, 30° ve üzeri açılarda GZ
+    "max_gz_acisi": 25.0,  # derece
+    "gm0": 0.15,  # m
+}
+
+
+@dataclass
+class KriterSonucu:
+    """Durum × kriter değerleri, sınırlar, paylar (değer − sınır) ve geçti/kaldı bilgisi"""
+    kriterler: Tuple[str, ...]
+    sinirlar: np.ndarray  # (n_kriter,)
+    degerler: np.ndarray  # (n_durum, n_kriter)
+    pay: np.ndarray  # (n_durum, n_kriter), kriterin biriminde
+    gecti: np.ndarray  # (n_durum, n_kriter) bool
+    
+    @property
+    def uygun(self) -> np.ndarray:
+        """Durum başına tüm kriterlerin sağlanıp sağlanmadığı, (n_durum,)"""
+        return self.gecti.all(axis=1)
+    
+    def durum(self, i: int) -> Dict[str, dict]:
+        """Tek durumun kriter tablosu: ad → {deger, sinir, pay, gecti}"""
+        return {
+            ad: {"deger": float(self.degerler[i, k]), "sinir": float(self.sinirlar[k]),
+                 "pay": float(self.pay[i, k]), "gecti": bool(self.gecti[i, k])}
+            for k, ad in enumerate(self.kriterler)
+        }
+
+
+def is_kodu_kriterleri(acilar, gz=None, gm=None, su_alma_acisi=None) -> KriterSonucu:
+    """
+    IS Code (2008) Bölüm A 2.2 genel kriterlerini çok sayıda GZ eğrisi için birlikte değerlendirir.
+    
+    Alanlar GZ eğrisinin doğrusal parçaları üzerinde tam alınır: 30°, 40° ya da su alma açısı
+    örnek açılara denk gelmediğinde GZ aralık uçlarında enterpole edilir. Eğrinin kapsamadığı
+    açılar eğrinin uçlarına sınırlanır; 30°'ye ulaşmayan eğride gz_30 değerlendirilemez (NaN, kaldı).
+    
+    Args:
+        acilar: Meyil açıları (derece), (n_aci,); ya da bir GZEgrisi (gz verilmez)
+        gz: GZ değerleri (metre), (n_durum, n_aci) ya da tek eğri için (n_aci,)
+        gm: Opsiyonel durum başına başlangıç GM (metre); verilirse gm0 kriteri eklenir
+        su_alma_acisi: Opsiyonel su alma açısı θf (derece), skaler ya da (n_durum,);
+            40°'den küçükse 0-40° ve 30-40° alanlarının üst sınırı olur
+    
+    Returns:
+        KriterSonucu (kriter sırası IS_KODU_SINIRLARI ile aynı)
+    """
+    egri = acilar if isinstance(acilar, GZEgrisi) else GZEgrisi(acilar, np.atleast_2d(np.asarray(gz, dtype=float)))
+    acilar, gz = egri.acilar, egri.gz
+    
+    ust = np.full(len(egri), 40.0)
+    if su_alma_acisi is not None:
+        ust = np.minimum(ust, np.broadcast_to(np.asarray(su_alma_acisi, dtype=float), ust.shape))
+    kumulatif = egri.kumulatif
+    alan_0 = _alan_acida(acilar, gz, kumulatif, 0.0)
+    alan_30 = _alan_acida(acilar, gz, kumulatif, 30.0)
+    alan_ust = _alan_acida(acilar, gz, kumulatif, ust)
+    
+    if acilar[-1] >= 30.0:
+        gz_30 = np.maximum(_aci_konumu(acilar, gz, 30.0)[4],
+                           np.max(np.where(acilar >= 30.0, gz, -np.inf), axis=1))
+    else:
+        gz_30 = np.full(len(egri), np.nan)
+    
+    sutunlar = {
+        "alan_0_30": alan_30 - alan_0,
+        "alan_0_40": alan_ust - alan_0,
+        "alan_30_40": np.maximum(alan_ust - alan_30, 0.0),
+        "gz_30": gz_30,
+        "max_gz_acisi": acilar[egri._max_indeks],
+    }
+    if gm is not None:
+        sutunlar["gm0"] = np.broadcast_to(np.asarray(gm, dtype=float), gz_30.shape)
+    
+    kriterler = tuple(sutunlar)
+    sinirlar = np.array([IS_KODU_SINIRLARI[ad] for ad in kriterler])
+    degerler = np.column_stack([sutunlar[ad] for ad in kriterler])
+    return KriterSonucu(
+        kriterler=kriterler,
+        sinirlar=sinirlar,
+        degerler=degerler,
+        pay=degerler - sinirlar,
+        gecti=degerler >= sinirlar,
+    )
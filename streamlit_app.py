@@ -21,7 +21,8 @@ from stability_calculator import (
     gg1_serbest_yuzey, kumelenme_acisi_derece, ghm_hesapla,
     simpson_bir_uc_kural, simpson_uc_sekiz_kural,
     yarali_stabilite_delta_T, max_yuk_miktari, max_yuk_yuksekligi,
-    sicaklikla_yogunluk, draft_okuma_metrik, draft_okuma_kraliyet
+    sicaklikla_yogunluk, draft_okuma_metrik, draft_okuma_kraliyet,
+    KNCaprazEgrileri
 )
 
 
@@ -32,6 +33,22 @@ st.set_page_config(
     layout="wide"
 )
 
+# Örnek KN çapraz eğrileri (deplasman [ton] × meyil açısı [°] → KN [m])
+ORNEK_KN_TABLOSU = """deplasman,0,10,20,30,40,50,60
+6000,0.0,1.60,3.20,4.60,5.60,6.20,6.40
+8000,0.0,1.55,3.10,4.45,5.40,6.00,6.20
+10000,0.0,1.50,3.00,4.30,5.20,5.80,6.00
+12000,0.0,1.45,2.90,4.15,5.00,5.55,5.75
+14000,0.0,1.40,2.80,4.00,4.80,5.30,5.50
+"""
+
+
+@st.cache_resource
+def kn_tablosu(metin: str) -> KNCaprazEgrileri:
+    """KN tablosu metin başına bir kez ayrıştırılır ve katsayıları önbellekte tutulur"""
+    return KNCaprazEgrileri.csv_metninden(metin)
+
+
 # Başlık ve açıklama
 st.title("🚢 Gemi Enine Stabilite Hesaplama Sistemi")
 st.markdown("""
@@ -390,36 +407,37 @@ with tab_gz:
     st.subheader("GZ Eğrisi Parametreleri")
     
     col1, col2 = st.columns(2)
+    with col2:
+        # KN çapraz eğrileri: geminin tablosu (CSV) ya da örnek tablo
+        kn_dosyasi = st.file_uploader("KN çapraz eğrileri (CSV: deplasman, açılar...)", type=["csv"])
+        try:
+            kn_metni = kn_dosyasi.getvalue().decode("utf-8") if kn_dosyasi is not None else ORNEK_KN_TABLOSU
+            kn_egrileri = kn_tablosu(kn_metni)
+        except ValueError as e:
+            st.error(f"KN tablosu okunamadı: {e}")
+            kn_egrileri = kn_tablosu(ORNEK_KN_TABLOSU)
+        if kn_dosyasi is None:
+            st.caption("Örnek KN tablosu kullanılıyor")
+        st.dataframe(pd.DataFrame(kn_egrileri.kn_tablosu,
+                                  index=kn_egrileri.deplasmanlar.astype(int),
+                                  columns=[f"{a:g}°" for a in kn_egrileri.acilar]))
+    
     with col1:
+        tablo_max_aci = int(kn_egrileri.acilar[-1])
         max_aci = st.number_input("Maksimum meyil açısı [°]", 
-                                 min_value=10, max_value=90, value=60)
+                                 min_value=min(10, tablo_max_aci), max_value=tablo_max_aci,
+                                 value=min(60, tablo_max_aci))
         aci_adimi = st.number_input("Açı adımı [°]", 
                                    min_value=5, max_value=15, value=10)
     
-    with col2:
-        # KN değerleri girişi
-        st.write("KN değerleri (örnek)")
-        kn_values = {
-            0: 0.0,
-            10: 1.5,
-            20: 3.0,
-            30: 4.3,
-            40: 5.2,
-            50: 5.8,
-            60: 6.0
-        }
-    
-    # GZ hesaplama
+    # GZ hesaplama: tüm açılar için tek KN sorgusu
     acilar = list(range(0, max_aci + 1, aci_adimi))
-    gz_degerleri = []
-    gz_egri = []
-    
-    for aci in acilar:
-        # Basit KN interpolasyonu
-        kn = np.interp(aci, list(kn_values.keys()), list(kn_values.values()))
-        gz = hesaplama.kn_den_gz_hesapla(kn, aci)
-        gz_degerleri.append(gz)
-        gz_egri.append((aci, gz))
+    try:
+        gz_degerleri = kn_egrileri.gz_egrisi(hesaplama.deplasman, hesaplama.kg, acilar).gz[0].tolist()
+    except ValueError as e:
+        st.error(str(e))
+        acilar, gz_degerleri = [], []
+    gz_egri = list(zip(acilar, gz_degerleri))
     
     # GZ eğrisi grafiği
     fig = go.Figure()
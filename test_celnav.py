@@ -0,0 +1,806 @@
+"""
+CelNav paketi için testler
+"""
+
+import argparse
+import importlib.util
+import io
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from celnav.core import (
+    apply_altitude_corrections,
+    compute_hc_zn,
+    parallax_alt_minutes_from_hp,
+    lha_from_gha_longitude,
+    Sight,
+    TrackLeg,
+    dr_offset_nm,
+    _advance,
+    _lop_line,
+    solve_fix_least_squares,
+)
+from celnav.batch import (
+    apply_altitude_corrections_batch,
+    compute_hc_zn_batch,
+    lop_lines_batch,
+    solve_fix_batch,
+    star_gha_dec_batch,
+    sun_aries_batch,
+    track_offsets_batch,
+)
+from celnav.almanac import _julian_day, compute_sun_gha_dec_from_iso, compute_aries_gha_from_iso, gha_star_from_aries_sha
+from celnav.stars import get_star, list_stars, star_columns
+from celnav.star_finder import find_stars
+from celnav.sight_table import build_sight_table, SightReductionTable, table_accuracy
+from celnav.almanac_store import BinaryAlmanac, TYPE_INT32, convert_json_to_binary
+from celnav.almanac_provider import TableAlmanacProvider
+from celnav.timescale import _date_jd, epoch_seconds, julian_day_array, julian_day_at_midnight, julian_day_of
+from celnav.cli import _record_converter, _sight_from_record, _sun_sight, build_parser, main
+from celnav.fix_stream import solve_stream, solve_stream_parallel
+from celnav.parallel import solve_fix_batch_parallel
+from celnav.server import Server, serve_unix
+from benchmarks.suite import CASES as BENCH_CASES, compare, main as suite_main, run_suite
+
+
+def _rastgele_gozlemler(n, seed=1):
+    rng = random.Random(seed)
+    lat = [rng.uniform(-89.0, 89.0) for _ in range(n)]
+    dec = [rng.uniform(-89.0, 89.0) for _ in range(n)]
+    lha = [rng.uniform(0.0, 360.0) for _ in range(n)]
+    return lat, dec, lha
+
+
+def test_hc_zn_batch_skaler_ile_ayni():
+    """Toplu Hc/Zn hesabı skaler fonksiyonla aynı sonucu vermeli"""
+    lat, dec, lha = _rastgele_gozlemler(500)
+    hc, zn = compute_hc_zn_batch(lat, dec, lha)
+    for i in range(len(lat)):
+        hc_s, zn_s = compute_hc_zn(lat[i], dec[i], lha[i])
+        assert abs(hc[i] - hc_s) < 1e-9
+        dzn = (zn[i] - zn_s + 180.0) % 360.0 - 180.0
+        assert abs(dzn) < 1e-9
+
+
+def test_hc_zn_batch_yayinim():
+    """Skaler φ, δ ile LHA dizisi yayınımı (broadcast)"""
+    lha = np.arange(0.0, 360.0, 15.0)
+    hc, zn = compute_hc_zn_batch(37.0, 23.4333, lha)
+    assert hc.shape == lha.shape and zn.shape == lha.shape
+    hc_s, zn_s = compute_hc_zn(37.0, 23.4333, 30.0)
+    assert abs(hc[2] - hc_s) < 1e-9 and abs(zn[2] - zn_s) < 1e-9
+
+
+def _sentetik_gozlemler(lat, lon, n, seed=2, offset=0.5):
+    """Bilinen mevkiden hesaplanan Ho ile sentetik gözlemler"""
+    rng = random.Random(seed)
+    sights = []
+    for _ in range(n):
+        gha = rng.uniform(0.0, 360.0)
+        dec = rng.uniform(-60.0, 60.0)
+        hc, _ = compute_hc_zn(lat, dec, lha_from_gha_longitude(gha, lon))
+        sights.append(Sight(
+            lat_assumed_deg=lat + rng.uniform(-offset, offset),
+            lon_assumed_deg=lon + rng.uniform(-offset, offset),
+            gha_deg=gha,
+            dec_deg=dec,
+            Ho_deg=hc,
+        ))
+    return sights
+
+
+def test_fix_analitik_jakobyen():
+    """Analitik kısmi türevler sonlu farklarla uyuşmalı ve mevki bulunmalı"""
+    lat0, lon0, gha, dec = 36.0, 25.0, 150.3333, 10.25
+    a, b, c = _lop_line(lat0, lon0, gha, dec, 45.0)
+    lha = lha_from_gha_longitude(gha, lon0)
+    d = 1e-6
+    hc, _ = compute_hc_zn(lat0, dec, lha)
+    hc_phi, _ = compute_hc_zn(lat0 + d, dec, lha)
+    hc_lon, _ = compute_hc_zn(lat0, dec, lha_from_gha_longitude(gha, lon0 + d))
+    assert abs(a - 60.0 * (hc_phi - hc) / d) < 1e-3
+    assert abs(b - 60.0 * (hc_lon - hc) / d) < 1e-3
+
+    sights = _sentetik_gozlemler(-41.25, 172.5, 4)
+    fix = solve_fix_least_squares(sights)
+    assert abs(fix.lat_deg - -41.25) < 1e-6
+    assert abs(fix.lon_deg - 172.5) < 1e-6
+    assert fix.rms_minutes < 1e-4
+    assert fix.num_sights == 4
+
+    a_b, b_b, c_b = lop_lines_batch(
+        [s.lat_assumed_deg for s in sights], [s.lon_assumed_deg for s in sights],
+        [s.gha_deg for s in sights], [s.dec_deg for s in sights], [s.Ho_deg for s in sights],
+    )
+    for i, s in enumerate(sights):
+        a_s, b_s, c_s = _lop_line(s.lat_assumed_deg, s.lon_assumed_deg, s.gha_deg, s.dec_deg, s.Ho_deg)
+        assert abs(a_b[i] - a_s) < 1e-9 and abs(b_b[i] - b_s) < 1e-9 and abs(c_b[i] - c_s) < 1e-9
+
+
+def test_fix_batch_skaler_ile_ayni():
+    """Toplu fix çözücü her grup için skaler çözücüyle aynı mevkiyi vermeli"""
+    rng = random.Random(5)
+    gruplar = []
+    for k in range(40):
+        lat = rng.uniform(-70.0, 70.0)
+        lon = rng.uniform(-179.0, 179.0)
+        gruplar.append(_sentetik_gozlemler(lat, lon, rng.randint(2, 8), seed=k))
+
+    rows = [(k, s) for k, g in enumerate(gruplar) for s in g]
+    rng.shuffle(rows)
+    res = solve_fix_batch(
+        [s.lat_assumed_deg for _, s in rows],
+        [s.lon_assumed_deg for _, s in rows],
+        [s.gha_deg for _, s in rows],
+        [s.dec_deg for _, s in rows],
+        [s.Ho_deg for _, s in rows],
+        [k for k, _ in rows],
+    )
+    for k, g in enumerate(gruplar):
+        fix = solve_fix_least_squares(g)
+        assert abs(res.lat_deg[k] - fix.lat_deg) < 1e-6
+        assert abs(res.lon_deg[k] - fix.lon_deg) < 1e-6
+        assert abs(res.rms_minutes[k] - fix.rms_minutes) < 1e-4
+        assert res.num_sights[k] == len(g)
+
+
+def test_dayanikli_fix_ve_hata_elipsi(capsys):
+    """Huber/Tukey aykırı gözlemi bastırmalı; kovaryans, elips ve DOP skaler/toplu tutarlı olmalı"""
+    sights = _sentetik_gozlemler(36.0, 25.0, 8, seed=3)
+    sights[3] = Sight(sights[3].lat_assumed_deg, sights[3].lon_assumed_deg, sights[3].gha_deg,
+                      sights[3].dec_deg, sights[3].Ho_deg + 20.0 / 60.0)
+    ls = solve_fix_least_squares(sights)
+    assert ls.outliers == () and ls.weights is None
+    for yontem in ("huber", "tukey"):
+        fix = solve_fix_least_squares(sights, robust=yontem)
+        hata = math.hypot(fix.lat_deg - 36.0, (fix.lon_deg - 25.0) * math.cos(math.radians(36.0))) * 60.0
+        assert hata < 0.5, (yontem, hata)
+        assert fix.outliers == (3,)
+        assert fix.weights[3] < 0.2 and min(w for i, w in enumerate(fix.weights) if i != 3) > 0.9
+    assert math.hypot(ls.lat_deg - 36.0, (ls.lon_deg - 25.0) * math.cos(math.radians(36.0))) * 60.0 > 1.0
+
+    # Elips ve DOP: kovaryansın öz değerleri, σ ölçeklemesi
+    fix = solve_fix_least_squares(sights[:3] + sights[4:], sigma_minutes=2.0)
+    (c11, c12), (_, c22) = fix.covariance_nm2
+    iz = c11 + c22
+    assert abs(fix.ellipse.semi_major_nm ** 2 + fix.ellipse.semi_minor_nm ** 2 - iz) < 1e-9
+    assert abs(fix.ellipse.semi_major_nm ** 2 * fix.ellipse.semi_minor_nm ** 2 - (c11 * c22 - c12 * c12)) < 1e-9
+    assert abs(fix.dop * 2.0 - math.sqrt(iz)) < 1e-9
+    # Dar açılı iki LOP (Zn farkı ~20°): büyük eksen LOP'lar boyunca, azimutların ortalamasına dik uzanır
+    kesit = []
+    for gha in (330.0, 340.0):
+        hc, zn = compute_hc_zn(36.0, 20.0, lha_from_gha_longitude(gha, 25.0))
+        kesit.append((Sight(36.2, 25.2, gha, 20.0, hc), zn))
+    e = solve_fix_least_squares([k for k, _ in kesit], sigma_minutes=1.0).ellipse
+    beklenen = (0.5 * (kesit[0][1] + kesit[1][1]) + 90.0) % 180.0
+    assert e.semi_major_nm > 3.0 * e.semi_minor_nm
+    assert min(abs(e.orientation_deg - beklenen), 180.0 - abs(e.orientation_deg - beklenen)) < 0.5
+
+    # Toplu çözücü: aynı ağırlıklar, aykırı bayrakları ve kalite ölçüleri
+    rng = random.Random(11)
+    gruplar = [_sentetik_gozlemler(rng.uniform(-60, 60), rng.uniform(-170, 170), rng.randint(5, 9), seed=k) for k in range(25)]
+    for k, g in enumerate(gruplar[::2]):
+        s = g[k % len(g)]
+        g[k % len(g)] = Sight(s.lat_assumed_deg, s.lon_assumed_deg, s.gha_deg, s.dec_deg, s.Ho_deg + rng.choice([-1, 1]) * 0.3)
+    rows = [(k, i, s) for k, g in enumerate(gruplar) for i, s in enumerate(g)]
+    rng.shuffle(rows)
+    kolon = lambda f: [f(s) for _, _, s in rows]
+    for yontem in (None, "huber", "tukey"):
+        res = solve_fix_batch(
+            kolon(lambda s: s.lat_assumed_deg), kolon(lambda s: s.lon_assumed_deg), kolon(lambda s: s.gha_deg),
+            kolon(lambda s: s.dec_deg), kolon(lambda s: s.Ho_deg), [k for k, _, _ in rows], robust=yontem,
+        )
+        tekler = [solve_fix_least_squares(g, robust=yontem) for g in gruplar]
+        for k, tek in enumerate(tekler):
+            assert abs(res.lat_deg[k] - tek.lat_deg) < 1e-6 and abs(res.lon_deg[k] - tek.lon_deg) < 1e-6
+            assert abs(res.sigma_minutes[k] - tek.sigma_minutes) < 1e-6
+            assert np.allclose(res.covariance_nm2[k], tek.covariance_nm2, rtol=1e-6, atol=1e-9)
+            assert abs(res.ellipse_major_nm[k] - tek.ellipse.semi_major_nm) < 1e-6
+            assert abs(res.ellipse_minor_nm[k] - tek.ellipse.semi_minor_nm) < 1e-6
+            assert abs(res.dop[k] - tek.dop) < 1e-9
+        for j, (k, i, _) in enumerate(rows):
+            assert bool(res.outlier[j]) == (i in tekler[k].outliers)
+            if yontem is not None:
+                assert abs(res.weights[j] - tekler[k].weights[i]) < 1e-6
+
+    kayitlar = json.dumps([
+        {"body": "sun", "lat": s.lat_assumed_deg, "lon": s.lon_assumed_deg, "GHA": s.gha_deg,
+         "dec": s.dec_deg, "Ho": s.Ho_deg} for s in sights
+    ])
+    assert main(["fix", "--json", kayitlar, "--robust", "huber"]) == 0
+    cikti = capsys.readouterr().out
+    assert "Error ellipse" in cikti and "DOP" in cikti and "Outliers (sight #): 4" in cikti
+
+
+def test_fix_akis_ndjson(tmp_path, capsys, monkeypatch):
+    """fix --stream: NDJSON kayıtları fix kimliğine göre gruplanmalı, her fix için bir satır yazılmalı"""
+    gruplar = [_sentetik_gozlemler(10.0 * k, 20.0 - 7.0 * k, 3 + k, seed=k) for k in range(4)]
+    satirlar = []
+    for k, g in enumerate(gruplar):
+        for s in g:
+            satirlar.append(json.dumps({"fix_id": f"F{k}", "body": "sun", "lat": s.lat_assumed_deg,
+                                        "lon": s.lon_assumed_deg, "GHA": s.gha_deg, "dec": s.dec_deg, "Ho": s.Ho_deg}))
+    satirlar.insert(4, "")
+    satirlar.append(json.dumps({"fix_id": "hatali", "body": "star", "star": "Yok", "GHA_aries": 1.0,
+                                "lat": 0, "lon": 0, "Ho": 10}))
+    satirlar.append(json.dumps({"fix_id": "tek", "body": "sun", "lat": 0, "lon": 0, "GHA": 1, "dec": 1, "Ho": 10}))
+    dosya = tmp_path / "gozlemler.ndjson"
+    dosya.write_text("\n".join(satirlar) + "\n", encoding="utf-8")
+
+    assert main(["fix", "--stream", str(dosya)]) == 0
+    cikti = capsys.readouterr()
+    sonuclar = [json.loads(l) for l in cikti.out.splitlines()]
+    assert [r["fix_id"] for r in sonuclar] == ["F0", "F1", "F2", "F3", "hatali", "tek"]
+    for r, g in zip(sonuclar, gruplar):
+        fix = solve_fix_least_squares(g)
+        assert abs(r["lat"] - fix.lat_deg) < 1e-6 and abs(r["lon"] - fix.lon_deg) < 1e-6
+        assert r["num_sights"] == len(g) and len(r["ellipse_nm"]) == 3
+    assert "Unknown star" in sonuclar[4]["error"] and "two sights" in sonuclar[5]["error"]
+    assert "6 fixes (2 failed)" in cikti.err and "fixes/s" in cikti.err
+
+    # stdin ve sonsuz akış: üreteç hattı yalnızca tüketilen kadar okur
+    monkeypatch.setattr(sys, "stdin", io.StringIO(dosya.read_text(encoding="utf-8")))
+    assert main(["fix", "--stream", "--robust", "huber"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 6
+
+    def sonsuz():
+        for k in itertools.count():
+            for s in gruplar[k % 4]:
+                yield json.dumps({"fix_id": k, "lat": s.lat_assumed_deg, "lon": s.lon_assumed_deg,
+                                  "GHA": s.gha_deg, "dec": s.dec_deg, "Ho": s.Ho_deg})
+    ilk = list(itertools.islice(solve_stream(sonsuz(), lambda r: _sight_from_record(r, None, None)), 9))
+    assert [r["fix_id"] for r in ilk] == list(range(9))
+
+    dosya.write_text('{"fix_id": 1}\nbozuk\n', encoding="utf-8")
+    try:
+        main(["fix", "--stream", str(dosya)])
+    except SystemExit as e:
+        assert "line 2" in str(e)
+    else:
+        raise AssertionError("bozuk satır")
+
+
+def _seyir_gozlemleri(lat, lon, track, ref_utc, saatler, seed):
+    """Rota üzerinde ilerleyen gemiden, her gözlem anındaki gerçek mevkiden hesaplanan gözlemler"""
+    rng = random.Random(seed)
+    t_ref = datetime.fromisoformat(ref_utc.replace("Z", "+00:00")).timestamp()
+    sights = []
+    for saat in saatler:
+        utc = datetime.fromtimestamp(t_ref + saat * 3600.0, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        lat_s, lon_s = _advance(lat, lon, *dr_offset_nm(track, ref_utc, utc))
+        gha = rng.uniform(0.0, 360.0)
+        dec = rng.uniform(-40.0, 40.0)
+        hc, _ = compute_hc_zn(lat_s, dec, lha_from_gha_longitude(gha, lon_s))
+        sights.append(Sight(lat + rng.uniform(-0.5, 0.5), lon + rng.uniform(-0.5, 0.5), gha, dec, hc, utc=utc))
+    return sights
+
+
+def test_seyir_halinde_fix(capsys):
+    """Running fix: LOP'lar rota/hız ile referans zamana taşınmalı (skaler, toplu ve CLI)"""
+    ref = "2025-06-21T12:00:00Z"
+    sabit = [TrackLeg(ref, 60.0, 15.0)]
+    sights = _seyir_gozlemleri(36.0, 25.0, sabit, ref, [-3.0, -2.0, -1.0, 0.0], seed=1)
+    fix = solve_fix_least_squares(sights, course_deg=60.0, speed_kn=15.0)
+    assert fix.utc == ref
+    assert abs(fix.lat_deg - 36.0) < 1e-6 and abs(fix.lon_deg - 25.0) < 1e-6 and fix.rms_minutes < 1e-4
+    duragan = solve_fix_least_squares(sights)
+    assert abs(duragan.lat_deg - 36.0) * 60.0 > 1.0 or abs(duragan.lon_deg - 25.0) * 60.0 > 1.0
+    try:
+        solve_fix_least_squares(_sentetik_gozlemler(36.0, 25.0, 3), course_deg=60.0, speed_kn=15.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("zamansız gözlem")
+
+    # İki bacaklı DR rotası: skaler ve toplu ofsetler aynı
+    rota = [TrackLeg("2025-06-21T08:00:00Z", 90.0, 12.0), TrackLeg("2025-06-21T10:30:00Z", 200.0, 8.0)]
+    zamanlar = ["2025-06-21T07:00:00Z", "2025-06-21T09:10:00Z", "2025-06-21T11:45:00Z"]
+    kuzey, dogu = track_offsets_batch(zamanlar, "2025-06-21T10:00:00Z", [l.start_utc for l in rota],
+                                      [l.course_deg for l in rota], [l.speed_kn for l in rota])
+    for t, n, e in zip(zamanlar, kuzey, dogu):
+        n_s, e_s = dr_offset_nm(rota, "2025-06-21T10:00:00Z", t)
+        assert abs(n - n_s) < 1e-9 and abs(e - e_s) < 1e-9
+    assert abs(dr_offset_nm(rota, "2025-06-21T10:00:00Z", "2025-06-21T10:30:00Z")[1] - 6.0) < 1e-9
+
+    # Toplu: bütün bir seyrin running fix'leri, tek bir rota üzerinden
+    gruplar, ref_zamanlar = [], []
+    for k in range(12):
+        ref_k = f"2025-06-21T{8 + k // 2:02d}:{30 * (k % 2):02d}:00Z"
+        gruplar.append(_seyir_gozlemleri(-20.0 + k, 150.0 + k, rota, ref_k, [-2.0, -1.2, -0.5, 0.0], seed=k))
+        ref_zamanlar.append(ref_k)
+    rows = [(k, s) for k, g in enumerate(gruplar) for s in g]
+    kuzey, dogu = track_offsets_batch([s.utc for _, s in rows], np.array(ref_zamanlar)[[k for k, _ in rows]],
+                                      [l.start_utc for l in rota], [l.course_deg for l in rota], [l.speed_kn for l in rota])
+    res = solve_fix_batch(
+        [s.lat_assumed_deg for _, s in rows], [s.lon_assumed_deg for _, s in rows],
+        [s.gha_deg for _, s in rows], [s.dec_deg for _, s in rows], [s.Ho_deg for _, s in rows],
+        [k for k, _ in rows], offset_north_nm=kuzey, offset_east_nm=dogu,
+    )
+    for k, g in enumerate(gruplar):
+        tek = solve_fix_least_squares(g, track=rota, ref_utc=ref_zamanlar[k])
+        assert abs(res.lat_deg[k] - tek.lat_deg) < 1e-6 and abs(res.lon_deg[k] - tek.lon_deg) < 1e-6
+        assert abs(res.lat_deg[k] - (-20.0 + k)) < 1e-6 and abs(res.lon_deg[k] - (150.0 + k)) < 1e-6
+
+    kayitlar = json.dumps([
+        {"body": "sun", "lat": s.lat_assumed_deg, "lon": s.lon_assumed_deg, "GHA": s.gha_deg,
+         "dec": s.dec_deg, "Ho": s.Ho_deg, "utc": s.utc} for s in sights
+    ])
+    assert main(["fix", "--json", kayitlar, "--course", "60", "--speed", "15"]) == 0
+    cikti = capsys.readouterr().out
+    assert "Fix Time (UTC): 2025-06-21T12:00:00Z" in cikti and "36.00000°" in cikti and "25.00000°" in cikti
+
+
+def test_sight_table_arama(tmp_path):
+    """Hazır tablo aramaları compute_hc_zn ile 0.1′ içinde uyuşmalı"""
+    path = str(tmp_path / "srt.bin")
+    build_sight_table(path)
+    table = SightReductionTable(path)
+    acc = table_accuracy(table, samples=20000)
+    assert acc["hc_max_err_minutes"] < 0.1
+    assert acc["zn_rms_err_deg"] < 0.05
+
+    hc, zn = table.lookup(-37.0, -23.4333, 30.0)
+    hc_s, zn_s = compute_hc_zn(-37.0, -23.4333, 30.0)
+    assert abs(hc - hc_s) * 60.0 < 0.1
+    assert abs(zn - zn_s) < 0.1
+
+
+def test_srt_akis_ciktisi(tmp_path):
+    """srt satır sayısı kesin olmalı; CSV ve .npy çıktıları aynı değerleri taşımalı"""
+    csv_path = tmp_path / "srt.csv"
+    npy_path = tmp_path / "srt.npy"
+    ortak = ["srt", "--lat", "37", "--dec", "23.4333", "--lha-start", "0", "--lha-stop", "360", "--lha-step", "0.1"]
+    assert main(ortak + ["--out", str(csv_path)]) == 0
+    assert main(ortak + ["--out", str(npy_path)]) == 0
+
+    satirlar = csv_path.read_text(encoding="utf-8").splitlines()
+    assert satirlar[0] == "LHA,Hc_deg,Zn_deg"
+    assert len(satirlar) == 1 + 3601
+    tablo = np.load(npy_path)
+    assert tablo.shape == (3601, 3)
+    hc, zn = compute_hc_zn(37.0, 23.4333, 30.0)
+    assert satirlar[1 + 300] == f"30.00,{hc:.6f},{zn:.6f}"
+    assert abs(tablo[300, 1] - hc) < 1e-12
+
+
+def test_paralel_isciler(tmp_path, capsys):
+    """--workers: srt, toplu fix ve akış fix'i tek süreçle birebir aynı sonucu, aynı sırada vermeli"""
+    ortak = ["srt", "--lat", "37", "--dec", "23.4333", "--lha-start", "0", "--lha-stop", "360", "--lha-step", "0.005"]
+    assert main(ortak + ["--out", str(tmp_path / "tek.npy")]) == 0
+    assert main(ortak + ["--out", str(tmp_path / "cok.npy"), "--workers", "2"]) == 0
+    assert (tmp_path / "tek.npy").read_bytes() == (tmp_path / "cok.npy").read_bytes()
+    assert main(ortak + ["--out", str(tmp_path / "tum.npy"), "--workers", "0"]) == 0  # 0: tüm çekirdekler
+    assert (tmp_path / "tek.npy").read_bytes() == (tmp_path / "tum.npy").read_bytes()
+    assert np.load(tmp_path / "cok.npy").shape == (72001, 3)
+
+    rng = random.Random(17)
+    gruplar = [_sentetik_gozlemler(rng.uniform(-60, 60), rng.uniform(-170, 170), rng.randint(3, 7), seed=k) for k in range(30)]
+    rows = [(k, s) for k, g in enumerate(gruplar) for s in g]
+    rng.shuffle(rows)
+    kolonlar = [[getattr(s, a) for _, s in rows] for a in ("lat_assumed_deg", "lon_assumed_deg", "gha_deg", "dec_deg", "Ho_deg")]
+    kuzey = [rng.uniform(-5, 5) for _ in rows]
+    for secenek in ({}, {"robust": "tukey"}, {"offset_north_nm": kuzey}):
+        tek = solve_fix_batch(*kolonlar, [k for k, _ in rows], **secenek)
+        cok = solve_fix_batch_parallel(*kolonlar, [k for k, _ in rows], workers=2, chunk_fixes=7, **secenek)
+        for alan in ("lat_deg", "lon_deg", "rms_minutes", "num_sights", "covariance_nm2", "dop", "outlier", "weights"):
+            a, b = getattr(tek, alan), getattr(cok, alan)
+            assert (a is None and b is None) or np.array_equal(a, b), alan
+
+    satirlar = [json.dumps({"fix_id": k, "lat": s.lat_assumed_deg, "lon": s.lon_assumed_deg, "GHA": s.gha_deg,
+                            "dec": s.dec_deg, "Ho": s.Ho_deg}) for k, g in enumerate(gruplar) for s in g]
+    satirlar.insert(20, json.dumps({"fix_id": "hatali", "body": "star", "star": "Yok", "GHA_aries": 1, "lat": 0, "lon": 0, "Ho": 1}))
+    dosya = tmp_path / "gozlemler.ndjson"
+    dosya.write_text("\n".join(satirlar) + "\n", encoding="utf-8")
+    assert main(["fix", "--stream", str(dosya)]) == 0
+    tek = capsys.readouterr().out
+    for isci in ("2", "0"):
+        assert main(["fix", "--stream", str(dosya), "--workers", isci]) == 0
+        assert capsys.readouterr().out == tek
+    kucuk = list(solve_stream_parallel(satirlar, partial(_record_converter, "series", None), 2, chunk_fixes=4))
+    assert [json.dumps(r, separators=(",", ":")) for r in kucuk] == tek.splitlines()
+
+
+def test_sunucu_json_satirlari(tmp_path):
+    """serve: stdin/stdout ve Unix soket üzerinden CLI ile aynı sonuçlar; boru hattı, hatalar ve gecikme yüzdelikleri"""
+    gunes = {"lat": 36, "lon": 25, "gha": 150.3333, "dec": 10.25, "hs": 45.2, "height": 2.5}
+    gozlemler = [{"body": "sun", "lat": s.lat_assumed_deg, "lon": s.lon_assumed_deg, "GHA": s.gha_deg,
+                  "dec": s.dec_deg, "Ho": s.Ho_deg} for s in _sentetik_gozlemler(36.0, 25.0, 5)]
+    istekler = [
+        {"id": 1, "op": "sun", "args": gunes},
+        {"id": 2, "op": "moon", "args": dict(gunes, hp_min=58.1, limb="UL")},
+        {"id": 3, "op": "fix", "args": {"sights": gozlemler, "robust": "huber"}},
+        {"id": 4, "op": "almanac-aries", "args": {"utc": "2025-06-21T12:00:00Z"}},
+        {"id": 5, "op": "srt", "args": {"lat": 37, "dec": 23.4333, "lha_start": 0, "lha_stop": 30}},
+        {"id": 6, "op": "sun", "args": {"lat": 36}},
+        {"id": 7, "op": "yok"},
+        {"id": 8, "op": "star", "args": dict(gunes, yok=1)},
+    ]
+    girdi = "\n".join(json.dumps(r) for r in istekler) + "\nbozuk\n"
+    p = subprocess.run([sys.executable, "-m", "celnav", "serve"], input=girdi, capture_output=True, text=True,
+                       cwd=Path(__file__).parent, check=True)
+    yanitlar = [json.loads(l) for l in p.stdout.splitlines()]
+    assert [y["id"] for y in yanitlar] == [1, 2, 3, 4, 5, 6, 7, 8, None]
+    assert [y["ok"] for y in yanitlar] == [True] * 5 + [False] * 4
+
+    ns = argparse.Namespace(**dict(build_parser("sun").parse_args(
+        ["sun"] + [f"--{k}={v}" for k, v in gunes.items()]).__dict__))
+    assert yanitlar[0]["result"] == json.loads(json.dumps(_sun_sight(ns)))
+    fix = solve_fix_least_squares(_sentetik_gozlemler(36.0, 25.0, 5), robust="huber")
+    assert abs(yanitlar[2]["result"]["lat"] - fix.lat_deg) < 1e-6 and yanitlar[2]["result"]["num_sights"] == 5
+    assert abs(yanitlar[3]["result"]["gha"] - compute_aries_gha_from_iso("2025-06-21T12:00:00Z").gha_deg) < 1e-12
+    assert len(yanitlar[4]["result"]["hc"]) == 7
+    assert "lon, gha, dec, hs" in yanitlar[5]["error"] and "unknown op" in yanitlar[6]["error"]
+    assert "unknown argument" in yanitlar[7]["error"] and "invalid JSON" in yanitlar[8]["error"]
+    assert "p99 ms" in p.stderr and "sun" in p.stderr
+
+    # Soket: birden çok istemci, her biri istekleri boru hattıyla art arda gönderir
+    sunucu = Server()
+    soket_yolu = str(tmp_path / "celnav.sock")
+    srv = serve_unix(soket_yolu, sunucu)
+    try:
+        def istemci(k, sonuc):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as c:
+                c.connect(soket_yolu)
+                f = c.makefile("rwb")
+                for i in range(50):
+                    f.write(json.dumps({"id": [k, i], "op": "sun", "args": dict(gunes, hs=20 + i)}).encode() + b"\n")
+                f.flush()
+                sonuc[k] = [json.loads(f.readline()) for _ in range(50)]
+        sonuclar = {}
+        ipler = [threading.Thread(target=istemci, args=(k, sonuclar)) for k in range(4)]
+        for t in ipler:
+            t.start()
+        for t in ipler:
+            t.join(10)
+        for k in range(4):
+            assert [y["id"] for y in sonuclar[k]] == [[k, i] for i in range(50)]
+            assert all(y["ok"] for y in sonuclar[k])
+        assert sonuclar[0][5]["result"] == sonuclar[3][5]["result"]
+        ozet = sunucu.handle({"id": "s", "op": "stats"})["result"]["sun"]
+        assert ozet["count"] == 200 and ozet["errors"] == 0
+        assert ozet["p50_ms"] <= ozet["p90_ms"] <= ozet["p99_ms"] <= ozet["max_ms"]
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+    # Beklenmeyen hatalar (okunamayan almanak dosyası) yalnız o isteği düşürür; sunucu yanıt vermeye devam eder
+    yok = str(tmp_path / "yok.bin")
+    istekler = [
+        {"id": 1, "op": "almanac-sun", "args": {"utc": "2025-06-21T12:00Z", "almanac": "table", "almanac_file": [yok]}},
+        {"id": 2, "op": "almanac-sun", "args": {"utc": "2025-06-21T12:00Z", "almanac": "table", "almanac_file": yok}},
+        {"id": 3, "op": "ping"},
+    ]
+    p = subprocess.run([sys.executable, "-m", "celnav", "serve"], input="\n".join(json.dumps(r) for r in istekler),
+                       capture_output=True, text=True, cwd=Path(__file__).parent, check=True)
+    yanitlar = [json.loads(l) for l in p.stdout.splitlines()]
+    assert [y["ok"] for y in yanitlar] == [False, False, True] and yanitlar[2]["result"] == "pong"
+    assert all("yok.bin" in y["error"] for y in yanitlar[:2])
+    assert Server().handle({"op": "almanac-sun", "args": {"utc": "2025-06-21T12:00Z", "almanac": "table",
+                                                          "almanac_file": yok}})["ok"] is False
+
+    # --socket yalnız eski bir soketin yerine geçer, sıradan bir dosyayı silmez
+    dosya = tmp_path / "soket_degil.txt"
+    dosya.write_text("veri")
+    try:
+        serve_unix(str(dosya), Server())
+    except ValueError as e:
+        assert "not a socket" in str(e)
+    else:
+        raise AssertionError("sıradan dosya soket yolu olarak kabul edildi")
+    assert dosya.read_text() == "veri"
+
+
+def test_benchmark_paketi(tmp_path, capsys):
+    """Kıyaslama paketi: tohumlu iş yükleri tekrarlanabilir, rapor JSON, regresyon eşiği çıkış kodunu belirler"""
+    yuk1 = BENCH_CASES["fix_multi_star"].build(random.Random("7:fix_multi_star"), 0.01)
+    yuk2 = BENCH_CASES["fix_multi_star"].build(random.Random("7:fix_multi_star"), 0.01)
+    assert yuk1[1] == yuk2[1] and len(yuk1[1]) == 5
+
+    rapor = run_suite(["hc_zn", "fix_multi_star", "srt_full"], seed=7, scale=0.01, repeat=1)
+    assert set(rapor["results"]) == {"hc_zn", "fix_multi_star", "srt_full"}
+    assert rapor["config"] == {"seed": 7, "scale": 0.01, "repeat": 1}
+    srt = rapor["results"]["srt_full"]
+    assert srt["units"] == 36001 and srt["calls"] == 1 and srt["ops_per_s"] > 0 and srt["peak_kib"] > 0
+    for r in rapor["results"].values():
+        assert r["latency_us"]["p50"] <= r["latency_us"]["p99"] <= r["latency_us"]["max"]
+
+    yavas = json.loads(json.dumps(rapor))
+    yavas["results"]["hc_zn"]["ops_per_s"] *= 0.8
+    yavas["results"]["srt_full"]["peak_kib"] += 1024.0
+    satirlar = {r["case"]: r["regression"] for r in compare(rapor, yavas, 0.1)}
+    assert satirlar == {"hc_zn": ["throughput"], "fix_multi_star": [], "srt_full": ["memory"]}
+    assert not any(r["regression"] for r in compare(rapor, yavas, 0.3) if r["case"] == "hc_zn")
+
+    taban, yeni = tmp_path / "taban.json", tmp_path / "yeni.json"
+    taban.write_text(json.dumps(rapor))
+    yeni.write_text(json.dumps(yavas))
+    assert suite_main(["compare", str(taban), str(taban)]) == 0
+    assert suite_main(["compare", str(taban), str(yeni), "--threshold", "0.1"]) == 1
+    assert "hc_zn, srt_full" in capsys.readouterr().out
+    try:
+        run_suite(["yok"])
+    except ValueError as e:
+        assert "unknown case" in str(e)
+    else:
+        raise AssertionError("bilinmeyen durum kabul edildi")
+
+
+IMPORT_BUDGET_MS = float(os.environ.get("CELNAV_IMPORT_BUDGET_MS", "15"))
+
+
+def test_cli_baslangic_suresi():
+    """`import celnav.cli` + tek alt komut ayrıştırıcısı bütçe içinde kalmalı; ağır modüller yüklenmemeli"""
+    kod = (
+        "import sys, time; t = time.perf_counter(); import celnav.cli; "
+        "celnav.cli.build_parser('eot').parse_args(['eot', '--doy', '100']); "
+        "print((time.perf_counter() - t) * 1e3); "
+        "print(' '.join(m for m in ('numpy', 'json', 'celnav.core', 'celnav.almanac', 'celnav.stars') if m in sys.modules))"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    olcumler = []
+    for _ in range(6):  # ilk çalıştırma .pyc dosyalarını yazar
+        cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, env=env,
+                               cwd=Path(__file__).parent, check=True).stdout.split("\n")
+        olcumler.append(float(cikti[0]))
+        assert cikti[1] == "", f"başlangıçta yüklenen modüller: {cikti[1]}"
+    assert min(olcumler[1:]) < IMPORT_BUDGET_MS, olcumler
+
+    import celnav
+    assert celnav.compute_hc_zn is compute_hc_zn and "intercept" in dir(celnav)
+    try:
+        celnav.yok
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("celnav.yok")
+    # Yalnızca seçilen alt komutun ayrıştırıcısı kurulur; bilinmeyen komutta hepsi (hata/yardım için)
+    assert set(build_parser("fix")._subparsers._group_actions[0].choices) == {"fix"}
+    assert len(build_parser("yok")._subparsers._group_actions[0].choices) == len(build_parser()._subparsers._group_actions[0].choices) == 15
+
+
+def test_yukseklik_duzeltmeleri_toplu():
+    """Toplu Ho hesabı skaler düzeltme zinciriyle aynı olmalı (Ay için satır bazlı paralaks dahil)"""
+    rng = random.Random(7)
+    n = 300
+    hs = [rng.uniform(-1.0, 89.0) for _ in range(n)]
+    ie = [rng.uniform(-3.0, 3.0) for _ in range(n)]
+    h = [rng.choice([0.0, rng.uniform(0.0, 30.0)]) for _ in range(n)]
+    p = [rng.uniform(950.0, 1050.0) for _ in range(n)]
+    t = [rng.uniform(-20.0, 40.0) for _ in range(n)]
+    ll = [rng.random() < 0.5 for _ in range(n)]
+    hp = [rng.choice([float("nan"), rng.uniform(54.0, 61.5)]) for _ in range(n)]
+
+    ho = apply_altitude_corrections_batch(hs, ie, h, p, t, 15.8, ll, 0.1, hp_minutes=hp)
+    for i in range(n):
+        parallax = 0.1 if math.isnan(hp[i]) else parallax_alt_minutes_from_hp(hs[i], hp[i])
+        ho_s = apply_altitude_corrections(hs[i], ie[i], h[i], p[i], t[i], 15.8, ll[i], parallax)
+        assert abs(ho[i] - ho_s) < 1e-12
+
+
+def test_almanak_toplu_skaler_ile_ayni():
+    """Toplu Güneş/Aries almanağı skaler seriyle aynı olmalı"""
+    assert _julian_day(2000, 1, 1, 12) == 2451545.0
+    assert _julian_day(2025, 1, 1) == 2460676.5
+
+    instants = np.datetime64("2025-01-01T00:00") + np.arange(0, 366 * 24 * 60, 997).astype("timedelta64[m]")
+    batch = sun_aries_batch(instants)
+    epoch = sun_aries_batch(instants.astype("datetime64[s]").astype(np.int64).astype(float))
+    assert np.array_equal(batch.gha_sun_deg, epoch.gha_sun_deg)
+    for i, t in enumerate(instants.astype(str)):
+        iso = t + "Z"
+        sun = compute_sun_gha_dec_from_iso(iso)
+        ar = compute_aries_gha_from_iso(iso)
+        assert abs(((batch.gha_sun_deg[i] - sun.gha_deg + 180.0) % 360.0) - 180.0) < 1e-6
+        assert abs(batch.dec_sun_deg[i] - sun.dec_deg) < 1e-6
+        assert abs(((batch.gha_aries_deg[i] - ar.gha_deg + 180.0) % 360.0) - 180.0) < 1e-6
+
+
+def test_zaman_katmani():
+    """ISO, epoch, datetime ve datetime64 aynı Jülyen gününü vermeli; tarih terimleri önbellekte"""
+    beklenen = 2460848.0 + 30.5 / 1440.0  # 2025-06-21T12:30:30Z
+    turler = [
+        "2025-06-21T12:30:30Z",
+        "2025-06-21 12:30:30.000",
+        "2025-06-21T12:30:30+00:00",
+        datetime(2025, 6, 21, 12, 30, 30, tzinfo=timezone.utc),
+        datetime(2025, 6, 21, 12, 30, 30),
+        np.datetime64("2025-06-21T12:30:30"),
+        1750509030.0,
+    ]
+    for t in turler:
+        assert abs(julian_day_of(t) - beklenen) < 1e-9
+    assert epoch_seconds("2025-06-21T12:30Z") == 1750509000.0
+    for dizi in (turler[:3], turler[3:5], np.array(turler[:3]), np.array([turler[5]] * 3), [turler[6]] * 3):
+        assert np.allclose(julian_day_array(dizi), beklenen, rtol=0.0, atol=1e-9)
+    assert julian_day_array(np.array([["2025-06-21T12:30:30Z"] * 2] * 2)).shape == (2, 2)
+
+    assert julian_day_of("2025-06-21") == julian_day_array(["2025-06-21"])[0] == 2460847.5
+
+    # Sıfırla doldurulmamış alanlar (ilk sürüm de kabul ediyordu); skaler ve dizi yolu aynı biçimleri kabul eder
+    gunes = compute_sun_gha_dec_from_iso("2025-06-21T10:30Z")
+    assert compute_sun_gha_dec_from_iso("2025-6-21T10:30Z") == gunes
+    assert compute_aries_gha_from_iso("2025-6-21t10:30") == compute_aries_gha_from_iso("2025-06-21T10:30Z")
+    bicimler = ["2025-6-21T12:30:30Z", "2025-06-21t12:30:30", "2025-06-21T12:30:30.5+00:00", " 2025-06-21 12:30Z "]
+    for dizi in ([b] for b in bicimler):
+        assert julian_day_array(dizi)[0] == julian_day_of(dizi[0])
+    assert np.allclose(julian_day_array(bicimler), [julian_day_of(b) for b in bicimler], rtol=0.0, atol=1e-9)
+    for hatali in ("2025-13-01T00:00Z", "2025-06-21T", "2025-06-21T1x:00", "21/06/2025 12:00",
+                   "2025-06", "2025-06-21T10", "2025-06-21T10:30+01:00", "20250621"):
+        for fn in (julian_day_of, lambda s: julian_day_array([s])):
+            try:
+                fn(hatali)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(hatali)
+
+    _date_jd.cache_clear()
+    julian_day_at_midnight.cache_clear()
+    for dakika in range(0, 2 * 1440, 7):
+        julian_day_of(f"2025-03-0{1 + dakika // 1440}T{dakika // 60 % 24:02d}:{dakika % 60:02d}Z")
+    assert _date_jd.cache_info().misses == julian_day_at_midnight.cache_info().misses == 2
+
+
+def test_yildiz_katalogu_toplu_gha():
+    """57 seyir yıldızı + Polaris sütunlarda; tüm yıldızların GHA'sı skaler formülle aynı olmalı"""
+    yildizlar = list_stars()
+    sutunlar = star_columns()
+    assert len(yildizlar) == 58 and sorted(sutunlar.number.tolist()) == list(range(58))
+    assert sutunlar.names[16] == "Canopus" and sutunlar.number[16] == 17 and sutunlar.sha_deg[16] == yildizlar[16].sha_deg
+    assert get_star("SIRIUS") is get_star(" sirius ") is get_star("Sirius")
+    assert get_star("Rigil Kent").name == "Rigil Kentaurus" and get_star("alnair").number == 55
+    assert get_star("Polaris").dec_deg > 89.0 and get_star("Alnilam").dec_deg < 0.0
+    assert get_star("Barnard") is None
+
+    gha_aries = np.linspace(0.0, 359.9, 50).reshape(5, 10)
+    gha, dec = star_gha_dec_batch(gha_aries)
+    assert gha.shape == (5, 10, 58) and dec.shape == (58,)
+    for i, y in enumerate(yildizlar):
+        assert abs(gha[3, 7, i] - gha_star_from_aries_sha(gha_aries[3, 7], y.sha_deg)) < 1e-12
+        assert dec[i] == y.dec_deg
+    gha, dec = star_gha_dec_batch(123.4, ["vega", 16])
+    assert gha.shape == (2,) and dec[1] == get_star("Canopus").dec_deg
+    try:
+        star_gha_dec_batch(0.0, ["Barnard"])
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("bilinmeyen yıldız")
+
+
+def test_yildiz_bulucu(capsys):
+    """Yıldız bulucu: ızgara skaler Hc/Zn ile aynı, filtreler ve azimut boşluğu doğru"""
+    res = find_stars(36.0, 25.0, "2025-06-21T18:10Z", "2025-06-21T18:50Z", step_minutes=1.0)
+    assert res.hc_deg.shape == (41, 58) and res.epoch_s[-1] - res.epoch_s[0] == 2400.0
+    for k in (0, 17, 40):
+        gha_aries = compute_aries_gha_from_iso(str(res.epoch_s[k].astype("datetime64[s]")) + "Z").gha_deg
+        for i, ad in enumerate(res.names):
+            y = get_star(ad)
+            hc, zn = compute_hc_zn(36.0, y.dec_deg, lha_from_gha_longitude(gha_star_from_aries_sha(gha_aries, y.sha_deg), 25.0))
+            assert abs(res.hc_deg[k, i] - hc) < 1e-6 and abs(res.zn_deg[k, i] - zn) < 1e-6
+        adaylar = res.candidates(k)
+        assert adaylar and all(15.0 <= a.hc_deg <= 70.0 for a in adaylar)
+        assert [a.zn_deg for a in adaylar] == sorted(a.zn_deg for a in adaylar)
+        zn = sorted(a.zn_deg for a in adaylar)
+        bosluk = max([b - a for a, b in zip(zn, zn[1:])] + [zn[0] + 360.0 - zn[-1]])
+        assert abs(res.azimuth_gap_deg()[k] - bosluk) < 1e-9
+
+    parlak = find_stars(36.0, 25.0, "2025-06-21T18:10Z", "2025-06-21T18:20Z", max_magnitude=1.0)
+    assert parlak.magnitude.max() <= 1.0 and "Sirius" in parlak.names and "Polaris" not in parlak.names
+    assert find_stars(0.0, 0.0, "2025-01-01T00:00Z", "2025-01-01T00:00Z", max_magnitude=-1.0).azimuth_gap_deg()[0] == 360.0
+
+    assert main(["star-finder", "--lat", "36", "--lon", "25", "--start", "2025-06-21T18:10Z",
+                 "--end", "2025-06-21T18:12Z", "--max-mag", "1.5"]) == 0
+    cikti = capsys.readouterr().out
+    assert cikti.count("2025-06-21T18:1") == 3 and "Arcturus" in cikti
+
+
+def test_ikili_almanak_donusturme(tmp_path):
+    """JSON almanak ikili biçime kayıpsız dönüşmeli; ardışık yıllar tek dosyada birleşebilmeli"""
+    kaynak = Path(__file__).resolve().parent / "src" / "data" / "almanac" / "sun_aries_2025_hourly.json"
+    records = json.loads(kaynak.read_text(encoding="utf-8"))["records"]
+
+    f64 = tmp_path / "f64.bin"
+    i32 = tmp_path / "i32.bin"
+    assert convert_json_to_binary([str(kaynak)], str(f64)) == 8760
+    convert_json_to_binary([str(kaynak)], str(i32), TYPE_INT32)
+    for path in (f64, i32):
+        alm = BinaryAlmanac(str(path))
+        rec = alm.record(4000)
+        assert abs(rec.gha_sun_deg - records[4000][0]) < 1e-9
+        assert abs(rec.dec_sun_deg - records[4000][1]) < 1e-9
+        assert abs(rec.gha_aries_deg - records[4000][2]) < 1e-9
+        # 2025-06-17T16:40Z -> gün 167, saat 16
+        t = datetime(2025, 6, 17, 16, 40, tzinfo=timezone.utc).timestamp()
+        assert alm.index_at(t) == 167 * 24 + 16
+
+    ikinci = json.loads(kaynak.read_text(encoding="utf-8"))
+    ikinci["header"]["start_date"] = "2026-01-01"
+    ikinci_yol = tmp_path / "2026.json"
+    ikinci_yol.write_text(json.dumps(ikinci), encoding="utf-8")
+    iki_yil = tmp_path / "iki.bin"
+    assert convert_json_to_binary([str(kaynak), str(ikinci_yol)], str(iki_yil)) == 2 * 8760
+    alm = BinaryAlmanac(str(iki_yil))
+    assert alm.covers(datetime(2026, 12, 31, 23, tzinfo=timezone.utc).timestamp())
+    assert alm.index_at(datetime(2026, 1, 1, 1, tzinfo=timezone.utc).timestamp()) == 8761
+
+
+def test_almanak_uretici_cok_yilli(tmp_path, monkeypatch):
+    """Üretici yıl aralığını parçalar halinde, süreç havuzunda ve ağ olmadan üretebilmeli"""
+    betik = Path(__file__).resolve().parent / "scripts" / "generate_sun_aries_almanac.py"
+    ortak = [sys.executable, str(betik), "--start-year", "2024", "--end-year", "2025", "--synthetic", "--workers", "2"]
+    subprocess.run(ortak + ["--out-dir", str(tmp_path)], check=True, capture_output=True)
+    subprocess.run(ortak + ["--chunk", "day", "--format", "bin", "--out", str(tmp_path / "a.bin")], check=True, capture_output=True)
+
+    yil_2024 = json.loads((tmp_path / "sun_aries_2024_hourly.json").read_text(encoding="utf-8"))
+    assert yil_2024["header"]["start_date"] == "2024-01-01" and len(yil_2024["records"]) == 366 * 24
+    assert len(json.loads((tmp_path / "sun_aries_2025_hourly.json").read_text(encoding="utf-8"))["records"]) == 8760
+
+    alm = BinaryAlmanac(str(tmp_path / "a.bin"))
+    assert alm.num_records == (366 + 365) * 24
+    ref = sun_aries_batch(alm.start_epoch_s + 3600.0 * np.arange(alm.num_records))
+    gha_sun, dec_sun, gha_aries = alm.columns(slice(None))
+    assert np.allclose(gha_sun, ref.gha_sun_deg) and np.allclose(dec_sun, ref.dec_sun_deg)
+    assert np.allclose(gha_aries, ref.gha_aries_deg)
+    assert yil_2024["records"][1000] == [round(float(x), 6) for x in alm.columns(1000)]
+
+    # Üretim yarıda kesilirse tamamlanan yıllar kalır, yarım yıl dosyası geçerli JSON gibi bırakılmaz
+    spec = importlib.util.spec_from_file_location("almanak_uretici", betik)
+    uretici = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, uretici)  # dataclass'lar modülü sys.modules'te arar
+    spec.loader.exec_module(uretici)
+    gercek = uretici.compute_chunk
+
+    def bozuk(task):
+        if task[1].first_day.year == 2025 and task[1].first_day.month == 3:
+            raise RuntimeError("efemeris okunamadı")
+        return gercek(task)
+
+    monkeypatch.setattr(uretici, "compute_chunk", bozuk)
+    hedef = tmp_path / "kesik"
+    hedef.mkdir()
+    try:
+        uretici.write_json_tables(uretici.SYNTHETIC, uretici.plan_chunks(2024, 2025), hedef, 1)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("hata yutuldu")
+    assert sorted(p.name for p in hedef.iterdir()) == ["sun_aries_2024_hourly.json"]
+    assert len(json.loads((hedef / "sun_aries_2024_hourly.json").read_text(encoding="utf-8"))["records"]) == 366 * 24
+
+
+def test_tablo_almanak_saglayici():
+    """Saatlik tablolardan enterpolasyon, 360° geçişi, LRU sınırı ve kapsam dışı seri geri dönüşü"""
+    provider = TableAlmanacProvider(cache_days=4)
+    tablo = provider.tables[0]
+    t0 = tablo.start_epoch_s + 3 * 3600
+    gha0, dec0, ari0 = (float(x) for x in tablo.columns(3))
+    assert provider.sun(t0).gha_deg == gha0 and provider.sun(t0).dec_deg == dec0
+    assert provider.aries(t0).gha_deg == ari0
+
+    # Yarım saat: seriyle (≈0.01° doğruluk) uyuşmalı, GHA 360° geçişini doğru aşmalı
+    for i in range(0, tablo.num_records - 1, 37):
+        t = tablo.start_epoch_s + i * 3600 + 1800
+        sun = provider.sun(t)
+        ref = sun_aries_batch(np.array([t]))
+        assert abs(((sun.gha_deg - ref.gha_sun_deg[0] + 180.0) % 360.0) - 180.0) < 0.02
+        assert abs(sun.dec_deg - ref.dec_sun_deg[0]) < 0.02
+        assert abs(((provider.aries(t).gha_deg - ref.gha_aries_deg[0] + 180.0) % 360.0) - 180.0) < 0.01
+    assert provider._day.cache_info().maxsize == 4
+    assert provider._day.cache_info().currsize <= 4
+
+    disari = datetime(2031, 3, 1, 6, 30, tzinfo=timezone.utc)
+    assert provider.sun(disari.timestamp()) == compute_sun_gha_dec_from_iso("2031-03-01T06:30:00Z")
+    assert provider.aries(disari.timestamp()) == compute_aries_gha_from_iso("2031-03-01T06:30:00Z")
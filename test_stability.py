@@ -4,9 +4,16 @@ Enine Stabilite Hesaplama Test ve Örnek Dosyası
 
 from stability_calculator import (
     EnineStabiliteHesaplama, YukBilgisi, TankBilgisi,
-    StabiliteRapor, meyil_momenti_hesapla
+    StabiliteRapor, meyil_momenti_hesapla, toplu_gz_egrisi,
+    KNCaprazEgrileri, kn_tablosu_yukle, HidrostatikTablo, hidrostatik_tablo_yukle,
+    delta_trim, paralel_batma_cm, fwa_cm, is_kodu_kriterleri, GZEgrisi
 )
 import math
+import os
+import tempfile
+import time
+
+import numpy as np
 
 
 def baslik(metin):
@@ -281,6 +288,262 @@ def test_gz_egri_solas():
         print(f"\n0-30° arası alan (Simpson): {alan:.3f} m.rad")
 
 
+def test_toplu_gz_egrisi():
+    """Çok durumlu (durum × açı) GZ hesabı testi"""
+    baslik("TOPLU GZ EĞRİLERİ")
+    
+    acilar = [0, 10, 20, 30, 40, 50, 60]
+    kn_degerleri = [0.0, 1.50, 3.00, 4.30, 5.20, 5.80, 6.00]
+    kg_degerleri = [6.0, 6.5, 7.0, 7.5]
+    deplasmanlar = [10000, 10000, 10200, 10400]
+    
+    sonuc = toplu_gz_egrisi(acilar, kg_degerleri, kn=kn_degerleri, deplasman=deplasmanlar)
+    
+    print("KG (m) | Max GZ (m) | Açı (°) | Alan 0-30 | Alan 0-40 | Alan 30-40")
+    print("-" * 66)
+    for i, kg in enumerate(kg_degerleri):
+        print(f"{kg:6.2f} | {sonuc.max_gz[i]:10.3f} | {sonuc.max_gz_acisi[i]:7.0f} | "
+              f"{sonuc.alan_0_30[i]:9.4f} | {sonuc.alan_0_40[i]:9.4f} | {sonuc.alan_30_40[i]:10.4f}")
+    
+    # Tek durumlu hesapla karşılaştırma
+    for i, kg in enumerate(kg_degerleri):
+        hesaplama = EnineStabiliteHesaplama(deplasmanlar[i], 8.5, kg)
+        analiz = hesaplama.gz_egri_analiz(hesaplama.gz_egri_olustur(acilar, kn_degerleri))
+        assert abs(analiz["max_gz"] - sonuc.max_gz[i]) < 1e-12
+        assert abs(analiz["alan_0_40"] - sonuc.alan_0_40[i]) < 1e-12
+    assert np.allclose(sonuc.dogrultucu_moment[1], 10000 * sonuc.gz[1])
+    print("\n✓ Toplu sonuçlar tek durumlu gz_egri_analiz ile aynı")
+    
+    # 30°/40° örnek açılara denk gelmediğinde alan enterpolasyonla tam alınır
+    seyrek = toplu_gz_egrisi([0, 25, 50], 6.5, kn=[0.0, 3.7, 5.8])
+    gz_30, gz_40 = np.interp([30, 40], seyrek.acilar, seyrek.gz[0])
+    beklenen = 0.5 * (gz_30 + gz_40) * math.radians(10)
+    print(f"Alan 30-40 (25° adım): {seyrek.alan_30_40[0]:.4f} m.rad (beklenen {beklenen:.4f})")
+    assert abs(seyrek.alan_30_40[0] - beklenen) < 1e-12
+
+
+def test_kn_capraz_egrileri():
+    """KN çapraz eğrileri tablosu: iki yönlü enterpolasyon, önbellekli yükleme, toplu GZ"""
+    baslik("KN ÇAPRAZ EĞRİLERİ")
+    
+    tablo_metni = (
+        "deplasman,0,10,20,30,40,50,60\n"
+        "8000,0.0,1.55,3.10,4.45,5.40,6.00,6.20\n"
+        "10000,0.0,1.50,3.00,4.30,5.20,5.80,6.00\n"
+        "12000,0.0,1.45,2.90,4.15,5.00,5.55,5.75\n"
+    )
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, "kn.csv")
+        with open(yol, "w", encoding="utf-8") as f:
+            f.write(tablo_metni)
+        egriler = kn_tablosu_yukle(yol)
+        assert kn_tablosu_yukle(yol) is egriler  # ikinci yükleme dosyayı tekrar okumaz
+    
+    # Metinden ya da dizilerden kurulan tablo dosyadan yüklenenle aynı
+    for kopya in (KNCaprazEgrileri.csv_metninden(tablo_metni),
+                  KNCaprazEgrileri(egriler.deplasmanlar, egriler.acilar, egriler.kn_tablosu)):
+        assert np.array_equal(kopya.kn_tablosu, egriler.kn_tablosu)
+        assert kopya.kn(9000, 25) == egriler.kn(9000, 25)
+    
+    print(f"Tablo: {egriler.deplasmanlar.size} deplasman × {egriler.acilar.size} açı")
+    kn = egriler.kn(9000, 25)
+    beklenen = (3.10 + 4.45 + 3.00 + 4.30) / 4
+    print(f"KN(Δ=9000 t, φ=25°) = {kn:.4f} m (beklenen {beklenen:.4f} m)")
+    assert abs(kn - beklenen) < 1e-12
+    assert abs(egriler.kn(10000, 30) - 4.30) < 1e-12
+    
+    # Çok sayıda yükleme durumu için tek vektörel sorgu
+    deplasmanlar = np.linspace(8000, 12000, 500)
+    kg_degerleri = np.linspace(6.0, 7.5, 500)
+    sonuc = egriler.gz_egrisi(deplasmanlar, kg_degerleri, acilar=np.arange(0, 61, 5))
+    print(f"{deplasmanlar.size} durum × {sonuc.acilar.size} açı GZ matrisi: {sonuc.gz.shape}")
+    
+    hesaplama = EnineStabiliteHesaplama(10000, 8.5, 6.5)
+    tek = egriler.gz_egrisi(10000, 6.5)
+    for aci, gz in zip(tek.acilar, tek.gz[0]):
+        assert abs(gz - hesaplama.kn_den_gz_hesapla(egriler.kn(10000, aci), aci)) < 1e-12
+    
+    try:
+        egriler.kn(15000, 10)
+    except ValueError as e:
+        print(f"Tablo dışı deplasman: {e}")
+    else:
+        raise AssertionError("Tablo dışı deplasman kabul edildi")
+
+
+def test_hidrostatik_tablo():
+    """Hidrostatik tablo: draft ↔ deplasman, KM/TPC/MCT sorguları ve toplu durum hesabı"""
+    baslik("HİDROSTATİK TABLO")
+    
+    tablo_metni = (
+        "draft,deplasman,km,kb,tpc,mct,lcf,lcb\n"
+        "# örnek kuru yük gemisi\n"
+        "4.0,7380,9.80,2.10,24.1,150,-1.00,1.50\n"
+        "5.0,9350,9.20,2.62,24.6,160,-1.30,1.40\n"
+        "6.0,11370,8.90,3.14,25.1,171,-1.70,1.20\n"
+        "7.0,13440,8.75,3.66,25.6,182,-2.00,1.00\n"
+        "8.0,15560,8.70,4.18,26.1,194,-2.20,0.80\n"
+    )
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, "hidrostatik.csv")
+        with open(yol, "w", encoding="utf-8") as f:
+            f.write(tablo_metni)
+        tablo = hidrostatik_tablo_yukle(yol)
+        assert hidrostatik_tablo_yukle(yol) is tablo  # ikinci yükleme dosyayı tekrar okumaz
+    
+    # Sütun sözlüğünden kurulan tablo aynı sonuçları verir; sütun adları büyük/küçük harf duyarsız
+    kopya = HidrostatikTablo({ad.upper(): v for ad, v in tablo.tablo.items()})
+    assert kopya.sutunlar == tablo.sutunlar
+    assert float(kopya.draft_ile(6.5)["km"]) == float(tablo.draft_ile(6.5)["km"])
+    try:
+        HidrostatikTablo({"draft": [4.0, 5.0], "km": [9.8, 9.2]})
+    except ValueError as e:
+        print(f"Eksik sütun: {e}")
+    else:
+        raise AssertionError("Deplasman sütunu olmayan tablo kabul edildi")
+    
+    degerler = tablo.draft_ile(6.5)
+    print("Draft 6.50 m için:")
+    for ad in ("deplasman", "km", "tpc", "mct", "lcf", "lcb"):
+        print(f"  {ad.upper():9}: {float(degerler[ad]):10.3f}")
+    
+    # Tablo noktaları aynen, ara değerler monoton (KM minimumun altına inmez)
+    assert np.allclose(tablo.draft_ile([4.0, 6.0, 8.0])["deplasman"], [7380, 11370, 15560])
+    sik = tablo.draft_ile(np.linspace(4.0, 8.0, 2001))
+    assert np.all(np.diff(sik["deplasman"]) > 0) and sik["km"].min() >= 8.70 - 1e-9
+    
+    draft = tablo.deplasmandan_draft(12000.0)
+    print(f"\nΔ = 12000 t → draft {float(draft):.3f} m → Δ {float(tablo.drafttan_deplasman(draft)):.1f} t")
+    assert abs(tablo.drafttan_deplasman(draft) - 12000.0) < 1.0
+    
+    # Tek durum: tablodan KM ile stabilite ve trim fonksiyonları
+    hesaplama = tablo.stabilite(12000.0, 7.2)
+    km = float(tablo.deplasman_ile(12000.0)["km"])
+    tpc = float(tablo.deplasman_ile(12000.0)["tpc"])
+    mct = float(tablo.deplasman_ile(12000.0)["mct"])
+    print(f"KM = {km:.3f} m, GM = {hesaplama.gm:.3f} m")
+    assert abs(float(tablo.gm(12000.0, 7.2)) - hesaplama.gm) < 1e-12
+    assert abs(float(tablo.paralel_batma_cm(12000.0, 250.0)) - paralel_batma_cm(250.0, tpc)) < 1e-12
+    assert abs(float(tablo.trim_degisimi_cm(12000.0, 3400.0)) - delta_trim(3400.0, mct)) < 1e-12
+    assert abs(float(tablo.fwa_cm(12000.0)) - fwa_cm(12000.0, tpc)) < 1e-12
+    
+    # Çok sayıda yükleme durumu
+    n = 100000
+    deplasmanlar = np.linspace(7500, 15500, n)
+    kg_degerleri = np.linspace(6.5, 8.0, n)
+    t0 = time.perf_counter()
+    gm = tablo.gm(deplasmanlar, kg_degerleri)
+    batma = tablo.paralel_batma_cm(deplasmanlar, 250.0)
+    sure = time.perf_counter() - t0
+    print(f"\n{n} durum için GM ve paralel batma: {sure * 1e3:.1f} ms ({n / sure:,.0f} durum/s)")
+    assert gm.shape == batma.shape == (n,)
+    
+    try:
+        tablo.deplasmandan_draft(20000.0)
+    except ValueError as e:
+        print(f"Tablo dışı deplasman: {e}")
+    else:
+        raise AssertionError("Tablo dışı deplasman kabul edildi")
+
+
+def test_is_kodu_kriterleri():
+    """Toplu IS Code kriterleri: aralık uçlarında tam alan, su alma açısı, paylar"""
+    baslik("IS CODE KRİTERLERİ (TOPLU)")
+    
+    # 25° adımlı eğri: 30° ve 40° örnek açılara denk gelmez
+    acilar = [0, 25, 50, 75]
+    sonuc = toplu_gz_egrisi(acilar, [6.0, 6.5, 7.0, 7.5], kn=[0.0, 3.7, 5.8, 6.2])
+    kriterler = sonuc.kriterler(gm=[2.5, 2.0, 1.5, 1.0], su_alma_acisi=[60, 60, 35, 35])
+    
+    print("Kriter       | " + " | ".join(f"KG {kg:.1f}" for kg in [6.0, 6.5, 7.0, 7.5]))
+    print("-" * 50)
+    for k, ad in enumerate(kriterler.kriterler):
+        hucreler = " | ".join(f"{'✓' if g else '✗'}{p:+6.3f}" for g, p in zip(kriterler.gecti[:, k], kriterler.pay[:, k]))
+        print(f"{ad:12} | {hucreler}")
+    print("Uygun:", kriterler.uygun.tolist())
+    
+    # Sık örneklenmiş aynı (doğrusal parçalı) eğri ile aynı alanlar
+    sik_acilar = np.arange(0, 76, 1.0)
+    sik_gz = np.array([np.interp(sik_acilar, sonuc.acilar, satir) for satir in sonuc.gz])
+    sik = is_kodu_kriterleri(sik_acilar, sik_gz, gm=[2.5, 2.0, 1.5, 1.0], su_alma_acisi=[60, 60, 35, 35])
+    assert np.allclose(kriterler.degerler[:, :4], sik.degerler[:, :4])
+    
+    # Su alma açısı 35°: 0-40° ve 30-40° alanları 35°'de biter
+    genis = is_kodu_kriterleri(sonuc.acilar, sonuc.gz[2:3])
+    assert kriterler.degerler[2, 2] < genis.degerler[0, 2]
+    
+    # Tek eğrili kontrol artık 30-40° alanını kesmiyor
+    hesaplama = EnineStabiliteHesaplama(10000, 8.5, 6.5)
+    solas = hesaplama.solas_kriterleri_kontrol(hesaplama.gz_egri_olustur(acilar, [0.0, 3.7, 5.8, 6.2]))
+    assert solas["Alan 30-40°"] == bool(kriterler.gecti[1, 2])
+    
+    # 10.000 durum
+    n = 10000
+    tum_acilar = np.arange(0, 91, 1.0)
+    olcek = np.linspace(0.05, 1.5, n)[:, None]
+    gz = olcek * np.sin(np.radians(2 * tum_acilar))
+    t0 = time.perf_counter()
+    toplu = is_kodu_kriterleri(tum_acilar, gz, gm=2 * olcek[:, 0], su_alma_acisi=45.0)
+    sure = time.perf_counter() - t0
+    print(f"\n{n} durum × {tum_acilar.size} açı: {sure * 1e3:.1f} ms, uygun {int(toplu.uygun.sum())} durum")
+    assert sure < 1.0
+
+
+def test_gz_egrisi_nesnesi():
+    """Kümülatif alanlı GZ eğrisi: keyfi aralık alanı, önbellekli max GZ / AVS, eğri toplulukları"""
+    baslik("GZ EĞRİSİ NESNESİ (KÜMÜLATİF ALAN)")
+    
+    hesaplama = EnineStabiliteHesaplama(10000, 8.5, 6.5)
+    acilar = [0, 10, 20, 30, 40, 50, 60, 70, 80]
+    kn_degerleri = [0.0, 1.50, 3.00, 4.30, 5.20, 5.80, 6.00, 6.00, 5.90]
+    gz_egri = hesaplama.gz_egri_olustur(acilar, kn_degerleri)
+    egri = GZEgrisi.listeden(gz_egri)
+    
+    print(f"Max GZ: {egri.max_gz:.3f} m ({egri.max_gz_acisi:.0f}°), AVS: {egri.avs:.2f}°")
+    for a, b in [(0, 30), (12.5, 37.5), (30, 40), (25, 65)]:
+        print(f"  Alan {a:>4}°–{b:>4}°: {egri.alan(a, b):.4f} m.rad")
+    
+    # Aralık alanları toplanabilir ve sık örneklenmiş yamuk alanıyla aynıdır
+    assert abs(egri.alan(0, 25) + egri.alan(25, 65) - egri.alan(0, 65)) < 1e-12
+    sik_acilar = np.linspace(12.5, 37.5, 2501)
+    sik_gz = np.interp(sik_acilar, egri.acilar, egri.gz[0])
+    yamuk = float(np.sum(0.5 * (sik_gz[1:] + sik_gz[:-1]) * np.radians(np.diff(sik_acilar))))
+    assert abs(egri.alan(12.5, 37.5) - yamuk) < 1e-9
+    assert abs(hesaplama.avs_hesapla(gz_egri) - egri.avs) < 1e-12
+    assert egri.max_gz == hesaplama.gz_egri_analiz(gz_egri)["max_gz"]
+    
+    # Eğri topluluğu: satır başına sonuçlar, her satır tek eğriyle aynı
+    kg_degerleri = np.array([6.0, 6.5, 7.0, 7.5])
+    toplu = toplu_gz_egrisi(acilar, kg_degerleri, kn=kn_degerleri).egri
+    alanlar = toplu.alan(0, np.array([30, 35, 40, 45]))
+    for i, kg in enumerate(kg_degerleri):
+        tek = GZEgrisi.listeden(EnineStabiliteHesaplama(10000, 8.5, kg).gz_egri_olustur(acilar, kn_degerleri))
+        assert abs(alanlar[i] - tek.alan(0, 30 + 5 * i)) < 1e-12
+        assert abs(toplu[i].avs - tek.avs) < 1e-12
+    print("\nAVS (KG 6.0–7.5):", ", ".join(f"{a:.2f}°" for a in toplu.avs))
+    
+    # İndeksleme ve yineleme: negatif indeks, aralık dışında IndexError, list() sonlanır
+    assert len(list(toplu)) == len(toplu) == 4
+    assert [e.max_gz for e in toplu] == list(toplu.max_gz)
+    assert toplu[-1].max_gz == toplu[3].max_gz
+    for i in (4, -5):
+        try:
+            toplu[i]
+        except IndexError:
+            pass
+        else:
+            raise AssertionError(f"toplu[{i}] IndexError vermedi")
+    
+    # Çok sayıda aralık sorgusu
+    n = 100000
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    alan = egri.alan(rng.uniform(0, 40, n), rng.uniform(40, 80, n))
+    sure = time.perf_counter() - t0
+    print(f"{n} aralık sorgusu: {sure * 1e3:.1f} ms")
+    assert np.all(alan > 0)
+
+
 def test_kritik_gm_havuz():
     """Havuzda kritik GM hesabı"""
     baslik("HAVUZDA KRİTİK GM HESABI")
@@ -357,6 +620,11 @@ def main():
     test_serbest_yuzey()
     test_yalpa_periyodu()
     test_gz_egri_solas()
+    test_toplu_gz_egrisi()
+    test_kn_capraz_egrileri()
+    test_hidrostatik_tablo()
+    test_is_kodu_kriterleri()
+    test_gz_egrisi_nesnesi()
     test_kritik_gm_havuz()
     test_rapor_olusturma()
     